@@ -0,0 +1,71 @@
+"""Compare per-symbol and batched indicator computation across a synthetic universe.
+
+Run with ``python -m benchmarks.bench_batch`` from the repository root.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import numpy as np
+
+from hyperliquid.batch import batch_indicators
+from hyperliquid.candles import PRICE_COLUMNS, CandleArrays
+from hyperliquid.signals import (
+    calculate_confidence,
+    calculate_confidences,
+    classify_direction,
+    classify_directions,
+    compute_indicators,
+)
+
+BARS = 250
+
+
+def synthetic_universe(symbols: int, bars: int = BARS, seed: int = 7) -> CandleArrays:
+    """Return ``(symbols, bars)`` random-walk high/low/close matrices packed as arrays."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (symbols, bars)), axis=1))
+    spread = close * np.abs(rng.normal(0, 0.004, (symbols, bars)))
+    time = np.arange(bars, dtype=np.int64)
+    return CandleArrays(time, close, close + spread, close - spread, close, np.ones_like(close))
+
+
+def per_symbol(universe: CandleArrays) -> list:
+    results = []
+    for index in range(len(universe.close)):
+        row = CandleArrays(universe.time, *(universe[name][index] for name in PRICE_COLUMNS))
+        indicators = compute_indicators(row)
+        direction = classify_direction(indicators)
+        results.append((indicators, direction, calculate_confidence(indicators, direction)))
+    return results
+
+
+def batched(universe: CandleArrays):
+    table = batch_indicators(universe.high, universe.low, universe.close)
+    directions = classify_directions(table)
+    return table, directions, calculate_confidences(table, directions)
+
+
+def _best_of(func, repeat: int = 5, number: int = 5) -> float:
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    print(f"{'symbols':>8} {'per symbol':>12} {'batched':>10}")
+    for symbols in (50, 150, 500):
+        universe = synthetic_universe(symbols)
+        expected = per_symbol(universe)
+        table, directions, confidences = batched(universe)
+        for index, (indicators, direction, confidence) in enumerate(expected):
+            row = table.row(str(index))
+            assert all(np.isclose(row[name], value, rtol=1e-9) for name, value in indicators.items())
+            assert directions[index] == direction and confidences[index] == confidence
+
+        single = _best_of(lambda: per_symbol(universe), number=1)
+        batch = _best_of(lambda: batched(universe))
+        print(f"{symbols:>8} {single * 1e3:>9.1f} ms {batch * 1e3:>7.1f} ms   ({single / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
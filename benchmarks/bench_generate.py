@@ -0,0 +1,117 @@
+"""Record upstream responses once, then benchmark signal generation against them offline.
+
+Record a cassette from mainnet (or ``--api-url``)::
+
+    python -m benchmarks.bench_generate record fixtures/btc_eth.json.gz --symbols BTC ETH
+
+Replay it with 50 ms of injected upstream latency::
+
+    python -m benchmarks.bench_generate replay fixtures/btc_eth.json.gz --latency-ms 50
+
+The replay reports per-signal latency percentiles and throughput for the synchronous
+``SignalGenerator`` (one request at a time) and the ``AsyncSignalGenerator`` (every
+symbol/timeframe pair of a round gathered concurrently).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+from hyperliquid import AsyncSignalGenerator, HyperliquidDataClient, SignalGenerator, build_async_client
+from hyperliquid.cassette import Cassette, RecordingInfo, ReplayInfo, ReplayTransport, jittered_latency
+
+DEFAULT_SYMBOLS = ["BTC", "ETH"]
+DEFAULT_TIMEFRAMES = ["1d", "4h", "1h", "15m"]
+
+
+def record(path: str, symbols: Sequence[str], timeframes: Sequence[str], api_url: str | None) -> None:
+    cassette = Cassette()
+    generator = SignalGenerator(HyperliquidDataClient(RecordingInfo(cassette, api_url)))
+    for symbol in symbols:
+        for timeframe in timeframes:
+            generator.generate(symbol, timeframe)
+    cassette.save(path)
+    print(f"recorded {len(cassette)} responses to {path}")
+
+
+def _report(label: str, latencies: List[float], elapsed: float) -> None:
+    values = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    print(
+        f"{label:<6} n={len(values):<5} p50={p50:7.1f} ms  p95={p95:7.1f} ms  p99={p99:7.1f} ms"
+        f"  {len(values) / elapsed:8.1f} signals/s"
+    )
+
+
+def _timed(func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def replay_sync(cassette: Cassette, pairs: List[Tuple[str, str]], rounds: int, latency) -> None:
+    generator = SignalGenerator(HyperliquidDataClient(ReplayInfo(cassette, latency)))
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for symbol, timeframe in pairs:
+            latencies.append(_timed(lambda: generator.generate(symbol, timeframe)))
+    _report("sync", latencies, time.perf_counter() - started)
+
+
+async def replay_async(cassette: Cassette, pairs: List[Tuple[str, str]], rounds: int, latency) -> None:
+    client = build_async_client(rate_limit=None, transport=ReplayTransport(cassette, latency))
+    generator = AsyncSignalGenerator(client)
+
+    async def one(symbol: str, timeframe: str) -> float:
+        started = time.perf_counter()
+        await generator.generate(symbol, timeframe)
+        return time.perf_counter() - started
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    async with client:
+        for _ in range(rounds):
+            latencies.extend(await asyncio.gather(*(one(symbol, timeframe) for symbol, timeframe in pairs)))
+    _report("async", latencies, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="capture upstream responses to a cassette")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--symbols", nargs="+", default=DEFAULT_SYMBOLS)
+    record_parser.add_argument("--timeframes", nargs="+", default=DEFAULT_TIMEFRAMES)
+    record_parser.add_argument("--api-url", default=None)
+
+    replay_parser = commands.add_parser("replay", help="benchmark generation against a cassette")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument("--symbols", nargs="+", default=DEFAULT_SYMBOLS)
+    replay_parser.add_argument("--timeframes", nargs="+", default=DEFAULT_TIMEFRAMES)
+    replay_parser.add_argument("--rounds", type=int, default=20)
+    replay_parser.add_argument("--latency-ms", type=float, default=0.0)
+    replay_parser.add_argument("--jitter", type=float, default=0.0, help="log-normal sigma of the latency")
+    replay_parser.add_argument("--seed", type=int, default=7)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.path, args.symbols, args.timeframes, args.api_url)
+        return
+
+    cassette = Cassette.load(args.path)
+    pairs = [(symbol, timeframe) for symbol in args.symbols for timeframe in args.timeframes]
+    replay_sync(cassette, pairs, args.rounds, jittered_latency(args.latency_ms / 1000, args.jitter, args.seed))
+    asyncio.run(
+        replay_async(cassette, pairs, args.rounds, jittered_latency(args.latency_ms / 1000, args.jitter, args.seed))
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare candle payload parsing paths on synthetic snapshot payloads.
+
+Run with ``python -m benchmarks.bench_normalize`` from the repository root.
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from typing import Iterable, List
+
+import pandas as pd
+
+from hyperliquid.candles import parse_candles
+from hyperliquid.data import _normalize_candles
+
+PERIOD_MS = 15 * 60_000
+
+
+def synthetic_payload(bars: int, seed: int = 7) -> List[dict]:
+    """Return ``bars`` candle records shaped like a ``candleSnapshot`` response."""
+    rng = random.Random(seed)
+    price = 60_000.0
+    start = 1_700_000_000_000 - 1_700_000_000_000 % PERIOD_MS
+    records = []
+    for index in range(bars):
+        open_price = price
+        close_price = open_price * (1 + rng.gauss(0, 0.002))
+        high = max(open_price, close_price) * (1 + abs(rng.gauss(0, 0.001)))
+        low = min(open_price, close_price) * (1 - abs(rng.gauss(0, 0.001)))
+        t = start + index * PERIOD_MS
+        records.append(
+            {
+                "t": t,
+                "T": t + PERIOD_MS - 1,
+                "s": "BTC",
+                "i": "15m",
+                "o": f"{open_price:.1f}",
+                "c": f"{close_price:.1f}",
+                "h": f"{high:.1f}",
+                "l": f"{low:.1f}",
+                "v": f"{rng.uniform(10, 500):.5f}",
+                "n": rng.randint(100, 2000),
+            }
+        )
+        price = close_price
+    return records
+
+
+def legacy_normalize(raw: Iterable[dict]) -> pd.DataFrame:
+    """The original list-of-dicts DataFrame implementation, kept as the baseline."""
+    records = list(raw)
+    if not records:
+        return pd.DataFrame()
+
+    frame = pd.DataFrame(records)
+    frame["time"] = pd.to_datetime(frame["t"], unit="ms", utc=True)
+    frame = frame.set_index("time").sort_index()
+
+    for column in ("o", "h", "l", "c", "v"):
+        frame[column] = frame[column].astype(float)
+
+    frame = frame.rename(columns={"o": "open", "h": "high", "l": "low", "c": "close", "v": "volume"})
+    return frame[["open", "high", "low", "close", "volume"]]
+
+
+def _best_of(func, repeat: int = 5, number: int = 50) -> float:
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    print(f"{'bars':>6} {'legacy DataFrame':>18} {'fast DataFrame':>16} {'arrays only':>13}")
+    for bars in (250, 5000):
+        payload = synthetic_payload(bars)
+        expected = legacy_normalize(payload)
+        pd.testing.assert_frame_equal(_normalize_candles(payload), expected)
+
+        legacy = _best_of(lambda: legacy_normalize(payload))
+        fast_frame = _best_of(lambda: _normalize_candles(payload))
+        arrays = _best_of(lambda: parse_candles(payload))
+        print(
+            f"{bars:>6} {legacy * 1e6:>15.1f} us {fast_frame * 1e6:>13.1f} us {arrays * 1e6:>10.1f} us"
+            f"   ({legacy / fast_frame:.1f}x / {legacy / arrays:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Per-hit cost of serving cached signals: re-encoded dicts versus pre-encoded JSON.
+
+Run with ``python -m benchmarks.bench_payload`` from the repository root.
+
+``dict`` is what a cache hit cost when the cache held ``to_dict()`` results: FastAPI
+passes the response through ``jsonable_encoder`` and ``json.dumps`` on every request.
+``bytes`` is the current path: the cache holds ``SignalPayload.to_json()`` and a hit
+only joins the stored bytes into the response body.
+"""
+
+from __future__ import annotations
+
+import timeit
+from dataclasses import replace
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from benchmarks.bench_backtest import synthetic_history
+from hyperliquid.signals import build_signal, dumps
+
+TIMEFRAMES = ["1d", "4h", "1h", "15m"]
+
+
+def _best_of(func, repeat: int = 5, number: int = 200) -> float:
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    higher = synthetic_history(120, 99)
+    payloads = [
+        build_signal("BTC", timeframe, synthetic_history(250, seed), higher) for seed, timeframe in enumerate(TIMEFRAMES)
+    ]
+    cached_dicts = [payload.to_dict() for payload in payloads]
+    cached_bytes = [payload.to_json() for payload in payloads]
+
+    def serve_dicts() -> bytes:
+        body = {"symbol": "BTC", "timeframes": TIMEFRAMES, "signals": cached_dicts}
+        return JSONResponse(jsonable_encoder(body)).body
+
+    def serve_bytes() -> bytes:
+        signals = b"[" + b",".join(cached_bytes) + b"]"
+        return b'{"symbol":"BTC","timeframes":' + dumps(TIMEFRAMES) + b',"signals":' + signals + b"}"
+
+    before, after = _best_of(serve_dicts), _best_of(serve_bytes, number=2000)
+    print(f"response with {len(payloads)} cached signals ({len(serve_bytes())} bytes)")
+    print(f"  dict cache:  {before * 1e6:8.1f} us per hit")
+    print(f"  bytes cache: {after * 1e6:8.1f} us per hit  ({before / after:.0f}x)")
+    # ``replace`` copies the payload without its cached text and JSON.
+    first = _best_of(lambda: replace(payloads[0]).to_json())
+    print(f"  first encode of one payload (format + to_json): {first * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
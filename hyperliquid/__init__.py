@@ -18,12 +18,16 @@ if _sdk_dist is not None:
         if _sdk_path_str not in __path__:
             __path__.insert(0, _sdk_path_str)
 
+from .async_data import AsyncHyperliquidDataClient, build_async_client
 from .data import HyperliquidDataClient, build_default_client
-from .signals import SignalGenerator, SignalPayload
+from .signals import AsyncSignalGenerator, SignalGenerator, SignalPayload
 
 __all__ = [
+    "AsyncHyperliquidDataClient",
+    "AsyncSignalGenerator",
     "HyperliquidDataClient",
     "SignalGenerator",
     "SignalPayload",
+    "build_async_client",
     "build_default_client",
 ]
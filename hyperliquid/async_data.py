@@ -0,0 +1,270 @@
+"""Asyncio data client talking to the Hyperliquid ``/info`` endpoint over pooled HTTP."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import httpx
+except ImportError as exc:  # pragma: no cover
+    raise ImportError("httpx is required for the async client. Install it with 'pip install httpx'.") from exc
+
+from hyperliquid.utils import constants  # type: ignore[import]
+from hyperliquid.utils.error import ClientError, ServerError  # type: ignore[import]
+
+from .candles import CandleArrays, parse_candles
+from .data import (
+    MAX_CANDLES_PER_REQUEST,
+    CandleRequest,
+    _CandleSource,
+    _empty_message,
+    _should_retry_rate_limited,
+)
+from .flight import AsyncCandleFlight, FlightStats
+from .hedge import AsyncHedger, HedgePolicy, HedgeStats
+from .live import LiveCandleFeed
+from .ratelimit import (
+    DEFAULT_WEIGHT_PER_MINUTE,
+    AsyncRateLimiter,
+    candle_snapshot_weight,
+    info_request_weight,
+)
+from .store import CandleStore
+from .timeframes import get_timeframe
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncHyperliquidDataClient(_CandleSource):
+    """Coroutine counterpart of :class:`HyperliquidDataClient`.
+
+    Requests are ``candleSnapshot`` POSTs issued through one shared ``httpx.AsyncClient``
+    whose keep-alive pool is sized by ``max_connections``, so hundreds of fetches can be
+    in flight from a single event loop. Pass ``transport`` to point the client at an
+    in-process stand-in server. The store, resampling, rate-limit and live-feed options
+    behave exactly as on the synchronous client. ``hedge`` enables hedged
+    ``candleSnapshot`` requests (see :mod:`hyperliquid.hedge`).
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        *,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+        store: Optional[CandleStore] = None,
+        resample_from: Optional[str | Sequence[str]] = None,
+        resample_window: int = MAX_CANDLES_PER_REQUEST,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        live: Optional[LiveCandleFeed] = None,
+        hedge: Optional[HedgePolicy] = None,
+    ) -> None:
+        super().__init__(store=store, resample_from=resample_from, resample_window=resample_window, live=live)
+        self._limiter = rate_limiter
+        self._hedger = AsyncHedger(hedge) if hedge is not None else None
+        self._base_url = (base_url or constants.MAINNET_API_URL).rstrip("/")
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=timeout,
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+        self._stream_locks: Dict[Tuple[str, ...], asyncio.Lock] = {}
+        self._flight = AsyncCandleFlight()
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @property
+    def rate_limiter(self) -> Optional[AsyncRateLimiter]:
+        return self._limiter
+
+    def flight_stats(self) -> FlightStats:
+        """Return counters for requests served by an already in-flight fetch."""
+        return self._flight.stats()
+
+    def hedge_stats(self) -> Optional[HedgeStats]:
+        """Return hedging counters, or ``None`` when hedging is disabled."""
+        return self._hedger.stats() if self._hedger is not None else None
+
+    async def __aenter__(self) -> "AsyncHyperliquidDataClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def post_info(self, payload: Dict[str, Any], weight: Optional[int] = None) -> Any:
+        """POST ``payload`` to ``/info`` and return the decoded JSON body.
+
+        With a rate limiter configured the call first waits for ``weight`` (defaulting to
+        the request type's base weight) and retries after a 429.
+        """
+        if weight is None:
+            weight = info_request_weight(payload["type"])
+        attempt = 0
+        while True:
+            if self._limiter is not None:
+                await self._limiter.acquire(weight)
+            response = await self._http.post("/info", json=payload)
+            try:
+                _raise_for_status(response)
+            except ClientError as exc:
+                if not _should_retry_rate_limited(exc, self._limiter, attempt):
+                    raise
+                self._limiter.penalize()
+                attempt += 1
+                continue
+            return response.json()
+
+    async def candles_snapshot(self, name: str, interval: str, startTime: int, endTime: int) -> List[dict]:
+        """Async equivalent of ``Info.candles_snapshot``."""
+        req = {"coin": name, "interval": interval, "startTime": startTime, "endTime": endTime}
+        period_ms = get_timeframe(interval).period_ms
+        weight = candle_snapshot_weight(startTime, endTime, period_ms, MAX_CANDLES_PER_REQUEST)
+        payload = {"type": "candleSnapshot", "req": req}
+        if self._hedger is None:
+            return await self.post_info(payload, weight=weight)
+        return await self._hedger.run(lambda: self.post_info(payload, weight=weight), lambda: self._can_hedge(weight))
+
+    def _can_hedge(self, weight: int) -> bool:
+        """Only hedge while the rate-limit bucket keeps its reserve after paying ``weight``."""
+        if self._limiter is None or self._hedger is None:
+            return True
+        snapshot = self._limiter.snapshot()
+        reserve = snapshot.capacity * self._hedger.policy.budget_floor
+        return snapshot.queue_depth == 0 and snapshot.available - weight >= reserve
+
+    async def fetch_candles(self, request: CandleRequest) -> pd.DataFrame:
+        """Fetch OHLCV candles and return them as a pandas DataFrame."""
+        return (await self.fetch_arrays(request)).to_frame()
+
+    async def fetch_arrays(self, request: CandleRequest) -> CandleArrays:
+        """Fetch OHLCV candles as ``CandleArrays``."""
+        interval = request.interval()
+        end_ts = int(request.end_time().timestamp() * 1000)
+        start_ts = int(request.start_time().timestamp() * 1000)
+        candles = self._live_window(request, start_ts, end_ts)
+        if candles is None:
+            candles = await self._load(request.symbol, interval, start_ts, end_ts)
+        if candles.empty:
+            raise RuntimeError(_empty_message(request))
+        return candles
+
+    async def _load(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        base = self._resample_base(interval, start_ts, end_ts)
+        if base is None:
+            return await self._fetch_range(symbol, interval, start_ts, end_ts)
+        candles = await self._fetch_range(symbol, base, *self._base_window(interval, start_ts, end_ts))
+        return self._derive(candles, base, interval, start_ts, end_ts)
+
+    def _stream_lock(self, key: Tuple[str, ...]) -> asyncio.Lock:
+        lock = self._stream_locks.get(key)
+        if lock is None:
+            lock = self._stream_locks[key] = asyncio.Lock()
+        return lock
+
+    async def _fetch_range(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        if not self._resample_bases:
+            return await self._fetch_upstream(symbol, interval, start_ts, end_ts)
+        key = (symbol, interval)
+        async with self._stream_lock(key):
+            candles = self._recent_lookup(key, start_ts, end_ts)
+            if candles is None:
+                gap = self._recent_gap(key, start_ts, end_ts)
+                if gap is not None:
+                    head = await self._fetch_upstream(symbol, interval, *gap)
+                    return self._recent_prepend(key, start_ts, end_ts, head)
+                candles = await self._fetch_upstream(symbol, interval, start_ts, end_ts)
+                self._recent_save(key, start_ts, end_ts, candles)
+            return candles
+
+    async def _fetch_upstream(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        """Fetch through the singleflight so concurrent identical requests share one call."""
+        timeframe = get_timeframe(interval)
+        return await self._flight.run(
+            symbol,
+            interval,
+            start_ts,
+            end_ts,
+            timeframe.period_ms,
+            lambda start, end: self._fetch_window(symbol, interval, start, end),
+            offset_ms=timeframe.offset_ms,
+        )
+
+    async def _fetch_window(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        if self._store is None:
+            return parse_candles(await self.candles_snapshot(symbol, interval, start_ts, end_ts))
+        # Store access is local and short, so it runs inline; only the upstream call awaits.
+        async with self._stream_lock(("store", symbol, interval)):
+            cached, window = self._plan_incremental(symbol, interval, start_ts, end_ts)
+            fetched = None
+            if window is not None:
+                fetched = parse_candles(await self.candles_snapshot(symbol, interval, window[0], window[1]))
+            return self._commit_incremental(symbol, interval, start_ts, end_ts, cached, fetched)
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    """Mirror the SDK's error mapping so both clients raise the same exception types."""
+    status_code = response.status_code
+    if status_code < 400:
+        return
+    if status_code < 500:
+        try:
+            err = response.json()
+        except ValueError:
+            err = None
+        if not isinstance(err, dict):
+            raise ClientError(status_code, None, response.text, None, response.headers)
+        raise ClientError(status_code, err.get("code"), err.get("msg"), response.headers, err.get("data"))
+    raise ServerError(status_code, response.text)
+
+
+def build_async_client(
+    base_url: Optional[str] = None,
+    store_dir: Optional[str] = None,
+    resample_from: Optional[str | Sequence[str]] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    rate_limit: Optional[float] = DEFAULT_WEIGHT_PER_MINUTE,
+    live: Optional[LiveCandleFeed] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    hedge: Optional[HedgePolicy] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+) -> AsyncHyperliquidDataClient:
+    """Async counterpart of :func:`build_default_client`.
+
+    A ``live`` feed is attached as-is; subscribe and seed it with ``start_live_async``
+    once the event loop is running. ``transport`` replaces the network transport, e.g.
+    with a ``ReplayTransport`` for offline benchmarks. ``hedge`` enables hedged
+    ``candleSnapshot`` requests with the given policy. ``rate_limiter`` shares an existing
+    limiter, e.g. among clients of one upstream host, instead of building one from
+    ``rate_limit``.
+    """
+    store = CandleStore(store_dir) if store_dir is not None else None
+    limiter = rate_limiter or (AsyncRateLimiter(rate_limit) if rate_limit else None)
+    return AsyncHyperliquidDataClient(
+        base_url,
+        transport=transport,
+        max_connections=max_connections,
+        store=store,
+        resample_from=resample_from,
+        rate_limiter=limiter,
+        live=live,
+        hedge=hedge,
+    )
@@ -0,0 +1,265 @@
+"""Vectorized backtest of the signal rules over full candle histories.
+
+:func:`simulate` scores every historical bar with the same rules the live generator
+applies to the latest one (:func:`~hyperliquid.signals.classify_direction`,
+:func:`~hyperliquid.signals.calculate_confidence` and the ATR levels of
+:func:`~hyperliquid.signals.build_trade_levels`) and then resolves every signal at once.
+
+Trade model, per signal on bar ``i`` and a horizon of ``H`` bars:
+
+* the order fills at the far edge of the entry zone (``close + buffer`` for longs,
+  ``close - buffer`` for shorts) on the first of bars ``i + 1 .. i + H`` that trades
+  there;
+* from the fill bar on, a third of the position exits at each target, and the rest at
+  the stop. A stop hit on the same bar as a target counts first (bar data cannot tell
+  them apart);
+* anything still open after bar ``i + H`` exits at that bar's close.
+
+Results are in R, the risk from fill to stop. Every bar can carry a signal, so trades
+overlap; the drawdown is over the running sum of per-trade R in signal order, as if
+each signal risked one fixed unit.
+
+"First bar at or after ``start`` that reaches ``level``" is answered for every signal
+together by binary lifting over a sparse table of range maxima, so resolving ``n``
+signals costs ``O(n log H)`` vectorized work instead of an ``n x H`` window scan.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+import numpy as np
+
+from .candles import column
+from .indicators import INDICATORS
+from .signals import DEFAULT_PARAMS, Candles, SignalParams, _confidence_score, _is_long
+
+DEFAULT_HORIZON = 48
+
+# Indicator series the rules read.
+RULE_INPUTS = ("ema20", "ema50", "adx", "plus_di", "minus_di", "macd_hist", "rsi", "atr", "close")
+
+
+@dataclass
+class Trades:
+    """Every simulated signal of one history, one array entry per signal.
+
+    Bar indices point into the candle history; ``-1`` means "not reached".
+    """
+
+    bars: np.ndarray
+    long: np.ndarray
+    confidence: np.ndarray
+    fill_bar: np.ndarray
+    target_bars: np.ndarray  # (signals, targets), only hits before the stop
+    stop_bar: np.ndarray
+    r_multiple: np.ndarray  # 0 for signals that never filled
+    return_pct: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.bars)
+
+    @property
+    def filled(self) -> np.ndarray:
+        return self.fill_bar >= 0
+
+    def select(self, mask: np.ndarray) -> "Trades":
+        """Return the signals where ``mask`` is True."""
+        return Trades(*(getattr(self, name)[mask] for name in _TRADE_FIELDS))
+
+    @classmethod
+    def concat(cls, parts: Iterable["Trades"]) -> "Trades":
+        """Pool trades of several histories (bar indices stay per history)."""
+        parts = list(parts)
+        if not parts:
+            return cls(*(np.empty(0) for _ in _TRADE_FIELDS))
+        return cls(*(np.concatenate([getattr(part, name) for part in parts]) for name in _TRADE_FIELDS))
+
+
+_TRADE_FIELDS = tuple(field.name for field in fields(Trades))
+
+
+@dataclass
+class BacktestReport:
+    """Summary statistics of one symbol and timeframe."""
+
+    symbol: str
+    timeframe: str
+    signals: int
+    filled: int
+    fill_rate: float
+    target_hit_rates: Tuple[float, ...]
+    stop_rate: float
+    win_rate: float
+    expectancy: float
+    expectancy_pct: float
+    max_drawdown: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _RangeMax:
+    """Sparse table of ``max(values[j : j + 2**k])`` for first-hit queries within a window."""
+
+    def __init__(self, values: np.ndarray, horizon: int) -> None:
+        levels = max(horizon - 1, 1).bit_length()
+        padded = np.full(len(values) + (1 << levels), -np.inf)
+        padded[: len(values)] = values
+        self.tables = [padded]
+        for level in range(1, levels):
+            previous = self.tables[-1]
+            step = 1 << (level - 1)
+            table = previous.copy()
+            np.maximum(previous[:-step], previous[step:], out=table[:-step])
+            self.tables.append(table)
+
+    def first_hit(self, start: np.ndarray, stop: np.ndarray, level: np.ndarray) -> np.ndarray:
+        """First ``j`` in ``[start, stop]`` with ``values[j] >= level``, else -1."""
+        position = start.copy()
+        for k in range(len(self.tables) - 1, -1, -1):
+            position += (self.tables[k][position] < level) << k
+        found = (position <= stop) & (self.tables[0][position] >= level)
+        return np.where(found, position, -1)
+
+
+class PreparedHistory:
+    """The parameter-independent part of a backtest: indicator series and range tables.
+
+    Preparing once and calling :meth:`simulate` per :class:`~hyperliquid.signals.SignalParams`
+    is what makes parameter sweeps cheap.
+    """
+
+    def __init__(self, candles: Candles, horizon: int = DEFAULT_HORIZON) -> None:
+        if horizon < 1:
+            raise ValueError("horizon must be at least one bar")
+        self.horizon = horizon
+        self.series = INDICATORS.evaluate(candles, RULE_INPUTS)
+        self.valid = ~np.isnan(np.vstack([self.series[name] for name in RULE_INPUTS])).any(axis=0)
+        self.valid[max(len(self) - horizon, 0) :] = False
+        self.long = np.asarray(_is_long(self.series), dtype=bool)
+        self._highs = _RangeMax(column(candles, "high"), horizon)
+        self._lows = _RangeMax(-column(candles, "low"), horizon)
+
+    def __len__(self) -> int:
+        return len(self.series["close"])
+
+    def simulate(self, min_confidence: float = 0.0, params: SignalParams = DEFAULT_PARAMS) -> Trades:
+        """Generate and resolve a signal for every eligible bar.
+
+        Bars still inside an indicator's warm-up, below ``min_confidence``, closer than
+        ``horizon`` bars to the end of the history or with zero ATR (no risk between
+        fill and stop, so no R) are skipped.
+        """
+        series, size, horizon = self.series, len(self), self.horizon
+        close = series["close"]
+        confidence = np.clip(_confidence_score(series, self.long, params), 0.0, 100.0).astype(float)
+        bars = np.flatnonzero(self.valid & (confidence >= min_confidence) & (series["atr"] > 0))
+
+        long = self.long[bars]
+        sign = np.where(long, 1.0, -1.0)
+        entry_close = close[bars]
+        atr = series["atr"][bars]
+        fill_price = entry_close + sign * atr * params.entry_buffer_atr
+        stop_price = entry_close - sign * atr * params.stop_atr
+        targets = entry_close[:, None] + (sign * atr)[:, None] * np.array(params.target_atr)
+        last_bar = bars + horizon
+
+        # Price moving in the trade's favour reaches targets; moving against it fills the
+        # order and then reaches the stop. Shorts read both through the opposite extreme.
+        fill_bar = np.full(len(bars), -1)
+        stop_bar = np.full(len(bars), -1)
+        target_bars = np.full(targets.shape, -1)
+        for side, favourable, adverse in ((long, self._highs, self._lows), (~long, self._lows, self._highs)):
+            side_sign, end = sign[side], last_bar[side]
+            fill = adverse.first_hit(bars[side] + 1, end, -side_sign * fill_price[side])
+            start = np.where(fill >= 0, fill, size)
+            fill_bar[side] = fill
+            stop_bar[side] = adverse.first_hit(start, end, -side_sign * stop_price[side])
+            for index in range(targets.shape[1]):
+                target_bars[side, index] = favourable.first_hit(start, end, side_sign * targets[side, index])
+
+        filled = fill_bar >= 0
+        target_bars[(stop_bar[:, None] >= 0) & (target_bars >= stop_bar[:, None])] = -1
+        hits = target_bars >= 0
+        stopped = (stop_bar >= 0) & ~hits.all(axis=1)
+
+        risk = np.abs(fill_price - stop_price)
+        share = 1.0 / targets.shape[1]
+        realised = (hits * sign[:, None] * (targets - fill_price[:, None])).sum(axis=1) * share
+        remaining = 1.0 - hits.sum(axis=1) * share
+        exit_move = np.where(stopped, -risk, sign * (close[last_bar] - fill_price))
+        pnl = np.where(filled, realised + remaining * exit_move, 0.0)
+
+        return Trades(
+            bars=bars,
+            long=long,
+            confidence=confidence[bars],
+            fill_bar=fill_bar,
+            target_bars=target_bars,
+            stop_bar=np.where(stopped, stop_bar, -1),
+            r_multiple=np.divide(pnl, risk, out=np.zeros_like(pnl), where=risk > 0),
+            return_pct=100.0 * pnl / fill_price,
+        )
+
+
+def simulate(
+    candles: Candles,
+    horizon: int = DEFAULT_HORIZON,
+    min_confidence: float = 0.0,
+    params: SignalParams = DEFAULT_PARAMS,
+) -> Trades:
+    """Generate and resolve a signal for every eligible bar of ``candles``."""
+    return PreparedHistory(candles, horizon).simulate(min_confidence, params)
+
+
+def summarize(trades: Trades, symbol: str = "", timeframe: str = "") -> BacktestReport:
+    """Hit rates, expectancy and drawdown of ``trades``; rates are over filled trades."""
+    filled = trades.filled
+    count = int(filled.sum())
+    r_multiple = trades.r_multiple[filled]
+    equity = np.concatenate(([0.0], np.cumsum(r_multiple)))
+
+    def rate(mask: np.ndarray) -> float:
+        return float(mask.sum() / count) if count else 0.0
+
+    return BacktestReport(
+        symbol=symbol,
+        timeframe=timeframe,
+        signals=len(trades),
+        filled=count,
+        fill_rate=float(count / len(trades)) if len(trades) else 0.0,
+        target_hit_rates=tuple(rate(hits) for hits in (trades.target_bars[filled] >= 0).T),
+        stop_rate=rate(trades.stop_bar[filled] >= 0),
+        win_rate=rate(r_multiple > 0),
+        expectancy=float(r_multiple.mean()) if count else 0.0,
+        expectancy_pct=float(trades.return_pct[filled].mean()) if count else 0.0,
+        max_drawdown=float((np.maximum.accumulate(equity) - equity).max()),
+    )
+
+
+def backtest(
+    symbol: str,
+    timeframe: str,
+    candles: Candles,
+    horizon: int = DEFAULT_HORIZON,
+    min_confidence: float = 0.0,
+    params: SignalParams = DEFAULT_PARAMS,
+) -> BacktestReport:
+    """:func:`simulate` and :func:`summarize` one history."""
+    return summarize(simulate(candles, horizon, min_confidence, params), symbol, timeframe)
+
+
+def backtest_many(
+    timeframe: str,
+    candles: Mapping[str, Candles],
+    horizon: int = DEFAULT_HORIZON,
+    min_confidence: float = 0.0,
+    params: SignalParams = DEFAULT_PARAMS,
+) -> Dict[str, BacktestReport]:
+    """:func:`backtest` every symbol's history of one timeframe."""
+    return {
+        symbol: backtest(symbol, timeframe, frame, horizon, min_confidence, params)
+        for symbol, frame in candles.items()
+    }
@@ -0,0 +1,285 @@
+"""Cross-sectional indicator computation for many symbols at once.
+
+Scanning the whole perp universe through :func:`~hyperliquid.signals.compute_indicators`
+costs nine small TA-Lib calls per symbol, and at a few hundred bars the Python overhead
+of those calls dominates. Here the inputs are aligned ``(symbols, bars)`` matrices:
+true range, directional movement and gains/losses are computed for every symbol and bar
+in one pass. The EMA/Wilder recursions are never stepped bar by bar. Those whose whole
+series is needed (the MACD EMAs and the Wilder sums behind DI/DX) are stacked and
+unrolled in blocks of bars into scaled cumulative sums, so Python loops once per block
+(:func:`_series`); the rest only need their last value, a weighted sum of their inputs
+computed as one matrix-vector product (:func:`_last`). Seeds and smoothing follow TA-Lib
+(see :mod:`hyperliquid.streaming`), so the values agree with the per-symbol path to
+floating-point tolerance.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .candles import column
+from .streaming import EMA_FAST, EMA_SLOW, MACD_FAST, MACD_SIGNAL, MACD_SLOW, WILDER_PERIOD, is_zero, safe_ratio
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+INDICATOR_COLUMNS = (
+    "ema20",
+    "ema50",
+    "adx",
+    "plus_di",
+    "minus_di",
+    "macd",
+    "macd_signal",
+    "macd_hist",
+    "rsi",
+    "atr",
+    "close",
+)
+
+# Bars solved per vectorized pass in ``_series``.
+_BLOCK = 64
+
+
+@dataclass
+class IndicatorTable:
+    """Latest indicator values for many symbols, one array per indicator.
+
+    ``table["rsi"]`` is the RSI of every symbol in ``symbols`` order, so the table can
+    be handed to :func:`~hyperliquid.signals.classify_directions` and
+    :func:`~hyperliquid.signals.calculate_confidences` as is. Symbols without enough
+    bars for an indicator hold NaN in that column.
+    """
+
+    symbols: Tuple[str, ...]
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def row(self, symbol: str) -> Dict[str, float]:
+        """Return one symbol's values in the shape ``compute_indicators`` returns."""
+        index = self.symbols.index(symbol)
+        return {name: float(values[index]) for name, values in self.columns.items()}
+
+    def complete(self) -> np.ndarray:
+        """Boolean mask of the symbols that have a value for every indicator."""
+        return np.logical_and.reduce([~np.isnan(values) for values in self.columns.values()])
+
+    def to_frame(self) -> pd.DataFrame:
+        import pandas as pd
+
+        return pd.DataFrame(self.columns, index=pd.Index(self.symbols, name="symbol"))
+
+
+def batch_indicators(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    symbols: Optional[Sequence[str]] = None,
+) -> IndicatorTable:
+    """Compute the latest indicator values from aligned ``(symbols, bars)`` matrices.
+
+    Row ``i`` of every matrix holds the bars of ``symbols[i]`` oldest first; all rows
+    must cover the same bars. ``symbols`` defaults to the row numbers as strings.
+    """
+    high, low, close = (np.asarray(values, dtype=np.float64) for values in (high, low, close))
+    if close.ndim != 2 or high.shape != close.shape or low.shape != close.shape:
+        raise ValueError("high, low and close must be 2D arrays of the same shape")
+    count, bars = close.shape
+    names = tuple(symbols) if symbols is not None else tuple(str(index) for index in range(count))
+    if len(names) != count:
+        raise ValueError(f"Expected {count} symbols, got {len(names)}")
+    if not bars:
+        raise ValueError("Indicator matrices contain no bars")
+
+    # Time-major layout, so one bar of every symbol is a contiguous row.
+    high, low, close = (np.ascontiguousarray(values.T) for values in (high, low, close))
+    # Bar-to-bar inputs; row ``t`` compares bar ``t + 1`` with bar ``t``.
+    prev_close = close[:-1]
+    true_range = np.maximum(high[1:], prev_close) - np.minimum(low[1:], prev_close)
+    diff = close[1:] - prev_close
+    diff_plus = high[1:] - high[:-1]
+    diff_minus = low[:-1] - low[1:]
+    plus_dm = np.where((diff_plus > 0) & (diff_plus > diff_minus), diff_plus, 0.0)
+    minus_dm = np.where((diff_minus > 0) & (diff_plus < diff_minus), diff_minus, 0.0)
+
+    period = WILDER_PERIOD
+    # MACD and the DI/DX chain need whole series; everything else only its last value.
+    fast, slow, plus_sum, minus_sum, range_sum = _series(
+        [
+            # MACD seeds its fast EMA on the bars ending where the slow seed ends.
+            _ema(close, MACD_FAST, start=MACD_SLOW - MACD_FAST),
+            _ema(close, MACD_SLOW),
+            _wilder_sum(plus_dm, period),
+            _wilder_sum(minus_dm, period),
+            _wilder_sum(true_range, period),
+        ]
+    )
+    # The DI series start one bar after the Wilder sums are seeded.
+    plus_di = 100.0 * safe_ratio(plus_sum[1:], range_sum[1:])
+    minus_di = 100.0 * safe_ratio(minus_sum[1:], range_sum[1:])
+    di_sum = plus_di + minus_di
+    valid = np.logical_not(is_zero(range_sum[1:]) | is_zero(di_sum))
+    dx = 100.0 * safe_ratio(np.abs(minus_di - plus_di), di_sum)
+    macd = fast - slow
+    gain = _last(_wilder_average(np.maximum(diff, 0.0), period))
+    loss = _last(_wilder_average(np.maximum(-diff, 0.0), period))
+    signal = _last(_ema(macd, MACD_SIGNAL))
+    nan = np.full(count, np.nan)
+
+    columns = {
+        "ema20": _last(_ema(close, EMA_FAST)),
+        "ema50": _last(_ema(close, EMA_SLOW)),
+        "adx": _last(_adx(dx, valid, period)),
+        "plus_di": plus_di[-1] if len(plus_di) else nan,
+        "minus_di": minus_di[-1] if len(minus_di) else nan,
+        # TA-Lib only reports the MACD line once its signal line exists.
+        "macd": np.where(np.isnan(signal), np.nan, macd[-1]) if len(macd) else nan,
+        "macd_signal": signal,
+        "macd_hist": macd[-1] - signal if len(macd) else nan,
+        "rsi": 100.0 * safe_ratio(gain, gain + loss),
+        "atr": _last(_wilder_average(true_range, period)),
+        "close": close[-1].copy(),
+    }
+    return IndicatorTable(names, columns)
+
+
+def compute_indicators_batch(candles: Mapping[str, object]) -> IndicatorTable:
+    """Batched ``compute_indicators`` for a mapping of symbol to candles.
+
+    Symbols are grouped by bar count and each group is computed as one matrix, so every
+    row matches what ``compute_indicators`` returns for that symbol's full history.
+    """
+    groups: Dict[int, List[str]] = {}
+    for symbol, frame in candles.items():
+        groups.setdefault(len(frame), []).append(symbol)
+    tables = []
+    for members in groups.values():
+        high, low, close = (
+            np.stack([column(candles[symbol], name) for symbol in members]) for name in ("high", "low", "close")
+        )
+        tables.append(batch_indicators(high, low, close, members))
+    return _concat(tables, tuple(candles))
+
+
+class _Recursion(NamedTuple):
+    """``out[0] = seed`` and ``out[t] = scale * values[t] + decay * out[t - 1]`` after it.
+
+    ``values`` covers the bars after the seed bar; ``decay`` is a constant or, for ADX,
+    one factor per value. Recursions whose seed needs more bars than exist have
+    ``seed=None``.
+    """
+
+    seed: Optional[np.ndarray]
+    values: np.ndarray
+    scale: float
+    decay: Any
+
+
+def _series(recursions: Sequence[_Recursion], block: int = _BLOCK) -> List[np.ndarray]:
+    """Return the output series (seed bar onwards) of several constant-decay recursions.
+
+    The recursions must end on the same bar. Within a block of bars a recursion unrolls
+    to ``decay**k * cumsum(inputs * decay**-k)``, so Python loops once per block and each
+    pass covers every recursion and symbol at once. Short blocks keep ``decay**-k`` far
+    from overflow.
+    """
+    lengths = [0 if recursion.seed is None else 1 + len(recursion.values) for recursion in recursions]
+    bars = max(lengths)
+    # Right-aligned: rows before a recursion's seed stay zero and are dropped at the end.
+    inputs = np.zeros((len(recursions), bars, recursions[0].values.shape[1]))
+    for index, (recursion, length) in enumerate(zip(recursions, lengths)):
+        if length:
+            inputs[index, bars - length] = recursion.seed
+            np.multiply(recursion.values, recursion.scale, out=inputs[index, bars - length + 1 :])
+    decay = np.array([recursion.decay for recursion in recursions])[:, None]
+    lag = np.arange(block)
+    growth = (decay**-lag)[:, :, None]
+    shrink = (decay**lag)[:, :, None]
+    carry = np.zeros((inputs.shape[0], inputs.shape[2]))
+    for start in range(0, bars, block):
+        chunk = inputs[:, start : start + block]
+        size = chunk.shape[1]
+        chunk *= growth[:, :size]
+        np.cumsum(chunk, axis=1, out=chunk)
+        chunk += (decay * carry)[:, None]
+        chunk *= shrink[:, :size]
+        carry = chunk[:, -1]
+    return [series[bars - length :] for series, length in zip(inputs, lengths)]
+
+
+def _last(recursion: _Recursion) -> np.ndarray:
+    """Final output of a recursion without materializing the series.
+
+    Unrolled, it is the seed and the scaled values weighted by the products of the
+    decays that follow them: one matrix-vector product for a constant decay.
+    """
+    seed, values, scale, decay = recursion
+    if seed is None:
+        return np.full(values.shape[1], np.nan)
+    if np.ndim(decay) == 0:
+        weights = decay ** np.arange(len(values), -1, -1, dtype=np.float64)
+        return weights[0] * seed + scale * (weights[1:] @ values)
+    # weights[t] is the product of decay[t:], so values[t] is weighted by weights[t + 1].
+    weights = np.ones((len(values) + 1, values.shape[1]))
+    weights[:-1] = np.cumprod(decay[::-1], axis=0)[::-1]
+    return weights[0] * seed + scale * np.einsum("ts,ts->s", weights[1:], values)
+
+
+def _seeded(seed: np.ndarray, values: np.ndarray, end: int, scale: float, decay: Any) -> _Recursion:
+    if end > len(values):
+        return _Recursion(None, values[:0], scale, decay)
+    return _Recursion(seed, values[end:], scale, decay)
+
+
+def _ema(values: np.ndarray, period: int, start: int = 0) -> _Recursion:
+    """TA-Lib EMA from the first ``start + period`` rows: seeded with their last ``period``."""
+    k = 2.0 / (period + 1)
+    end = start + period
+    seed = values[start:end].mean(axis=0) if end <= len(values) else None
+    return _seeded(seed, values, end, k, 1.0 - k)
+
+
+def _wilder_average(changes: np.ndarray, period: int) -> _Recursion:
+    """RSI/ATR smoothing of bar-to-bar changes: mean of the first ``period``, then
+    ``(prev * (n - 1) + x) / n``."""
+    seed = changes[:period].mean(axis=0) if period <= len(changes) else None
+    return _seeded(seed, changes, period, 1.0 / period, (period - 1) / period)
+
+
+def _wilder_sum(changes: np.ndarray, period: int) -> _Recursion:
+    """DM/TR smoothing of bar-to-bar changes: sum of the first ``period - 1``, then
+    ``prev - prev / n + x``."""
+    seed = changes[: period - 1].sum(axis=0) if period - 1 <= len(changes) else None
+    return _seeded(seed, changes, period - 1, 1.0, 1.0 - 1.0 / period)
+
+
+def _adx(dx: np.ndarray, valid: np.ndarray, period: int) -> _Recursion:
+    """ADX: mean of the first ``period`` DX values, then Wilder smoothing of valid ones."""
+    seed = dx[:period].mean(axis=0) if period <= len(dx) else None
+    recursion = _seeded(seed, dx, period, 1.0 / period, (period - 1) / period)
+    held = ~valid[period:]
+    if recursion.seed is not None and held.any():
+        # Flat stretches hold the previous ADX instead of smoothing towards zero.
+        values = np.where(held, 0.0, recursion.values)
+        recursion = recursion._replace(values=values, decay=np.where(held, 1.0, recursion.decay))
+    return recursion
+
+
+def _concat(tables: Sequence[IndicatorTable], order: Tuple[str, ...]) -> IndicatorTable:
+    """Merge per-group tables back into ``order``."""
+    if len(tables) == 1:
+        return tables[0]
+    if not tables:
+        return IndicatorTable((), {name: np.empty(0) for name in INDICATOR_COLUMNS})
+    position = {symbol: index for index, symbol in enumerate(symbol for table in tables for symbol in table.symbols)}
+    take = np.array([position[symbol] for symbol in order], dtype=np.intp)
+    columns = {name: np.concatenate([table[name] for table in tables])[take] for name in INDICATOR_COLUMNS}
+    return IndicatorTable(order, columns)
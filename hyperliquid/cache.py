@@ -0,0 +1,274 @@
+"""Bounded LRU + TTL cache for generated signals with shared in-flight computation."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar, Union
+
+V = TypeVar("V")
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 300.0
+DEFAULT_SWEEP_INTERVAL = 30.0
+
+# Seconds to keep an entry, or a callable returning them when the entry is stored.
+TTL = Union[float, Callable[[], float]]
+
+
+@dataclass
+class CacheStats:
+    """Counters and occupancy of a :class:`SignalCache`."""
+
+    entries: int = 0
+    max_entries: int = 0
+    approx_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    stale_hits: int = 0
+    stale_on_error: int = 0
+    failures: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class Lookup(Generic[V]):
+    """A value served by :meth:`SignalCache.get_or_revalidate`.
+
+    ``stale`` marks a value past its TTL; ``age`` is seconds since it was stored.
+    """
+
+    value: V
+    stale: bool = False
+    age: float = 0.0
+
+
+class _Entry(Generic[V]):
+    __slots__ = ("value", "stored_at", "expires_at", "size")
+
+    def __init__(self, value: V, stored_at: float, expires_at: float, size: int) -> None:
+        self.value = value
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.size = size
+
+
+class SignalCache(Generic[V]):
+    """At most ``max_entries`` values, least recently used evicted first, each with a TTL.
+
+    Expired entries (past any stale window below) are dropped when read and by :meth:`sweep`, which
+    :meth:`start_sweeper` runs periodically so idle keys do not linger. Concurrent
+    misses for one key share a single computation (see :meth:`get_or_compute`). Like
+    :class:`~hyperliquid.flight.AsyncCandleFlight` it is meant for one event loop and
+    is not thread-safe.
+
+    Expired values are kept for ``stale_while_revalidate`` seconds, during which
+    :meth:`get_or_revalidate` serves them at once while one background refresh runs,
+    and for ``stale_if_error`` seconds, during which they stand in for a failed
+    computation.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._stale_while_revalidate = stale_while_revalidate
+        self._stale_if_error = stale_if_error
+        self._retention = max(stale_while_revalidate, stale_if_error)
+        self._entries: "OrderedDict[Hashable, _Entry[V]]" = OrderedDict()
+        self._inflight: Dict[Hashable, "asyncio.Task[V]"] = {}
+        self._bytes = 0
+        self._stats = CacheStats(max_entries=max_entries)
+        self._sweeper: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the live value for ``key`` and mark it recently used, else ``None``."""
+        entry = self._live(key)
+        return entry.value if entry is not None else None
+
+    def _live(self, key: Hashable) -> Optional[_Entry[V]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = self._clock()
+        if entry.expires_at <= now:
+            if entry.expires_at + self._retention <= now:
+                self._drop(key)
+                self._stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, value: V, ttl: Optional[TTL] = None) -> None:
+        """Store ``value`` for ``ttl`` seconds (the cache default when omitted).
+
+        A callable ``ttl`` is evaluated now, so an entry can expire at a fixed deadline
+        however long its value took to compute.
+        """
+        if key in self._entries:
+            self._drop(key)
+        if ttl is None:
+            ttl = self._ttl
+        elif callable(ttl):
+            ttl = ttl()
+        size = _approx_size(key, value)
+        now = self._clock()
+        self._entries[key] = _Entry(value, now, now + ttl, size)
+        self._bytes += size
+        while len(self._entries) > self._max_entries:
+            self._drop(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    async def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[V]], ttl: Optional[TTL] = None
+    ) -> V:
+        """Return the cached value or await the single shared ``compute()`` for ``key``.
+
+        The computation runs in its own task and is awaited through ``asyncio.shield``,
+        so a cancelled waiter never cancels it for the others. Failures reach every
+        waiter and are not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            self._stats.hits += 1
+            return value
+        self._stats.misses += 1
+        return await asyncio.shield(self._computation(key, compute, ttl))
+
+    async def get_or_revalidate(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[V]],
+        ttl: Optional[TTL] = None,
+        background: bool = True,
+    ) -> Lookup[V]:
+        """:meth:`get_or_compute` that prefers a recently expired value over waiting.
+
+        Within ``stale_while_revalidate`` of expiry the old value is returned at once,
+        marked stale, and a single background ``compute()`` replaces it. Past that, the
+        caller waits for the computation, and if it fails an entry still within
+        ``stale_if_error`` is returned instead of the error. With ``background=False``
+        the caller always waits, for a ``compute`` that must not outlive it.
+        """
+        entry = self._live(key)
+        if entry is not None:
+            self._stats.hits += 1
+            return Lookup(entry.value, age=self._clock() - entry.stored_at)
+        stale = self._entries.get(key)
+        now = self._clock()
+        if background and stale is not None and now < stale.expires_at + self._stale_while_revalidate:
+            self._stats.stale_hits += 1
+            self._computation(key, compute, ttl)
+            return Lookup(stale.value, stale=True, age=now - stale.stored_at)
+        self._stats.misses += 1
+        try:
+            return Lookup(await asyncio.shield(self._computation(key, compute, ttl)))
+        except Exception:
+            now = self._clock()
+            if stale is None or now >= stale.expires_at + self._stale_if_error:
+                raise
+            self._stats.stale_on_error += 1
+            return Lookup(stale.value, stale=True, age=now - stale.stored_at)
+
+    def _computation(
+        self, key: Hashable, compute: Callable[[], Awaitable[V]], ttl: Optional[TTL]
+    ) -> "asyncio.Task[V]":
+        """The in-flight computation for ``key``, started if there is none."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats.coalesced += 1
+            return task
+        task = asyncio.ensure_future(compute())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._settle(key, done, ttl))
+        return task
+
+    def _settle(self, key: Hashable, task: "asyncio.Task[V]", ttl: Optional[TTL]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        if task.exception() is None:
+            self.put(key, task.result(), ttl)
+        else:
+            self._stats.failures += 1
+
+    def sweep(self) -> int:
+        """Drop every entry past its TTL and stale windows; returns how many were removed."""
+        horizon = self._clock() - self._retention
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= horizon]
+        for key in expired:
+            self._drop(key)
+        self._stats.expirations += len(expired)
+        return len(expired)
+
+    def start_sweeper(self, interval: float = DEFAULT_SWEEP_INTERVAL) -> "asyncio.Task[None]":
+        """Run :meth:`sweep` every ``interval`` seconds on the running loop."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.ensure_future(self._sweep_forever(interval))
+        return self._sweeper
+
+    async def stop_sweeper(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep_forever(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.sweep()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def live_entries(self) -> int:
+        """Entries that have not expired yet (expired ones may await the next sweep)."""
+        now = self._clock()
+        return sum(1 for entry in self._entries.values() if entry.expires_at > now)
+
+    def stats(self) -> CacheStats:
+        stats = CacheStats(**self._stats.as_dict())
+        stats.entries = len(self._entries)
+        stats.approx_bytes = self._bytes
+        return stats
+
+    def _drop(self, key: Hashable) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+
+def _approx_size(key: Hashable, value: object) -> int:
+    """Shallow size of the key and value plus the entry bookkeeping."""
+    return sys.getsizeof(key) + sys.getsizeof(value) + _ENTRY_OVERHEAD
+
+
+# An _Entry plus roughly 100 bytes for its OrderedDict node.
+_ENTRY_OVERHEAD = sys.getsizeof(_Entry(None, 0.0, 0.0, 0)) + 100
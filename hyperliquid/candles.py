@@ -0,0 +1,124 @@
+"""Array-backed candle container shared by the storage and signal layers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING, Iterable, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PRICE_COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(slots=True)
+class CandleArrays:
+    """OHLCV candles held as parallel NumPy arrays.
+
+    ``time`` holds bar open times in epoch milliseconds (int64) and the price columns are
+    float64. The arrays may be views into a memory-mapped file, so slicing never copies.
+    Column access mirrors a DataFrame (``candles["close"]``) so the indicator helpers
+    accept either type.
+    """
+
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.time.shape[0])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        if column not in PRICE_COLUMNS and column != "time":
+            raise KeyError(column)
+        return getattr(self, column)
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    @classmethod
+    def empty_arrays(cls) -> "CandleArrays":
+        return cls(np.empty(0, dtype=np.int64), *(np.empty(0, dtype=np.float64) for _ in PRICE_COLUMNS))
+
+    @classmethod
+    def from_records(cls, raw: Iterable[dict]) -> "CandleArrays":
+        """Build arrays from Hyperliquid candle snapshot records, sorted by open time."""
+        return parse_candles(raw)
+
+    @classmethod
+    def concat(cls, parts: Iterable["CandleArrays"]) -> "CandleArrays":
+        items = [part for part in parts if len(part)]
+        if not items:
+            return cls.empty_arrays()
+        if len(items) == 1:
+            return items[0]
+        return cls(*(np.concatenate([getattr(part, name) for part in items]) for name in ("time", *PRICE_COLUMNS)))
+
+    def slice(self, start: int, stop: int) -> "CandleArrays":
+        """Return a zero-copy view of bars ``[start, stop)``."""
+        return CandleArrays(*(getattr(self, name)[start:stop] for name in ("time", *PRICE_COLUMNS)))
+
+    def tail(self, count: int) -> "CandleArrays":
+        return self.slice(max(len(self) - count, 0), len(self))
+
+    def take(self, indices: np.ndarray) -> "CandleArrays":
+        return CandleArrays(*(getattr(self, name)[indices] for name in ("time", *PRICE_COLUMNS)))
+
+    def between(self, start_ts: int, end_ts: int) -> "CandleArrays":
+        """Return the bars whose open time falls within ``[start_ts, end_ts]`` as a view."""
+        lo = int(np.searchsorted(self.time, start_ts, side="left"))
+        hi = int(np.searchsorted(self.time, end_ts, side="right"))
+        return self.slice(lo, hi)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the DataFrame layout produced by ``_normalize_candles``.
+
+        pandas is only imported here; the signal pipeline itself never needs it.
+        """
+        import pandas as pd
+
+        if not len(self):
+            return pd.DataFrame()
+        index = pd.DatetimeIndex(pd.to_datetime(self.time, unit="ms", utc=True), name="time")
+        return pd.DataFrame({name: getattr(self, name) for name in PRICE_COLUMNS}, index=index)
+
+
+def parse_candles(raw: Iterable[dict]) -> CandleArrays:
+    """Parse candle snapshot records straight into NumPy arrays.
+
+    The price strings are streamed in a single pass into one preallocated ``(n, 5)``
+    buffer (NumPy parses the decimal strings itself), then split into contiguous
+    columns. Records are only re-sorted when upstream returns them out of order.
+    """
+    records = raw if isinstance(raw, list) else list(raw)
+    count = len(records)
+    if not count:
+        return CandleArrays.empty_arrays()
+    time = np.fromiter(map(_get_time, records), dtype=np.int64, count=count)
+    values = np.fromiter(
+        chain.from_iterable(map(_get_prices, records)),
+        dtype=np.float64,
+        count=count * len(PRICE_COLUMNS),
+    )
+    columns = values.reshape(count, len(PRICE_COLUMNS)).T.copy()
+    candles = CandleArrays(time, *columns)
+    if count > 1 and np.any(time[1:] < time[:-1]):
+        candles = candles.take(np.argsort(time, kind="stable"))
+    return candles
+
+
+_get_time = itemgetter("t")
+_get_prices = itemgetter("o", "h", "l", "c", "v")
+
+
+def column(candles, name: str) -> np.ndarray:
+    """Return a float64 view of ``name`` from a DataFrame or ``CandleArrays``."""
+    return np.asarray(candles[name], dtype=np.float64)
@@ -0,0 +1,248 @@
+"""Record and replay raw upstream ``/info`` traffic.
+
+A :class:`Cassette` maps request payloads to the raw JSON responses upstream returned
+for them and is stored as gzip-compressed JSON. :class:`RecordingInfo` and
+:class:`RecordingTransport` capture traffic from the synchronous and async clients;
+:class:`ReplayInfo` and :class:`ReplayTransport` serve it back offline with optional
+injected latency, so benchmarks of signal generation or the HTTP endpoints are
+reproducible across commits.
+
+Live requests ask for windows ending "now", so a replayed ``candleSnapshot`` rarely
+matches a recorded window exactly. On a miss the cassette answers with the recording for
+the same coin and interval whose window length is closest, which keeps replays
+independent of the wall clock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from hyperliquid.info import Info  # type: ignore[import]
+
+CASSETTE_VERSION = 1
+
+# Seconds of injected latency: a constant or a zero-argument sampler.
+Latency = Union[float, Callable[[], float]]
+
+
+class CassetteMiss(KeyError):
+    """Raised when a replayed request has no recorded response."""
+
+
+def request_key(payload: Dict[str, Any]) -> str:
+    """Canonical form of a request payload used as the cassette key."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def jittered_latency(median: float, jitter: float = 0.0, seed: Optional[int] = None) -> Callable[[], float]:
+    """Return a sampler drawing log-normal delays around ``median`` seconds.
+
+    ``jitter`` is the sigma of the underlying normal distribution; ``0`` gives a constant
+    delay and values around ``0.5`` produce a realistic long right tail.
+    """
+    rng = random.Random(seed)
+    return lambda: median * rng.lognormvariate(0.0, jitter) if jitter else median
+
+
+def _sample(latency: Latency) -> float:
+    return latency() if callable(latency) else latency
+
+
+def _snapshot_stream(payload: Dict[str, Any]) -> Optional[Tuple[Tuple[str, str], int]]:
+    if payload.get("type") != "candleSnapshot":
+        return None
+    req = payload.get("req") or {}
+    try:
+        return (req["coin"], req["interval"]), int(req["endTime"]) - int(req["startTime"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class Cassette:
+    """Thread-safe collection of recorded request/response pairs."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Any] = {}
+        self._requests: Dict[str, Dict[str, Any]] = {}
+        self._streams: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @classmethod
+    def load(cls, path: os.PathLike | str) -> "Cassette":
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            document = json.load(handle)
+        if document.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {document.get('version')!r} in {path}")
+        cassette = cls()
+        for entry in document["entries"]:
+            cassette.record(entry["request"], entry["response"])
+        return cassette
+
+    def save(self, path: os.PathLike | str) -> None:
+        """Atomically write the cassette to ``path`` (gzip-compressed JSON)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = [
+                {"request": self._requests[key], "response": response} for key, response in self._entries.items()
+            ]
+        document = {"version": CASSETTE_VERSION, "entries": entries}
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as handle:
+                handle.write(json.dumps(document, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def record(self, payload: Dict[str, Any], response: Any) -> None:
+        key = request_key(payload)
+        stream = _snapshot_stream(payload)
+        with self._lock:
+            if key not in self._entries and stream is not None:
+                self._streams.setdefault(stream[0], []).append((stream[1], key))
+            self._entries[key] = response
+            self._requests[key] = payload
+
+    def lookup(self, payload: Dict[str, Any]) -> Any:
+        """Return the recorded response for ``payload``.
+
+        ``candleSnapshot`` misses fall back to the recording of the same stream with the
+        closest window length (the most recent one on ties).
+        """
+        key = request_key(payload)
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            stream = _snapshot_stream(payload)
+            candidates = self._streams.get(stream[0]) if stream is not None else None
+            if candidates:
+                span = stream[1]
+                _, best = min(reversed(candidates), key=lambda candidate: abs(candidate[0] - span))
+                return self._entries[best]
+        raise CassetteMiss(key)
+
+    def coins(self) -> List[str]:
+        """Coins of the recorded ``candleSnapshot`` requests."""
+        with self._lock:
+            return sorted({coin for coin, _ in self._streams})
+
+    def metadata(self, request_type: str) -> Optional[Any]:
+        """Stand-in for a ``meta`` or ``spotMeta`` response the cassette does not hold.
+
+        Cassettes recorded through :class:`RecordingTransport` never see the metadata
+        requests ``Info`` makes while it is built. Replaying them through
+        :class:`ReplayInfo` gets a perp universe of the recorded coins instead, so
+        ``Info`` can resolve every coin it has candles for.
+        """
+        if request_type == "meta":
+            return {"universe": [{"name": coin, "szDecimals": 0} for coin in self.coins()]}
+        if request_type == "spotMeta":
+            return {"universe": [], "tokens": []}
+        return None
+
+
+class RecordingInfo(Info):
+    """``Info`` that records every ``/info`` response into ``cassette``.
+
+    Use it in place of ``Info`` when building a ``HyperliquidDataClient``; the metadata
+    requests made while constructing the client are recorded too.
+    """
+
+    def __init__(self, cassette: Cassette, base_url: Optional[str] = None, **kwargs: Any) -> None:
+        self.cassette = cassette
+        kwargs.setdefault("skip_ws", True)
+        super().__init__(base_url, **kwargs)
+
+    def post(self, url_path: str, payload: Any = None) -> Any:
+        response = super().post(url_path, payload)
+        if url_path == "/info" and payload:
+            self.cassette.record(payload, response)
+        return response
+
+
+class ReplayInfo(Info):
+    """Offline ``Info`` answering ``/info`` requests from a cassette.
+
+    Each request sleeps for ``latency`` seconds first (a constant or a sampler such as
+    :func:`jittered_latency`), emulating the upstream round trip.
+    """
+
+    def __init__(self, cassette: Cassette, latency: Latency = 0.0, base_url: Optional[str] = None) -> None:
+        self.cassette = cassette
+        self.latency = latency
+        super().__init__(base_url, skip_ws=True)
+
+    def post(self, url_path: str, payload: Any = None) -> Any:
+        delay = _sample(self.latency)
+        if delay > 0:
+            time.sleep(delay)
+        return _replay(self.cassette, payload or {})
+
+
+def _replay(cassette: Cassette, payload: Dict[str, Any]) -> Any:
+    try:
+        return cassette.lookup(payload)
+    except CassetteMiss:
+        fallback = cassette.metadata(payload.get("type", ""))
+        if fallback is None:
+            raise
+        return fallback
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that forwards to ``transport`` and records ``/info`` responses."""
+
+    def __init__(self, cassette: Cassette, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        self.cassette = cassette
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        if request.url.path != "/info":
+            return response
+        body = await response.aread()
+        if response.status_code == 200:
+            self.cassette.record(json.loads(request.content), json.loads(body))
+        return httpx.Response(response.status_code, headers=response.headers, content=body)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """httpx transport that answers ``/info`` from a cassette after injected latency.
+
+    Pass it as ``transport`` to ``AsyncHyperliquidDataClient`` or ``build_async_client``.
+    """
+
+    def __init__(self, cassette: Cassette, latency: Latency = 0.0) -> None:
+        self.cassette = cassette
+        self.latency = latency
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = _sample(self.latency)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if request.url.path != "/info":
+            return httpx.Response(404, json={"error": f"not recorded: {request.url.path}"})
+        return httpx.Response(200, json=_replay(self.cassette, json.loads(request.content)))
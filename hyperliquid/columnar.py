@@ -0,0 +1,177 @@
+"""Columnar, memory-mapped candle history files.
+
+Layout of a ``.hlc`` file::
+
+    header (64 bytes)  magic, version, period_ms, count, capacity
+    time[capacity]     int64 bar open times (epoch ms)
+    open[capacity]     float64
+    high[capacity]     float64
+    low[capacity]      float64
+    close[capacity]    float64
+    volume[capacity]   float64
+
+Each column is preallocated to ``capacity`` rows and only the first ``count`` rows are
+valid. Appends write into the slack first and publish the new ``count`` last, so a
+crash mid-append leaves the previous contents intact. When the slack runs out the file
+is rewritten into a temporary file and swapped in with ``os.replace``.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .candles import PRICE_COLUMNS, CandleArrays
+
+MAGIC = b"HLCANDL1"
+VERSION = 1
+HEADER_SIZE = 64
+MIN_CAPACITY = 1024
+
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("reserved", "<u4"),
+        ("period_ms", "<i8"),
+        ("count", "<i8"),
+        ("capacity", "<i8"),
+        ("padding", "V24"),
+    ]
+)
+_COLUMNS = ("time", *PRICE_COLUMNS)
+_DTYPES = {"time": np.dtype("<i8"), **{name: np.dtype("<f8") for name in PRICE_COLUMNS}}
+
+assert _HEADER_DTYPE.itemsize == HEADER_SIZE
+
+
+class ColumnarFormatError(ValueError):
+    """Raised when a file is not a valid columnar candle file."""
+
+
+def _read_header(path: Path) -> np.void:
+    header = np.fromfile(path, dtype=_HEADER_DTYPE, count=1)
+    if header.shape[0] != 1 or header[0]["magic"] != MAGIC:
+        raise ColumnarFormatError(f"{path} is not a columnar candle file")
+    if int(header[0]["version"]) != VERSION:
+        raise ColumnarFormatError(f"{path} has unsupported version {int(header[0]['version'])}")
+    return header[0]
+
+
+def _column_offset(index: int, capacity: int) -> int:
+    return HEADER_SIZE + index * capacity * 8
+
+
+def read_columns(path: os.PathLike | str) -> Optional[CandleArrays]:
+    """Open ``path`` read-only and return zero-copy views of its valid rows.
+
+    Returns ``None`` when the file does not exist.
+    """
+    path = Path(path)
+    try:
+        header = _read_header(path)
+    except FileNotFoundError:
+        return None
+    count = int(header["count"])
+    capacity = int(header["capacity"])
+    if count == 0:
+        return CandleArrays.empty_arrays()
+    mapped = {
+        name: np.memmap(path, dtype=_DTYPES[name], mode="r", offset=_column_offset(index, capacity), shape=(count,))
+        for index, name in enumerate(_COLUMNS)
+    }
+    return CandleArrays(**mapped)
+
+
+def read_period(path: os.PathLike | str) -> int:
+    return int(_read_header(Path(path))["period_ms"])
+
+
+def write_columns(
+    path: os.PathLike | str, candles: CandleArrays, period_ms: int, capacity: Optional[int] = None
+) -> None:
+    """Atomically replace ``path`` with ``candles``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = len(candles)
+    capacity = max(capacity or 0, MIN_CAPACITY, _grow(count))
+    header = np.zeros(1, dtype=_HEADER_DTYPE)
+    header[0]["magic"] = MAGIC
+    header[0]["version"] = VERSION
+    header[0]["period_ms"] = period_ms
+    header[0]["count"] = count
+    header[0]["capacity"] = capacity
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header.tobytes())
+            for name in _COLUMNS:
+                values = np.zeros(capacity, dtype=_DTYPES[name])
+                values[:count] = candles[name]
+                handle.write(values.tobytes())
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def append_columns(path: os.PathLike | str, candles: CandleArrays, period_ms: int) -> int:
+    """Append bars newer than the last stored bar; returns the number of rows written.
+
+    Bars at or before the current last open time are ignored, so callers can pass an
+    overlapping window without deduplicating first.
+    """
+    path = Path(path)
+    try:
+        header = _read_header(path)
+    except FileNotFoundError:
+        write_columns(path, candles, period_ms)
+        return len(candles)
+
+    count = int(header["count"])
+    capacity = int(header["capacity"])
+    if count:
+        offset = _column_offset(0, capacity) + (count - 1) * 8
+        last = np.memmap(path, dtype=_DTYPES["time"], mode="r", offset=offset, shape=(1,))
+        last_time = int(last[0])
+        del last
+        candles = candles.slice(int(np.searchsorted(candles.time, last_time, side="right")), len(candles))
+    added = len(candles)
+    if not added:
+        return 0
+
+    if count + added > capacity:
+        existing = read_columns(path)
+        assert existing is not None
+        write_columns(path, CandleArrays.concat([existing, candles]), period_ms)
+        return added
+
+    with open(path, "r+b") as handle:
+        for index, name in enumerate(_COLUMNS):
+            handle.seek(_column_offset(index, capacity) + count * 8)
+            handle.write(np.ascontiguousarray(candles[name], dtype=_DTYPES[name]).tobytes())
+        handle.flush()
+        os.fsync(handle.fileno())
+        # Publish the new rows only once their data is durable.
+        handle.seek(_HEADER_DTYPE.fields["count"][1])
+        handle.write(np.array([count + added], dtype="<i8").tobytes())
+        handle.flush()
+        os.fsync(handle.fileno())
+    return added
+
+
+def _grow(count: int) -> int:
+    capacity = MIN_CAPACITY
+    while capacity < count * 2:
+        capacity *= 2
+    return capacity
@@ -2,21 +2,41 @@
 
 from __future__ import annotations
 
+import os
+import threading
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Dict, Iterable, Optional
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Tuple
 
 try:
     from hyperliquid.info import Info  # type: ignore[import]
     from hyperliquid.utils import constants  # type: ignore[import]
+    from hyperliquid.utils.error import ClientError  # type: ignore[import]
 except ImportError as exc:  # pragma: no cover
     raise ImportError(
         "hyperliquid-python-sdk is required. Install it with 'pip install hyperliquid-python-sdk'."
     ) from exc
 
+from .candles import CandleArrays, parse_candles
+from .flight import CandleFlight, FlightStats
+from .ratelimit import DEFAULT_WEIGHT_PER_MINUTE, RateLimiter, candle_snapshot_weight
+from .resample import resample_arrays
+from .store import CandleStore, closed_candles, merge_candles, plan_fetch
+from .timeframes import TIMEFRAMES, derivation_bases, get_timeframe, normalize_bases
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .live import LiveCandleFeed
+
 DEFAULT_TIMEFRAME = "1h"
+# Upstream returns at most this many bars per candleSnapshot call.
+MAX_CANDLES_PER_REQUEST = 5000
+# Times a request is retried after an upstream 429 when a rate limiter is configured.
+RATE_LIMIT_RETRIES = 3
+# Seconds a fetched window may be reused by other timeframes derived from it.
+_RECENT_FETCH_TTL = 2.0
 
 
 @dataclass
@@ -30,85 +50,373 @@ class CandleRequest:
 
     def interval(self) -> str:
         """Return the Hyperliquid interval string."""
-        if self.timeframe not in TIMEFRAME_TO_MINUTES:
-            supported = ", ".join(sorted(TIMEFRAME_TO_MINUTES))
-            raise ValueError(f"Unsupported timeframe '{self.timeframe}'. Supported: {supported}")
-        return self.timeframe
+        return get_timeframe(self.timeframe).name
 
     def end_time(self) -> datetime:
         return self.end or datetime.now(tz=UTC)
 
     def start_time(self) -> datetime:
-        minutes = TIMEFRAME_TO_MINUTES[self.timeframe]
-        delta = timedelta(minutes=minutes * self.lookback)
+        delta = timedelta(minutes=get_timeframe(self.timeframe).minutes * self.lookback)
         return self.end_time() - delta
 
 
-TIMEFRAME_TO_MINUTES: Dict[str, int] = {
-    "15m": 15,
-    "1h": 60,
-    "4h": 240,
-    "1d": 1440,
-}
+TIMEFRAME_TO_MINUTES: Dict[str, int] = {name: tf.minutes for name, tf in TIMEFRAMES.items()}
+
+
+class _CandleSource:
+    """Store, resampling and window bookkeeping shared by the sync and async clients.
+
+    Subclasses supply the upstream transport; everything here is pure bookkeeping or
+    local disk access.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CandleStore] = None,
+        resample_from: Optional[str | Sequence[str]] = None,
+        resample_window: int = MAX_CANDLES_PER_REQUEST,
+        live: Optional["LiveCandleFeed"] = None,
+    ) -> None:
+        self._resample_bases = normalize_bases(resample_from)
+        self._store = store
+        self._live = live
+        self._resample_from = resample_from
+        self._resample_window = resample_window
+        self._recent: Dict[Tuple[str, str], Tuple[int, int, float, CandleArrays]] = {}
+
+    @property
+    def store(self) -> Optional[CandleStore]:
+        return self._store
+
+    @property
+    def resample_from(self) -> Optional[str | Sequence[str]]:
+        return self._resample_from
+
+    @property
+    def live(self) -> Optional["LiveCandleFeed"]:
+        return self._live
+
+    def _live_window(self, request: CandleRequest, start_ts: int, end_ts: int) -> Optional[CandleArrays]:
+        """Serve "latest" requests from the live feed when it holds the whole window."""
+        if self._live is None or request.end is not None:
+            return None
+        return self._live.window(request.symbol, request.timeframe, start_ts, end_ts)
+
+    def live_indicators(
+        self, request: CandleRequest, candles: CandleArrays | pd.DataFrame
+    ) -> Optional[Dict[str, float]]:
+        """Streaming indicators for the newest bar of ``candles``, if a live stream has them."""
+        if self._live is None or request.end is not None or not len(candles):
+            return None
+        if isinstance(candles, CandleArrays):
+            last_time = int(candles.time[-1])
+        else:
+            last_time = candles.index[-1].value // 1_000_000
+        return self._live.indicators(request.symbol, request.timeframe, last_time)
+
+    def _resample_base(self, interval: str, start_ts: int, end_ts: int) -> Optional[str]:
+        """Return the base timeframe to derive ``interval`` from, if resampling applies.
+
+        The finest configured base whose ``resample_window`` still spans the request
+        wins, so a burst of short timeframes shares a single base fetch while longer
+        lookbacks fall through to a coarser base (or to a native fetch).
+        """
+        if not self._resample_bases:
+            return None
+        base_start, base_end = self._base_window(interval, start_ts, end_ts)
+        for base in derivation_bases(interval, self._resample_bases):
+            if -(-(base_end - base_start) // base.period_ms) <= self._resample_window:
+                return base.name
+        return None
+
+    def _base_window(self, interval: str, start_ts: int, end_ts: int) -> Tuple[int, int]:
+        """Base-bar window that covers every ``interval`` bar of the request whole.
+
+        It runs from the open of the first bar to the close of the last (or now, for a bar
+        still forming), so a bar derived for a historical ``end`` aggregates the same base
+        bars as upstream's native one instead of a partial trailing bucket.
+        """
+        timeframe = get_timeframe(interval)
+        now_ms = int(time.time() * 1000)
+        return timeframe.floor(start_ts), min(timeframe.close_time(end_ts) - 1, max(end_ts, now_ms))
+
+    def _derive(self, candles: CandleArrays, base: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        timeframe = get_timeframe(interval)
+        if base != interval:
+            candles = resample_arrays(candles, timeframe.period_ms, timeframe.offset_ms)
+        return candles.between(start_ts - timeframe.period_ms + 1, end_ts)
+
+    def _recent_lookup(self, key: Tuple[str, str], start_ts: int, end_ts: int) -> Optional[CandleArrays]:
+        """Return a covering window fetched within the last ``_RECENT_FETCH_TTL`` seconds."""
+        recent = self._recent.get(key)
+        if recent is None:
+            return None
+        recent_start, recent_end, fetched_at, candles = recent
+        age_ms = (time.monotonic() - fetched_at) * 1000
+        ttl_ms = _RECENT_FETCH_TTL * 1000
+        if age_ms <= ttl_ms and recent_start <= start_ts and end_ts <= recent_end + ttl_ms:
+            return candles.between(start_ts - get_timeframe(key[1]).period_ms + 1, end_ts)
+        return None
+
+    def _recent_save(self, key: Tuple[str, str], start_ts: int, end_ts: int, candles: CandleArrays) -> None:
+        self._recent[key] = (start_ts, end_ts, time.monotonic(), candles)
 
+    def _recent_gap(self, key: Tuple[str, str], start_ts: int, end_ts: int) -> Optional[Tuple[int, int]]:
+        """The older window still missing when a recent fetch covers only the end of the request.
 
-class HyperliquidDataClient:
-    """Thin wrapper around the Hyperliquid Info SDK for fetching historical candles."""
+        Base windows are sized per request, so a longer lookback arriving after a shorter
+        one only fetches the bars before the shorter window instead of all of them again.
+        """
+        recent = self._recent.get(key)
+        if recent is None:
+            return None
+        recent_start, recent_end, fetched_at, _ = recent
+        age_ms = (time.monotonic() - fetched_at) * 1000
+        ttl_ms = _RECENT_FETCH_TTL * 1000
+        if age_ms <= ttl_ms and start_ts < recent_start <= end_ts <= recent_end + ttl_ms:
+            return start_ts, recent_start - 1
+        return None
 
-    def __init__(self, info: Info) -> None:
+    def _recent_prepend(self, key: Tuple[str, str], start_ts: int, end_ts: int, head: CandleArrays) -> CandleArrays:
+        """Extend the recent window back to ``start_ts`` with ``head``; returns the request's window."""
+        recent_start, recent_end, fetched_at, candles = self._recent[key]
+        period_ms = get_timeframe(key[1]).period_ms
+        merged = merge_candles(candles, head, period_ms)
+        if merged is None:
+            merged = CandleArrays.concat([head, candles])
+        self._recent[key] = (start_ts, recent_end, fetched_at, merged)
+        return merged.between(start_ts - period_ms + 1, end_ts)
+
+    def _plan_incremental(
+        self, symbol: str, interval: str, start_ts: int, end_ts: int
+    ) -> Tuple[CandleArrays, Optional[Tuple[int, int]]]:
+        """Load the stored bars for a stream and work out which window is still missing."""
+        assert self._store is not None
+        timeframe = get_timeframe(interval)
+        cached = self._store.load(symbol, interval)
+        return cached, plan_fetch(cached, start_ts, end_ts, timeframe.period_ms, timeframe.offset_ms)
+
+    def _commit_incremental(
+        self,
+        symbol: str,
+        interval: str,
+        start_ts: int,
+        end_ts: int,
+        cached: CandleArrays,
+        fetched: Optional[CandleArrays],
+    ) -> CandleArrays:
+        """Persist newly closed bars and return the requested window."""
+        assert self._store is not None
+        period_ms = get_timeframe(interval).period_ms
+        if fetched is None:
+            return cached.between(start_ts - period_ms + 1, end_ts)
+        now_ms = int(datetime.now(tz=UTC).timestamp() * 1000)
+        merged = merge_candles(cached, fetched, period_ms)
+        if merged is None:
+            # Disjoint from what we hold: an older window leaves the store untouched.
+            merged = fetched
+            if int(fetched.time[-1]) > int(cached.time[-1]):
+                self._store.replace(symbol, interval, closed_candles(fetched, now_ms, period_ms), period_ms)
+        elif len(cached) and len(fetched) and int(fetched.time[0]) < int(cached.time[0]):
+            # The window reached further back than the store: rewrite with the older bars.
+            self._store.replace(symbol, interval, closed_candles(merged, now_ms, period_ms), period_ms)
+        else:
+            self._store.append(symbol, interval, closed_candles(merged, now_ms, period_ms), period_ms)
+        return merged.between(start_ts - period_ms + 1, end_ts)
+
+
+class HyperliquidDataClient(_CandleSource):
+    """Thin wrapper around the Hyperliquid Info SDK for fetching historical candles.
+
+    ``store`` enables the persistent candle store. ``resample_from`` names one or more
+    base timeframes (e.g. ``"1m,15m"``); a base is fetched once per symbol and aggregated
+    locally into any coarser timeframe whose window fits inside ``resample_window`` base
+    bars, using the finest base that fits. Other timeframes are still fetched natively.
+    ``rate_limiter`` meters every upstream call by its request weight. ``live`` serves
+    requests for the latest bars from WebSocket buffers whenever the stream is
+    subscribed and healthy.
+    """
+
+    def __init__(
+        self,
+        info: Info,
+        store: Optional[CandleStore] = None,
+        resample_from: Optional[str | Sequence[str]] = None,
+        resample_window: int = MAX_CANDLES_PER_REQUEST,
+        rate_limiter: Optional[RateLimiter] = None,
+        live: Optional["LiveCandleFeed"] = None,
+    ) -> None:
+        super().__init__(store=store, resample_from=resample_from, resample_window=resample_window, live=live)
         self._info = info
+        self._limiter = rate_limiter
+        self._flight = CandleFlight()
+        self._recent_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._recent_guard = threading.Lock()
 
     @property
     def info(self) -> Info:
         return self._info
 
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._limiter
+
+    def flight_stats(self) -> FlightStats:
+        """Return counters for requests served by an already in-flight fetch."""
+        return self._flight.stats()
+
     def fetch_candles(self, request: CandleRequest) -> pd.DataFrame:
-        """Fetch OHLCV candles and return them as a pandas DataFrame."""
+        """Fetch OHLCV candles and return them as a pandas DataFrame.
+
+        A convenience adapter over :meth:`fetch_arrays`, which the signal generators use.
+        """
         interval = request.interval()
         end_ts = int(request.end_time().timestamp() * 1000)
         start_ts = int(request.start_time().timestamp() * 1000)
-        payload = self._info.candles_snapshot(
-            request.symbol,
+        candles = self._live_window(request, start_ts, end_ts)
+        if candles is None:
+            candles = self._load(request.symbol, interval, start_ts, end_ts)
+        candles = candles.to_frame()
+        if candles.empty:
+            raise RuntimeError(_empty_message(request))
+        return candles
+
+    def fetch_arrays(self, request: CandleRequest) -> CandleArrays:
+        """Fetch OHLCV candles as ``CandleArrays``.
+
+        With a store configured the closed bars are memory-mapped views of the stream
+        file, so no DataFrame is built at all.
+        """
+        interval = request.interval()
+        end_ts = int(request.end_time().timestamp() * 1000)
+        start_ts = int(request.start_time().timestamp() * 1000)
+        candles = self._live_window(request, start_ts, end_ts)
+        if candles is None:
+            candles = self._load(request.symbol, interval, start_ts, end_ts)
+        if candles.empty:
+            raise RuntimeError(_empty_message(request))
+        return candles
+
+    def _load(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        base = self._resample_base(interval, start_ts, end_ts)
+        if base is None:
+            return self._fetch_range(symbol, interval, start_ts, end_ts)
+        candles = self._fetch_range(symbol, base, *self._base_window(interval, start_ts, end_ts))
+        return self._derive(candles, base, interval, start_ts, end_ts)
+
+    def _fetch_range(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        """Fetch a window, reusing a very recent covering fetch when resampling is enabled.
+
+        Derived timeframes of one request all ask for the same base window within
+        milliseconds of each other; the per-stream lock makes them share one upstream call.
+        """
+        if not self._resample_bases:
+            return self._fetch_upstream(symbol, interval, start_ts, end_ts)
+        key = (symbol, interval)
+        with self._recent_guard:
+            lock = self._recent_locks.setdefault(key, threading.Lock())
+        with lock:
+            candles = self._recent_lookup(key, start_ts, end_ts)
+            if candles is None:
+                gap = self._recent_gap(key, start_ts, end_ts)
+                if gap is not None:
+                    return self._recent_prepend(key, start_ts, end_ts, self._fetch_upstream(symbol, interval, *gap))
+                candles = self._fetch_upstream(symbol, interval, start_ts, end_ts)
+                self._recent_save(key, start_ts, end_ts, candles)
+            return candles
+
+    def _fetch_upstream(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        """Fetch through the singleflight so concurrent identical requests share one call."""
+        timeframe = get_timeframe(interval)
+        return self._flight.run(
+            symbol,
             interval,
             start_ts,
             end_ts,
+            timeframe.period_ms,
+            lambda start, end: self._fetch_window(symbol, interval, start, end),
+            offset_ms=timeframe.offset_ms,
         )
-        candles = _normalize_candles(payload)
-        if candles.empty:
-            raise RuntimeError(
-                f"No candle data returned for {request.symbol} at interval {interval} "
-                f"between {request.start_time()} and {request.end_time()}"
-            )
-        return candles
+
+    def _fetch_window(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        if self._store is None:
+            return self.snapshot(symbol, interval, start_ts, end_ts)
+        return self._fetch_incremental(symbol, interval, start_ts, end_ts)
+
+    def _fetch_incremental(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        """Serve closed bars from the store and only request the missing tail upstream."""
+        assert self._store is not None
+        with self._store.lock(symbol, interval):
+            cached, window = self._plan_incremental(symbol, interval, start_ts, end_ts)
+            fetched = None
+            if window is not None:
+                fetched = self.snapshot(symbol, interval, window[0], window[1])
+            return self._commit_incremental(symbol, interval, start_ts, end_ts, cached, fetched)
+
+    def snapshot(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> CandleArrays:
+        """Fetch ``[start_ts, end_ts]`` with one metered ``candles_snapshot`` call.
+
+        The raw window bypasses the store, resampling and request coalescing; it backs off
+        if upstream still answers 429. Synchronous counterpart of the async client's
+        ``candles_snapshot``, returning parsed candles.
+        """
+        period_ms = get_timeframe(interval).period_ms
+        weight = candle_snapshot_weight(start_ts, end_ts, period_ms, MAX_CANDLES_PER_REQUEST)
+        attempt = 0
+        while True:
+            if self._limiter is not None:
+                self._limiter.acquire(weight)
+            try:
+                return parse_candles(self._info.candles_snapshot(symbol, interval, start_ts, end_ts))
+            except ClientError as exc:
+                if not _should_retry_rate_limited(exc, self._limiter, attempt):
+                    raise
+                self._limiter.penalize()
+                attempt += 1
+
+
+def _should_retry_rate_limited(exc: ClientError, limiter: object, attempt: int) -> bool:
+    return exc.status_code == 429 and limiter is not None and attempt < RATE_LIMIT_RETRIES
+
+
+def _empty_message(request: CandleRequest) -> str:
+    return (
+        f"No candle data returned for {request.symbol} at interval {request.timeframe} "
+        f"between {request.start_time()} and {request.end_time()}"
+    )
 
 
 def _normalize_candles(raw: Iterable[dict]) -> pd.DataFrame:
     """Convert candle snapshot data into a typed DataFrame."""
-    records = list(raw)
-    if not records:
-        return pd.DataFrame()
-
-    frame = pd.DataFrame(records)
-    frame["time"] = pd.to_datetime(frame["t"], unit="ms", utc=True)
-    frame = frame.set_index("time").sort_index()
-
-    for column in ("o", "h", "l", "c", "v"):
-        frame[column] = frame[column].astype(float)
-
-    frame = frame.rename(
-        columns={
-            "o": "open",
-            "h": "high",
-            "l": "low",
-            "c": "close",
-            "v": "volume",
-        }
-    )
-    return frame[["open", "high", "low", "close", "volume"]]
+    return parse_candles(raw).to_frame()
+
+
+def build_default_client(
+    base_url: Optional[str] = None,
+    skip_ws: bool = True,
+    store_dir: Optional[os.PathLike | str] = None,
+    resample_from: Optional[str | Sequence[str]] = None,
+    rate_limit: Optional[float] = DEFAULT_WEIGHT_PER_MINUTE,
+    live_streams: Optional[Iterable[Tuple[str, str]]] = None,
+) -> HyperliquidDataClient:
+    """Convenience builder that points at mainnet by default.
 
+    Passing ``store_dir`` enables the on-disk candle store so repeat requests only
+    download bars that closed since the previous call. ``resample_from`` derives coarser
+    timeframes locally from those base timeframes. ``rate_limit`` is the request weight
+    budget per minute (``None`` disables client-side limiting). ``live_streams`` lists
+    (symbol, timeframe) pairs to keep in WebSocket-fed buffers; it implies
+    ``skip_ws=False``.
+    """
+    from .live import LiveCandleFeed, start_live
 
-def build_default_client(base_url: Optional[str] = None, skip_ws: bool = True) -> HyperliquidDataClient:
-    """Convenience builder that points at mainnet by default."""
+    streams = list(live_streams or ())
     target = base_url or constants.MAINNET_API_URL
-    info = Info(target, skip_ws=skip_ws)
-    return HyperliquidDataClient(info)
+    info = Info(target, skip_ws=skip_ws and not streams)
+    store = CandleStore(store_dir) if store_dir is not None else None
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    live = LiveCandleFeed(info) if streams else None
+    client = HyperliquidDataClient(info, store=store, resample_from=resample_from, rate_limiter=limiter, live=live)
+    if live is not None:
+        start_live(client, live, streams)
+    return client
@@ -0,0 +1,159 @@
+"""In-flight deduplication ("singleflight") for candle fetches."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .candles import CandleArrays
+
+FlightKey = Tuple[str, str]
+
+
+@dataclass
+class FlightStats:
+    """Counters describing how many upstream calls coalescing saved."""
+
+    requests: int = 0
+    upstream_calls: int = 0
+    coalesced: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def align_window(start_ts: int, end_ts: int, period_ms: int, offset_ms: int = 0) -> Tuple[int, int]:
+    """Snap a request window to bar boundaries so near-identical requests share a key."""
+    return start_ts - (start_ts - offset_ms) % period_ms, end_ts - (end_ts - offset_ms) % period_ms
+
+
+def _covers(call_start: int, call_end: int, start_ts: int, end_ts: int) -> bool:
+    return call_start <= start_ts and end_ts <= call_end
+
+
+class _Call:
+    __slots__ = ("start", "end", "done", "result", "error")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+        self.done = threading.Event()
+        self.result: Optional[CandleArrays] = None
+        self.error: Optional[BaseException] = None
+
+
+class CandleFlight:
+    """Thread-safe coalescing of concurrent candle fetches.
+
+    A request joins any in-flight fetch for the same (symbol, interval) whose bar-aligned
+    window covers its own, so a 120-bar higher-timeframe lookup can ride on a 250-bar
+    fetch of the same stream. The shared result is sliced per caller.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[FlightKey, List[_Call]] = {}
+        self._stats = FlightStats()
+
+    def stats(self) -> FlightStats:
+        with self._lock:
+            return FlightStats(**self._stats.as_dict())
+
+    def run(
+        self,
+        symbol: str,
+        interval: str,
+        start_ts: int,
+        end_ts: int,
+        period_ms: int,
+        fetch: Callable[[int, int], CandleArrays],
+        offset_ms: int = 0,
+    ) -> CandleArrays:
+        key = (symbol, interval)
+        start, end = align_window(start_ts, end_ts, period_ms, offset_ms)
+        with self._lock:
+            self._stats.requests += 1
+            call = next(
+                (c for c in self._inflight.get(key, ()) if _covers(c.start, c.end, start, end)),
+                None,
+            )
+            leader = call is None
+            if call is None:
+                call = _Call(start, end)
+                self._inflight.setdefault(key, []).append(call)
+                self._stats.upstream_calls += 1
+            else:
+                self._stats.coalesced += 1
+
+        if leader:
+            try:
+                call.result = fetch(start, end)
+            except BaseException as exc:
+                call.error = exc
+            finally:
+                with self._lock:
+                    calls = self._inflight.get(key, [])
+                    calls.remove(call)
+                    if not calls:
+                        self._inflight.pop(key, None)
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        assert call.result is not None
+        return call.result.between(start_ts - period_ms + 1, end_ts)
+
+
+class AsyncCandleFlight:
+    """Event-loop counterpart of :class:`CandleFlight`.
+
+    The upstream fetch runs in its own task and every caller awaits it through
+    ``asyncio.shield``, so one caller being cancelled never cancels the shared fetch.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[FlightKey, List[Tuple[int, int, "asyncio.Task[CandleArrays]"]]] = {}
+        self._stats = FlightStats()
+
+    def stats(self) -> FlightStats:
+        return FlightStats(**self._stats.as_dict())
+
+    async def run(
+        self,
+        symbol: str,
+        interval: str,
+        start_ts: int,
+        end_ts: int,
+        period_ms: int,
+        fetch: Callable[[int, int], Awaitable[CandleArrays]],
+        offset_ms: int = 0,
+    ) -> CandleArrays:
+        key = (symbol, interval)
+        start, end = align_window(start_ts, end_ts, period_ms, offset_ms)
+        self._stats.requests += 1
+        task = None
+        for call_start, call_end, call_task in self._inflight.get(key, ()):
+            if _covers(call_start, call_end, start, end):
+                self._stats.coalesced += 1
+                task = call_task
+                break
+        if task is None:
+            task = asyncio.ensure_future(fetch(start, end))
+            entry = (start, end, task)
+            self._inflight.setdefault(key, []).append(entry)
+            self._stats.upstream_calls += 1
+            task.add_done_callback(lambda _: self._forget(key, entry))
+        result = await asyncio.shield(task)
+        return result.between(start_ts - period_ms + 1, end_ts)
+
+    def _forget(self, key: FlightKey, entry: Tuple[int, int, "asyncio.Task[CandleArrays]"]) -> None:
+        calls = self._inflight.get(key)
+        if calls is None:
+            return
+        calls.remove(entry)
+        if not calls:
+            del self._inflight[key]
@@ -0,0 +1,157 @@
+"""Hedged upstream requests for the async data client.
+
+A hedged call starts the request and, if it has not answered within a delay derived
+from recent latencies (the 95th percentile by default), starts an identical second
+request and returns whichever succeeds first. That trims the tail caused by one slow
+upstream response at the cost of a few percent extra requests. Hedges are only sent
+while the rate-limit budget has headroom, because a hedge spends weight like any other
+request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgePolicy:
+    """When to hedge.
+
+    The hedge delay is the ``quantile`` of the last ``window`` latencies clamped to
+    ``[min_delay, max_delay]`` seconds; nothing is hedged until ``min_samples`` calls
+    have completed. ``budget_floor`` is the fraction of the rate-limit bucket that must
+    remain after paying for the hedge.
+    """
+
+    quantile: float = 0.95
+    window: int = 256
+    min_samples: int = 20
+    min_delay: float = 0.02
+    max_delay: float = 2.0
+    budget_floor: float = 0.25
+
+
+@dataclass
+class HedgeStats:
+    """Counters describing how often hedging fired and what it saved."""
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    suppressed: int = 0
+    saved_seconds: float = 0.0
+    delay_seconds: Optional[float] = None
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {**asdict(self), "hedge_rate": self.hedge_rate}
+
+
+class LatencyWindow:
+    """Rolling window of recent call latencies in seconds."""
+
+    def __init__(self, size: int) -> None:
+        self._samples: Deque[float] = collections.deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class AsyncHedger:
+    """Run coroutines with at most one hedge each, following a :class:`HedgePolicy`."""
+
+    def __init__(self, policy: Optional[HedgePolicy] = None) -> None:
+        self.policy = policy or HedgePolicy()
+        self._latencies = LatencyWindow(self.policy.window)
+        self._stats = HedgeStats()
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or ``None`` while there are too few samples."""
+        if len(self._latencies) < self.policy.min_samples:
+            return None
+        observed = self._latencies.quantile(self.policy.quantile)
+        assert observed is not None
+        return min(self.policy.max_delay, max(self.policy.min_delay, observed))
+
+    def stats(self) -> HedgeStats:
+        return HedgeStats(**{**asdict(self._stats), "delay_seconds": self.delay()})
+
+    async def run(self, call: Callable[[], Awaitable[T]], may_hedge: Callable[[], bool] = lambda: True) -> T:
+        """Await ``call()``, hedging with a second ``call()`` if it is slow.
+
+        ``may_hedge`` is consulted when the delay expires; returning False (e.g. because
+        the rate-limit budget is tight) lets the first request run to completion alone.
+        """
+        self._stats.requests += 1
+        started = time.monotonic()
+        primary = asyncio.ensure_future(call())
+        try:
+            delay = self.delay()
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done:
+                    if may_hedge():
+                        return await self._race(primary, call, started)
+                    self._stats.suppressed += 1
+            result = await primary
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        self._latencies.add(time.monotonic() - started)
+        return result
+
+    async def _race(self, primary: "asyncio.Future[T]", call: Callable[[], Awaitable[T]], started: float) -> T:
+        self._stats.hedged += 1
+        hedge_started = time.monotonic()
+        hedge = asyncio.ensure_future(call())
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    finished = time.monotonic()
+                    if task is hedge:
+                        self._stats.hedge_wins += 1
+                        self._latencies.add(finished - hedge_started)
+                        # Let the slow primary finish in the background to measure the saving.
+                        primary.add_done_callback(lambda task: self._record_saving(task, started, finished))
+                        pending.discard(primary)
+                    else:
+                        self._latencies.add(finished - started)
+                    for other in pending:
+                        other.cancel()
+                    return task.result()
+        except asyncio.CancelledError:
+            primary.cancel()
+            hedge.cancel()
+            raise
+        assert error is not None
+        raise error
+
+    def _record_saving(self, primary: "asyncio.Future[T]", started: float, hedge_finished: float) -> None:
+        if primary.cancelled() or primary.exception() is not None:
+            return
+        self._stats.saved_seconds += max(0.0, time.monotonic() - hedge_finished)
+        self._latencies.add(time.monotonic() - started)
@@ -0,0 +1,151 @@
+"""Paginated long-history candle fetching.
+
+Upstream caps a ``candleSnapshot`` response at :data:`MAX_CANDLES_PER_REQUEST` bars, so
+deep history is split into bar-aligned pages that are fetched concurrently (each page
+still passes through the client's rate limiter) and stitched back together in order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .candles import CandleArrays, parse_candles
+from .data import MAX_CANDLES_PER_REQUEST, HyperliquidDataClient
+from .timeframes import Timeframe, get_timeframe
+
+if TYPE_CHECKING:
+    from .async_data import AsyncHyperliquidDataClient
+
+DEFAULT_CONCURRENCY = 8
+
+
+def plan_chunks(
+    start_ts: int,
+    end_ts: int,
+    period_ms: int,
+    chunk_bars: int = MAX_CANDLES_PER_REQUEST,
+    offset_ms: int = 0,
+) -> List[Tuple[int, int]]:
+    """Split ``[start_ts, end_ts]`` into bar-aligned windows of at most ``chunk_bars`` bars."""
+    if end_ts < start_ts:
+        return []
+    span = chunk_bars * period_ms
+    first = start_ts - (start_ts - offset_ms) % period_ms
+    return [(chunk_start, min(chunk_start + span - 1, end_ts)) for chunk_start in range(first, end_ts + 1, span)]
+
+
+def _window_ms(timeframe: str, start: datetime, end: Optional[datetime]) -> Tuple[int, int, Timeframe]:
+    interval = get_timeframe(timeframe)
+    end_ts = int((end or datetime.now(tz=UTC)).timestamp() * 1000)
+    start_ts = int(start.timestamp() * 1000)
+    return start_ts, end_ts, interval
+
+
+class _Stitcher:
+    """Drop bars already emitted so overlapping pages never duplicate a bar."""
+
+    def __init__(self, start_ts: int, end_ts: int, period_ms: int) -> None:
+        self._lower = start_ts - period_ms + 1
+        self._end_ts = end_ts
+        self._last: Optional[int] = None
+
+    def __call__(self, chunk: CandleArrays) -> CandleArrays:
+        lower = self._lower if self._last is None else self._last + 1
+        chunk = chunk.between(lower, self._end_ts)
+        if len(chunk):
+            self._last = int(chunk.time[-1])
+        return chunk
+
+
+async def stream_history(
+    client: "AsyncHyperliquidDataClient",
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+    *,
+    chunk_bars: int = MAX_CANDLES_PER_REQUEST,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[CandleArrays]:
+    """Yield deduplicated pages of candles in chronological order.
+
+    Up to ``concurrency`` pages are in flight at once. A page is yielded as soon as it and
+    every earlier page have arrived, so consumers can start writing a backfill before
+    the last page lands.
+    """
+    start_ts, end_ts, interval = _window_ms(timeframe, start, end)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(window: Tuple[int, int]) -> CandleArrays:
+        async with semaphore:
+            return parse_candles(await client.candles_snapshot(symbol, timeframe, window[0], window[1]))
+
+    windows = plan_chunks(start_ts, end_ts, interval.period_ms, chunk_bars, interval.offset_ms)
+    tasks = [asyncio.ensure_future(fetch(window)) for window in windows]
+    stitch = _Stitcher(start_ts, end_ts, interval.period_ms)
+    try:
+        for task in tasks:
+            chunk = stitch(await task)
+            if len(chunk):
+                yield chunk
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_history(
+    client: "AsyncHyperliquidDataClient",
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+    *,
+    chunk_bars: int = MAX_CANDLES_PER_REQUEST,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> CandleArrays:
+    """Fetch ``[start, end]`` in full and return one contiguous ``CandleArrays``."""
+    chunks = [
+        chunk
+        async for chunk in stream_history(
+            client, symbol, timeframe, start, end, chunk_bars=chunk_bars, concurrency=concurrency
+        )
+    ]
+    return CandleArrays.concat(chunks)
+
+
+def iter_history(
+    client: HyperliquidDataClient,
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+    *,
+    chunk_bars: int = MAX_CANDLES_PER_REQUEST,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Iterator[CandleArrays]:
+    """Thread-pool variant of :func:`stream_history` for the synchronous client."""
+    start_ts, end_ts, interval = _window_ms(timeframe, start, end)
+    windows = plan_chunks(start_ts, end_ts, interval.period_ms, chunk_bars, interval.offset_ms)
+    stitch = _Stitcher(start_ts, end_ts, interval.period_ms)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(client.snapshot, symbol, timeframe, window[0], window[1]) for window in windows]
+        try:
+            for future in futures:
+                chunk = stitch(future.result())
+                if len(chunk):
+                    yield chunk
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def history_gaps(candles: CandleArrays, period_ms: int) -> np.ndarray:
+    """Return the open times after which at least one bar is missing."""
+    if len(candles) < 2:
+        return np.empty(0, dtype=np.int64)
+    return candles.time[:-1][np.diff(candles.time) > period_ms]
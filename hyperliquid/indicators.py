@@ -0,0 +1,178 @@
+"""Declarative indicator registry evaluated as a dependency graph.
+
+Each :class:`Indicator` names its outputs, the series it reads (candle columns or other
+indicators' outputs) and its parameters. :meth:`IndicatorRegistry.evaluate` resolves the
+requested outputs to the nodes they need, orders them topologically and runs every
+node at most once per candle set, so indicators that build on the same intermediate
+(the MACD call behind its three outputs, an ATR reused by a derived ratio) share it
+instead of recomputing it.
+
+Adding an indicator to the signal payload is one registration::
+
+    @INDICATORS.register("natr", inputs=("atr", "close"))
+    def _natr(atr, close):
+        return 100.0 * atr / close
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import talib  # type: ignore[import]
+except ImportError as exc:  # pragma: no cover
+    raise ImportError("TA-Lib is required. Install it with 'pip install TA-Lib'.") from exc
+
+from .candles import column
+
+SOURCES = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(frozen=True)
+class Indicator:
+    """One node of the graph: ``compute(*inputs, **params)`` returns one series per output."""
+
+    outputs: Tuple[str, ...]
+    inputs: Tuple[str, ...]
+    compute: Callable[..., Any]
+    params: Mapping[str, Any] = field(default_factory=dict)
+
+
+class IndicatorRegistry:
+    """Indicators by output name plus the ordered list reported in signal payloads."""
+
+    def __init__(self) -> None:
+        self._nodes: Dict[str, Indicator] = {}
+        self._reported: List[str] = []
+
+    @property
+    def reported(self) -> Tuple[str, ...]:
+        """Names :meth:`latest` returns by default, in payload order."""
+        return tuple(self._reported)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._nodes or name in SOURCES
+
+    def add(self, indicator: Indicator, report: bool = True) -> Indicator:
+        for name in indicator.outputs:
+            if name in self:
+                raise ValueError(f"Indicator output '{name}' is already defined")
+        for name in indicator.inputs:
+            if name not in self:
+                raise ValueError(f"Unknown indicator input '{name}'")
+        for name in indicator.outputs:
+            self._nodes[name] = indicator
+        if report:
+            self._reported.extend(indicator.outputs)
+        return indicator
+
+    def register(
+        self,
+        outputs: str | Sequence[str],
+        inputs: Sequence[str],
+        compute: Optional[Callable[..., Any]] = None,
+        report: bool = True,
+        **params: Any,
+    ):
+        """Register ``compute`` for ``outputs``; without ``compute``, act as a decorator.
+
+        Inputs must already be defined, which keeps the graph acyclic. ``report=False``
+        registers an intermediate that other indicators can depend on without adding it
+        to the payload.
+        """
+        names = (outputs,) if isinstance(outputs, str) else tuple(outputs)
+
+        def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+            self.add(Indicator(names, tuple(inputs), func, dict(params)), report=report)
+            return func
+
+        if compute is None:
+            return decorate
+        decorate(compute)
+        return None
+
+    def report(self, *names: str) -> None:
+        """Add existing series (e.g. a candle column) to the payload."""
+        for name in names:
+            if name not in self:
+                raise ValueError(f"Unknown indicator '{name}'")
+            if name not in self._reported:
+                self._reported.append(name)
+
+    def plan(self, names: Iterable[str]) -> List[Indicator]:
+        """Return the nodes needed for ``names`` with every node after its inputs."""
+        ordered: List[Indicator] = []
+        seen: set = set()
+
+        def visit(name: str) -> None:
+            if name in SOURCES:
+                return
+            node = self._nodes.get(name)
+            if node is None:
+                raise KeyError(f"Unknown indicator '{name}'")
+            if id(node) in seen:
+                return
+            seen.add(id(node))
+            for dependency in node.inputs:
+                visit(dependency)
+            ordered.append(node)
+
+        for name in names:
+            visit(name)
+        return ordered
+
+    def evaluate(self, candles, names: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """Compute full series for ``names`` (the reported set by default)."""
+        names = list(self._reported if names is None else names)
+        series: Dict[str, np.ndarray] = {}
+
+        def get(name: str) -> np.ndarray:
+            if name not in series:
+                series[name] = column(candles, name)
+            return series[name]
+
+        for node in self.plan(names):
+            result = node.compute(*(get(name) for name in node.inputs), **node.params)
+            if len(node.outputs) == 1:
+                result = (result,)
+            series.update(zip(node.outputs, result))
+        return {name: get(name) for name in names}
+
+    def latest(self, candles, names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """Latest valid value of each of ``names`` (the reported set by default)."""
+        return {name: latest_valid(values) for name, values in self.evaluate(candles, names).items()}
+
+
+def latest_valid(series: Iterable[float]) -> float:
+    """Return the last non-NaN value of ``series``."""
+    arr = np.asarray(series, dtype=float)
+    if len(arr) and not np.isnan(arr[-1]):
+        return float(arr[-1])
+    arr = arr[~np.isnan(arr)]
+    if not len(arr):
+        raise ValueError("Indicator series contains only NaN values")
+    return float(arr[-1])
+
+
+def _dmi_outputs(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int) -> Tuple[np.ndarray, ...]:
+    return (
+        talib.ADX(high, low, close, timeperiod=timeperiod),
+        talib.PLUS_DI(high, low, close, timeperiod=timeperiod),
+        talib.MINUS_DI(high, low, close, timeperiod=timeperiod),
+    )
+
+
+# The indicators behind every signal; payload order matches ``SignalPayload.indicators``.
+INDICATORS = IndicatorRegistry()
+INDICATORS.register("ema20", ("close",), talib.EMA, timeperiod=20)
+INDICATORS.register("ema50", ("close",), talib.EMA, timeperiod=50)
+INDICATORS.register(("adx", "plus_di", "minus_di"), ("high", "low", "close"), _dmi_outputs, timeperiod=14)
+INDICATORS.register(
+    ("macd", "macd_signal", "macd_hist"), ("close",), talib.MACD, fastperiod=12, slowperiod=26, signalperiod=9
+)
+INDICATORS.register("rsi", ("close",), talib.RSI, timeperiod=14)
+INDICATORS.register("atr", ("high", "low", "close"), talib.ATR, timeperiod=14)
+INDICATORS.report("close")
@@ -0,0 +1,232 @@
+"""WebSocket-driven rolling candle buffers.
+
+A :class:`LiveCandleFeed` subscribes to Hyperliquid ``candle`` streams and keeps the
+last N bars of each (symbol, timeframe) in memory. Data clients configured with a feed
+answer "latest" requests straight from those buffers, so the request path makes no
+upstream round trip while the stream is healthy. Each buffer also carries a
+:class:`~hyperliquid.streaming.StreamingIndicators` engine advanced as bars close, so
+the indicators of the forming bar cost one O(1) step instead of a TA-Lib pass.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol, Tuple
+
+import numpy as np
+
+from .candles import PRICE_COLUMNS, CandleArrays
+from .data import CandleRequest
+from .ringbuffer import OHLCVRingBuffer
+from .streaming import StreamingIndicators
+from .timeframes import get_timeframe
+
+StreamKey = Tuple[str, str]
+
+DEFAULT_CAPACITY = 500
+# Seconds without a message after which a stream is considered stale.
+DEFAULT_STALE_AFTER = 120.0
+
+
+class Subscriber(Protocol):
+    """The part of ``hyperliquid.info.Info`` used by the feed."""
+
+    def subscribe(self, subscription: Dict[str, Any], callback: Callable[[Any], None]) -> int: ...
+
+    def unsubscribe(self, subscription: Dict[str, Any], subscription_id: int) -> bool: ...
+
+
+class LiveCandleBuffer:
+    """Bounded, time-ordered buffer of the most recent bars of one stream."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._ring = OHLCVRingBuffer(capacity)
+        self._engine = StreamingIndicators()
+        self.last_update: Optional[float] = None
+
+    @property
+    def capacity(self) -> int:
+        return self._ring.capacity
+
+    @property
+    def nbytes(self) -> int:
+        return self._ring.nbytes
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    @property
+    def last_time(self) -> Optional[int]:
+        return self._ring.last_time
+
+    def apply(self, record: Dict[str, Any]) -> None:
+        """Insert a streamed candle, replacing the forming bar when the open time matches."""
+        # Late updates for older bars are ignored; closed bars do not change.
+        open_time = int(record["t"])
+        last = self._ring.last_bar()
+        if last is not None and open_time > last[0]:
+            # A new bar opened, so the previous one is closed: commit it to the indicators.
+            self._engine.push(last[2], last[3], last[4])
+        self._ring.upsert(
+            open_time,
+            float(record["o"]),
+            float(record["h"]),
+            float(record["l"]),
+            float(record["c"]),
+            float(record["v"]),
+        )
+        self.last_update = time.monotonic()
+
+    def seed(self, candles: CandleArrays) -> None:
+        """Backfill older bars from a REST snapshot without overriding streamed bars."""
+        live = self._ring.window()
+        if len(live):
+            candles = candles.slice(0, int(np.searchsorted(candles.time, live.time[0])))
+        self._ring = OHLCVRingBuffer.from_arrays(CandleArrays.concat([candles, live]), self._ring.capacity)
+        window = self._ring.window()
+        self._engine = StreamingIndicators.from_candles(window.slice(0, len(window) - 1))
+
+    def indicators(self) -> Optional[Dict[str, float]]:
+        """Indicators as of the newest (possibly still forming) bar, once warmed up."""
+        last = self._ring.last_bar()
+        if last is None or not self._engine.ready:
+            return None
+        return self._engine.peek(last[2], last[3], last[4])
+
+    def to_arrays(self) -> CandleArrays:
+        """Return a snapshot that later stream updates cannot mutate."""
+        window = self._ring.window()
+        return CandleArrays(*(np.array(window[name]) for name in ("time", *PRICE_COLUMNS)))
+
+
+class LiveCandleFeed:
+    """Maintain live candle buffers for a set of streams.
+
+    ``subscriber`` is normally an ``Info`` built with ``skip_ws=False``; tests can pass any
+    object with the same ``subscribe`` signature and push messages through the callback.
+    """
+
+    def __init__(
+        self,
+        subscriber: Subscriber,
+        capacity: int = DEFAULT_CAPACITY,
+        stale_after: float = DEFAULT_STALE_AFTER,
+    ) -> None:
+        self._subscriber = subscriber
+        self._capacity = capacity
+        self._stale_after = stale_after
+        self._lock = threading.Lock()
+        self._buffers: Dict[StreamKey, LiveCandleBuffer] = {}
+        self._subscriptions: Dict[StreamKey, Tuple[Dict[str, Any], int]] = {}
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def streams(self) -> Iterable[StreamKey]:
+        with self._lock:
+            return list(self._buffers)
+
+    def subscribe(self, symbol: str, timeframe: str) -> None:
+        """Start streaming ``symbol``/``timeframe`` into a fresh buffer."""
+        key = (symbol, timeframe)
+        with self._lock:
+            if key in self._buffers:
+                return
+            self._buffers[key] = LiveCandleBuffer(self._capacity)
+        subscription = {"type": "candle", "coin": symbol, "interval": timeframe}
+        subscription_id = self._subscriber.subscribe(subscription, self.handle_message)
+        with self._lock:
+            self._subscriptions[key] = (subscription, subscription_id)
+
+    def seed(self, symbol: str, timeframe: str, candles: CandleArrays) -> None:
+        """Backfill a subscribed stream with REST history.
+
+        Seed after subscribing: bars streamed in the meantime take precedence, so no bar
+        closing between the snapshot and the first message is lost.
+        """
+        with self._lock:
+            buffer = self._buffers.get((symbol, timeframe))
+            if buffer is not None:
+                buffer.seed(candles)
+
+    def unsubscribe(self, symbol: str, timeframe: str) -> None:
+        key = (symbol, timeframe)
+        with self._lock:
+            self._buffers.pop(key, None)
+            entry = self._subscriptions.pop(key, None)
+        if entry is not None:
+            self._subscriber.unsubscribe(*entry)
+
+    def close(self) -> None:
+        for symbol, timeframe in list(self.streams()):
+            self.unsubscribe(symbol, timeframe)
+
+    def handle_message(self, message: Dict[str, Any]) -> None:
+        """WebSocket callback: apply one ``candle`` channel message."""
+        if message.get("channel") != "candle":
+            return
+        data = message.get("data")
+        records = data if isinstance(data, list) else [data]
+        with self._lock:
+            for record in records:
+                if not record:
+                    continue
+                buffer = self._buffers.get((record["s"], record["i"]))
+                if buffer is not None:
+                    buffer.apply(record)
+
+    def window(self, symbol: str, timeframe: str, start_ts: int, end_ts: int) -> Optional[CandleArrays]:
+        """Return the buffered bars covering ``[start_ts, end_ts]``, or ``None``.
+
+        ``None`` means the caller must go upstream: the stream is unknown, has gone
+        stale, or does not reach back far enough.
+        """
+        with self._lock:
+            buffer = self._buffers.get((symbol, timeframe))
+            if buffer is None or buffer.last_update is None or not len(buffer):
+                return None
+            if time.monotonic() - buffer.last_update > self._stale_after:
+                return None
+            candles = buffer.to_arrays()
+        interval = get_timeframe(timeframe)
+        if int(candles.time[0]) > interval.floor(start_ts):
+            return None
+        return candles.between(start_ts - interval.period_ms + 1, end_ts)
+
+    def indicators(self, symbol: str, timeframe: str, bar_time: Optional[int] = None) -> Optional[Dict[str, float]]:
+        """Return streaming indicators for the newest bar of a healthy stream, or ``None``.
+
+        With ``bar_time`` the values are only returned while that is still the newest
+        bar's open time, so they line up with a window read a moment earlier.
+        """
+        with self._lock:
+            buffer = self._buffers.get((symbol, timeframe))
+            if buffer is None or buffer.last_update is None or not len(buffer):
+                return None
+            if time.monotonic() - buffer.last_update > self._stale_after:
+                return None
+            if bar_time is not None and buffer.last_time != bar_time:
+                return None
+            return buffer.indicators()
+
+
+def start_live(client, feed: LiveCandleFeed, streams: Iterable[StreamKey]) -> None:
+    """Subscribe ``streams`` and seed them through a synchronous data client."""
+    for symbol, timeframe in streams:
+        feed.subscribe(symbol, timeframe)
+        feed.seed(symbol, timeframe, client.fetch_arrays(CandleRequest(symbol, timeframe, lookback=feed.capacity)))
+
+
+async def start_live_async(client, feed: LiveCandleFeed, streams: Iterable[StreamKey]) -> None:
+    """Subscribe ``streams`` and seed them concurrently through an async data client."""
+    streams = list(streams)
+    for symbol, timeframe in streams:
+        feed.subscribe(symbol, timeframe)
+    seeds = await asyncio.gather(
+        *(client.fetch_arrays(CandleRequest(symbol, timeframe, lookback=feed.capacity)) for symbol, timeframe in streams)
+    )
+    for (symbol, timeframe), candles in zip(streams, seeds):
+        feed.seed(symbol, timeframe, candles)
@@ -0,0 +1,229 @@
+"""Local stand-in for the Hyperliquid ``/info`` endpoint, for load testing.
+
+The app answers ``candleSnapshot``, ``allMids``, ``meta`` and ``spotMeta`` from
+deterministic synthetic data or from a recorded cassette, with configurable latency,
+error rate and rate limiting. Run it with::
+
+    python -m hyperliquid.mock_server --port 8099 --universe 200 --latency-ms 40 --jitter 0.5
+
+and point ``build_default_client(base_url="http://127.0.0.1:8099")`` or the ``api_url``
+query parameter of ``main.py`` at it. In-process, ``httpx.ASGITransport(create_app())``
+can be passed as ``transport`` to ``build_async_client`` without opening a socket.
+
+Synthetic prices are a pure function of (coin, time): overlapping windows return
+identical bars and every timeframe of a coin shares the same open/close path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from .cassette import Cassette, CassetteMiss, jittered_latency
+from .data import MAX_CANDLES_PER_REQUEST
+from .ratelimit import TokenBucket, info_request_weight
+from .timeframes import get_timeframe
+
+MAJORS = ["BTC", "ETH", "SOL", "HYPE", "XRP", "DOGE", "AVAX", "LINK"]
+
+_DAY_MS = 86_400_000
+
+
+@dataclass
+class MockServerConfig:
+    """Behaviour of the stand-in server.
+
+    ``latency_ms`` is the median response delay and ``jitter`` the sigma of its
+    log-normal spread. ``error_rate`` and ``rate_limit_rate`` are the probabilities of
+    answering 500 and 429. ``weight_per_minute`` additionally enforces the real weight
+    budget and answers 429 once it is spent.
+    """
+
+    universe: int = len(MAJORS)
+    latency_ms: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    weight_per_minute: Optional[float] = None
+    cassette: Optional[Cassette] = None
+    seed: int = 7
+
+
+def universe_names(size: int) -> List[str]:
+    return MAJORS[:size] + [f"COIN{index}" for index in range(max(0, size - len(MAJORS)))]
+
+
+def _hash_noise(values: np.ndarray, salt: float) -> np.ndarray:
+    """Deterministic pseudo-random numbers in ``[0, 1)`` for each element of ``values``."""
+    x = np.sin(values * 12.9898 + salt) * 43758.5453
+    return x - np.floor(x)
+
+
+def _log_price(coin_seed: int, times: np.ndarray) -> np.ndarray:
+    days = times / _DAY_MS
+    phase = (coin_seed % 1000) / 1000 * 2 * np.pi
+    return (
+        np.log(10 + coin_seed % 50_000)
+        + 0.15 * np.sin(2 * np.pi * days / 90 + phase)
+        + 0.05 * np.sin(2 * np.pi * days / 7 + 2 * phase)
+        + 0.01 * np.sin(2 * np.pi * days + 3 * phase)
+        + 0.004 * np.sin(2 * np.pi * days * 24 / 5 + phase)
+    )
+
+
+def synthetic_candles(coin: str, interval: str, start_ts: int, end_ts: int) -> List[Dict[str, Any]]:
+    """Return ``candleSnapshot`` records for bars opening within ``[start_ts, end_ts]``."""
+    timeframe = get_timeframe(interval)
+    period_ms = timeframe.period_ms
+    first = timeframe.ceil(start_ts)
+    if end_ts < first:
+        return []
+    count = min((end_ts - first) // period_ms + 1, MAX_CANDLES_PER_REQUEST)
+    last = timeframe.floor(end_ts)
+    opens = np.arange(last - (count - 1) * period_ms, last + 1, period_ms, dtype=np.int64)
+    seed = zlib.crc32(coin.encode())
+    open_price = np.exp(_log_price(seed, opens.astype(np.float64)))
+    close_price = np.exp(_log_price(seed, (opens + period_ms).astype(np.float64)))
+    scale = np.sqrt(period_ms / 60_000) * 0.0008
+    wick_high = _hash_noise(opens / period_ms, seed % 97) * scale
+    wick_low = _hash_noise(opens / period_ms, seed % 89 + 1) * scale
+    high = np.maximum(open_price, close_price) * (1 + wick_high)
+    low = np.minimum(open_price, close_price) * (1 - wick_low)
+    volume = (1 + 9 * _hash_noise(opens / period_ms, seed % 83 + 2)) * period_ms / 60_000
+    trades = (volume * 7).astype(np.int64)
+    return [
+        {
+            "t": int(t),
+            "T": int(t) + period_ms - 1,
+            "s": coin,
+            "i": interval,
+            "o": f"{o:.6g}",
+            "c": f"{c:.6g}",
+            "h": f"{h:.6g}",
+            "l": f"{lo:.6g}",
+            "v": f"{v:.4f}",
+            "n": int(n),
+        }
+        for t, o, c, h, lo, v, n in zip(opens, open_price, close_price, high, low, volume, trades)
+    ]
+
+
+def _mid(coin: str, now_ms: int) -> float:
+    return float(np.exp(_log_price(zlib.crc32(coin.encode()), np.array([float(now_ms)])))[0])
+
+
+class _MockInfo:
+    def __init__(self, config: MockServerConfig) -> None:
+        self.config = config
+        self.names = universe_names(config.universe)
+        self.stats: Counter = Counter()
+        self._rng = random.Random(config.seed)
+        self._latency = jittered_latency(config.latency_ms / 1000, config.jitter, config.seed)
+        self._bucket = (
+            TokenBucket(config.weight_per_minute, config.weight_per_minute / 60.0)
+            if config.weight_per_minute
+            else None
+        )
+
+    def answer(self, payload: Dict[str, Any], now_ms: int) -> Any:
+        request_type = payload.get("type")
+        if self.config.cassette is not None:
+            try:
+                return self.config.cassette.lookup(payload)
+            except CassetteMiss:
+                pass
+        if request_type == "candleSnapshot":
+            req = payload["req"]
+            return synthetic_candles(req["coin"], req["interval"], int(req["startTime"]), int(req["endTime"]))
+        if request_type == "allMids":
+            return {name: f"{_mid(name, now_ms):.6g}" for name in self.names}
+        if request_type == "meta":
+            return {"universe": [{"name": name, "szDecimals": 2, "maxLeverage": 20} for name in self.names]}
+        if request_type == "spotMeta":
+            return {"universe": [], "tokens": []}
+        raise KeyError(request_type)
+
+    async def handle(self, payload: Dict[str, Any], now_ms: int) -> Response:
+        request_type = str(payload.get("type"))
+        self.stats["requests"] += 1
+        self.stats[f"type:{request_type}"] += 1
+        delay = self._latency()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        roll = self._rng.random()
+        if roll < self.config.error_rate:
+            self.stats["errors"] += 1
+            return Response("Internal server error", status_code=500)
+        if roll < self.config.error_rate + self.config.rate_limit_rate:
+            self.stats["rate_limited"] += 1
+            return JSONResponse(None, status_code=429)
+        try:
+            body = self.answer(payload, now_ms)
+        except (KeyError, TypeError, ValueError):
+            self.stats["bad_requests"] += 1
+            return JSONResponse(None, status_code=422)
+        if self._bucket is not None:
+            items = len(body) if isinstance(body, list) else 0
+            if self._bucket.try_take(info_request_weight(request_type, items)) > 0:
+                self.stats["rate_limited"] += 1
+                return JSONResponse(None, status_code=429)
+        return JSONResponse(body)
+
+
+def create_app(config: Optional[MockServerConfig] = None) -> FastAPI:
+    """Build the stand-in ASGI app; ``GET /stats`` reports request and error counters."""
+    mock = _MockInfo(config or MockServerConfig())
+    app = FastAPI(title="Hyperliquid /info stand-in")
+
+    @app.post("/info")
+    async def info(request: Request) -> Response:
+        return await mock.handle(await request.json(), int(time.time() * 1000))
+
+    @app.get("/stats")
+    def stats() -> Dict[str, int]:
+        return dict(mock.stats)
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a local Hyperliquid /info stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--universe", type=int, default=len(MAJORS), help="number of listed coins")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="median response latency")
+    parser.add_argument("--jitter", type=float, default=0.0, help="log-normal sigma of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of a 500 response")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="probability of a 429 response")
+    parser.add_argument("--weight-per-minute", type=float, default=None, help="enforce a request weight budget")
+    parser.add_argument("--cassette", default=None, help="serve recorded responses first")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = MockServerConfig(
+        universe=args.universe,
+        latency_ms=args.latency_ms,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        weight_per_minute=args.weight_per_minute,
+        cassette=Cassette.load(args.cassette) if args.cassette else None,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
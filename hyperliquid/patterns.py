@@ -0,0 +1,125 @@
+"""Vectorized candlestick pattern detection.
+
+Every supported pattern is evaluated for every bar of an OHLC array at once with NumPy
+comparisons, so a backtest or historical replay gets the pattern of each bar in one
+pass. The live signal path reads the last element.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .candles import column
+
+# Bars a pattern needs before it can be reported (the three-bar patterns).
+MIN_BARS = 3
+
+
+class Pattern(IntEnum):
+    """Pattern codes in detection priority order; ``NONE`` is 0."""
+
+    NONE = 0
+    THREE_WHITE_SOLDIERS = 1
+    THREE_BLACK_CROWS = 2
+    BULLISH_ENGULFING = 3
+    BEARISH_ENGULFING = 4
+    BULLISH_PIN_BAR = 5
+    BEARISH_PIN_BAR = 6
+    INSIDE_BAR = 7
+    DOJI = 8
+
+
+PATTERN_INFO: Dict[Pattern, Dict[str, Any]] = {
+    Pattern.THREE_WHITE_SOLDIERS: {"name": "Three White Soldiers", "bias": "Long", "confidence": "high", "candleCount": 3},
+    Pattern.THREE_BLACK_CROWS: {"name": "Three Black Crows", "bias": "Short", "confidence": "high", "candleCount": 3},
+    Pattern.BULLISH_ENGULFING: {"name": "Bullish Engulfing", "bias": "Long", "confidence": "medium", "candleCount": 2},
+    Pattern.BEARISH_ENGULFING: {"name": "Bearish Engulfing", "bias": "Short", "confidence": "medium", "candleCount": 2},
+    Pattern.BULLISH_PIN_BAR: {"name": "Hammer (Pin Bar)", "bias": "Long", "confidence": "medium", "candleCount": 1},
+    Pattern.BEARISH_PIN_BAR: {"name": "Shooting Star (Pin Bar)", "bias": "Short", "confidence": "medium", "candleCount": 1},
+    Pattern.INSIDE_BAR: {"name": "Inside Bar", "bias": "Breakout", "confidence": "neutral", "candleCount": 2},
+    Pattern.DOJI: {"name": "Doji", "bias": "Neutral", "confidence": "low", "candleCount": 1},
+}
+
+
+def pattern_masks(candles) -> Dict[Pattern, np.ndarray]:
+    """Return one boolean array per pattern marking the bars that complete it.
+
+    Bars without enough history for a pattern are False for it.
+    """
+    opens = column(candles, "open")
+    highs = column(candles, "high")
+    lows = column(candles, "low")
+    closes = column(candles, "close")
+
+    green = closes >= opens
+    red = closes < opens
+    body = np.abs(closes - opens)
+    total = highs - lows
+    ranged = total != 0
+    lower_wick = np.minimum(opens, closes) - lows
+    upper_wick = highs - np.maximum(opens, closes)
+
+    # Two-bar comparisons: index ``i`` of these compares bar ``i + 1`` with bar ``i``.
+    opens_up = opens[1:] > opens[:-1]
+    closes_up = closes[1:] > closes[:-1]
+    opens_down = opens[1:] < opens[:-1]
+    closes_down = closes[1:] < closes[:-1]
+
+    def pairs(mask: np.ndarray) -> np.ndarray:
+        return _shifted(mask, 1, len(opens))
+
+    def triples(mask: np.ndarray) -> np.ndarray:
+        return _shifted(mask, 2, len(opens))
+
+    return {
+        Pattern.THREE_WHITE_SOLDIERS: triples(
+            green[:-2] & green[1:-1] & green[2:] & opens_up[:-1] & opens_up[1:] & closes_up[:-1] & closes_up[1:]
+        ),
+        Pattern.THREE_BLACK_CROWS: triples(
+            red[:-2] & red[1:-1] & red[2:] & opens_down[:-1] & opens_down[1:] & closes_down[:-1] & closes_down[1:]
+        ),
+        Pattern.BULLISH_ENGULFING: pairs(
+            ~green[:-1] & green[1:] & (opens[1:] <= closes[:-1]) & (closes[1:] >= opens[:-1])
+        ),
+        Pattern.BEARISH_ENGULFING: pairs(
+            green[:-1] & ~green[1:] & (opens[1:] >= closes[:-1]) & (closes[1:] <= opens[:-1])
+        ),
+        Pattern.BULLISH_PIN_BAR: (
+            ranged & green & (lower_wick >= total * 0.5) & (lower_wick >= body * 2) & (upper_wick <= total * 0.3)
+        ),
+        Pattern.BEARISH_PIN_BAR: (
+            ranged & ~green & (upper_wick >= total * 0.5) & (upper_wick >= body * 2) & (lower_wick <= total * 0.3)
+        ),
+        Pattern.INSIDE_BAR: pairs((highs[1:] <= highs[:-1]) & (lows[1:] >= lows[:-1])),
+        Pattern.DOJI: ranged & (body <= total * 0.1),
+    }
+
+
+def detect_patterns(candles) -> np.ndarray:
+    """Return the :class:`Pattern` code reported for every bar (``int8`` array).
+
+    Where several patterns complete on one bar the highest-priority one wins, and the
+    first ``MIN_BARS - 1`` bars are always ``Pattern.NONE``, exactly as the live
+    detector sees a window ending on that bar.
+    """
+    masks = pattern_masks(candles)
+    codes = np.select(list(masks.values()), [np.int8(pattern) for pattern in masks], default=np.int8(Pattern.NONE))
+    codes = codes.astype(np.int8, copy=False)
+    codes[: MIN_BARS - 1] = Pattern.NONE
+    return codes
+
+
+def describe_pattern(code: int) -> Optional[Dict[str, Any]]:
+    """Return the payload dict for a pattern code, or ``None`` for ``Pattern.NONE``."""
+    info = PATTERN_INFO.get(Pattern(code))
+    return dict(info) if info is not None else None
+
+
+def _shifted(mask: np.ndarray, lag: int, size: int) -> np.ndarray:
+    """Place a mask computed for bars ``lag..`` into a full-length array."""
+    out = np.zeros(size, dtype=bool)
+    out[lag:] = mask
+    return out
@@ -0,0 +1,233 @@
+"""Client-side, weight-aware rate limiting for Hyperliquid ``/info`` requests.
+
+Hyperliquid meters REST traffic per IP as an aggregate *weight* budget (1200 per
+minute). Most info requests cost 20, a handful of cheap ones cost 2, and list-returning
+requests add weight per returned item (``candleSnapshot``: +1 per 60 candles). The
+limiters below keep a token bucket of that budget and queue callers first-in first-out
+until their weight fits, so bursts turn into waiting instead of 429 responses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Dict, Optional
+
+DEFAULT_WEIGHT_PER_MINUTE = 1200
+DEFAULT_INFO_WEIGHT = 20
+
+INFO_WEIGHTS: Dict[str, int] = {
+    "l2Book": 2,
+    "allMids": 2,
+    "clearinghouseState": 2,
+    "orderStatus": 2,
+    "spotClearinghouseState": 2,
+    "exchangeStatus": 2,
+    "userRole": 60,
+}
+
+# Extra weight charged per N items in the response.
+ITEMS_PER_EXTRA_WEIGHT: Dict[str, int] = {
+    "candleSnapshot": 60,
+    "recentTrades": 20,
+    "historicalOrders": 20,
+    "userFills": 20,
+    "userFillsByTime": 20,
+    "fundingHistory": 20,
+    "userFunding": 20,
+    "nonUserFundingUpdates": 20,
+    "twapHistory": 20,
+    "userTwapSliceFills": 20,
+    "userTwapSliceFillsByTime": 20,
+}
+
+
+def info_request_weight(request_type: str, items: int = 0) -> int:
+    """Return the weight of one ``/info`` request returning roughly ``items`` entries."""
+    weight = INFO_WEIGHTS.get(request_type, DEFAULT_INFO_WEIGHT)
+    per_item = ITEMS_PER_EXTRA_WEIGHT.get(request_type)
+    if per_item and items > 0:
+        weight += items // per_item
+    return weight
+
+
+def candle_snapshot_weight(start_ts: int, end_ts: int, period_ms: int, max_items: int = 5000) -> int:
+    """Estimate the weight of a ``candleSnapshot`` before sending it."""
+    items = min(max_items, max(0, (end_ts - start_ts) // period_ms + 1))
+    return info_request_weight("candleSnapshot", items)
+
+
+@dataclass
+class RateLimitSnapshot:
+    """Point-in-time view of a limiter."""
+
+    capacity: float
+    available: float
+    refill_per_second: float
+    queue_depth: int
+    granted: int
+    granted_weight: int
+    waited_seconds: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+class TokenBucket:
+    """Plain token bucket; callers provide their own locking."""
+
+    def __init__(
+        self,
+        capacity: float = DEFAULT_WEIGHT_PER_MINUTE,
+        refill_per_second: float = DEFAULT_WEIGHT_PER_MINUTE / 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def try_take(self, weight: float) -> float:
+        """Take ``weight`` tokens if possible; otherwise return seconds until it would fit."""
+        self._refill()
+        weight = min(weight, self.capacity)
+        if self._tokens >= weight:
+            self._tokens -= weight
+            return 0.0
+        return (weight - self._tokens) / self.refill_per_second
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after upstream answered 429 despite our accounting."""
+        self._refill()
+        self._tokens = 0.0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+            self._updated = now
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self.granted = 0
+        self.granted_weight = 0
+        self.waited_seconds = 0.0
+
+    def record(self, weight: int, waited: float) -> None:
+        self.granted += 1
+        self.granted_weight += weight
+        self.waited_seconds += waited
+
+
+class RateLimiter:
+    """Thread-safe FIFO limiter: callers block in arrival order until their weight fits."""
+
+    def __init__(
+        self,
+        weight_per_minute: float = DEFAULT_WEIGHT_PER_MINUTE,
+        burst: Optional[float] = None,
+    ) -> None:
+        self._bucket = TokenBucket(burst or weight_per_minute, weight_per_minute / 60.0)
+        self._cond = threading.Condition()
+        self._queue: Deque[object] = collections.deque()
+        self._counters = _Counters()
+
+    def acquire(self, weight: int) -> float:
+        """Block until ``weight`` is available; returns the seconds spent waiting."""
+        ticket = object()
+        started = time.monotonic()
+        with self._cond:
+            self._queue.append(ticket)
+            try:
+                while True:
+                    if self._queue[0] is ticket:
+                        delay = self._bucket.try_take(weight)
+                        if delay == 0.0:
+                            break
+                        self._cond.wait(delay)
+                    else:
+                        self._cond.wait()
+            finally:
+                self._queue.remove(ticket)
+                self._cond.notify_all()
+            waited = time.monotonic() - started
+            self._counters.record(weight, waited)
+        return waited
+
+    def penalize(self) -> None:
+        with self._cond:
+            self._bucket.drain()
+
+    def snapshot(self) -> RateLimitSnapshot:
+        with self._cond:
+            return RateLimitSnapshot(
+                capacity=self._bucket.capacity,
+                available=self._bucket.available(),
+                refill_per_second=self._bucket.refill_per_second,
+                queue_depth=len(self._queue),
+                granted=self._counters.granted,
+                granted_weight=self._counters.granted_weight,
+                waited_seconds=self._counters.waited_seconds,
+            )
+
+
+class AsyncRateLimiter:
+    """Event-loop FIFO limiter with the same accounting as :class:`RateLimiter`."""
+
+    def __init__(
+        self,
+        weight_per_minute: float = DEFAULT_WEIGHT_PER_MINUTE,
+        burst: Optional[float] = None,
+    ) -> None:
+        self._bucket = TokenBucket(burst or weight_per_minute, weight_per_minute / 60.0)
+        self._queue: Deque["asyncio.Future[None]"] = collections.deque()
+        self._counters = _Counters()
+
+    async def acquire(self, weight: int) -> float:
+        """Wait until ``weight`` is available; returns the seconds spent waiting."""
+        started = time.monotonic()
+        if not self._queue and self._bucket.try_take(weight) == 0.0:
+            self._counters.record(weight, 0.0)
+            return 0.0
+        turn: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._queue.append(turn)
+        try:
+            if self._queue[0] is not turn:
+                await turn
+            while True:
+                delay = self._bucket.try_take(weight)
+                if delay == 0.0:
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            head = self._queue[0] is turn
+            self._queue.remove(turn)
+            if head and self._queue and not self._queue[0].done():
+                self._queue[0].set_result(None)
+        waited = time.monotonic() - started
+        self._counters.record(weight, waited)
+        return waited
+
+    def penalize(self) -> None:
+        self._bucket.drain()
+
+    def snapshot(self) -> RateLimitSnapshot:
+        return RateLimitSnapshot(
+            capacity=self._bucket.capacity,
+            available=self._bucket.available(),
+            refill_per_second=self._bucket.refill_per_second,
+            queue_depth=len(self._queue),
+            granted=self._counters.granted,
+            granted_weight=self._counters.granted_weight,
+            waited_seconds=self._counters.waited_seconds,
+        )
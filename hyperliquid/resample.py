@@ -0,0 +1,110 @@
+"""Derive coarser OHLCV bars from a finer candle series."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+
+from .candles import CandleArrays
+from .timeframes import get_timeframe
+
+
+def resample_arrays(candles: CandleArrays, period_ms: int, offset_ms: int = 0) -> CandleArrays:
+    """Aggregate ``candles`` into bars of ``period_ms`` aligned to UTC epoch boundaries.
+
+    A bucket starts at every multiple of ``period_ms`` (shifted by ``offset_ms``), which
+    matches how Hyperliquid opens its 1h/4h/1d bars. A leading bucket that the input only
+    partially covers is dropped so every returned bar is built from complete data; the
+    trailing bucket is kept and mirrors the upstream still-forming bar.
+    """
+    if not len(candles):
+        return candles
+    buckets = (candles.time - offset_ms) // period_ms * period_ms + offset_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    if candles.time[0] != buckets[0]:
+        starts = starts[1:]
+        if not starts.size:
+            return CandleArrays.empty_arrays()
+    first = int(starts[0])
+    ends = np.r_[starts[1:], len(candles)] - 1
+    offset_starts = starts - first
+    return CandleArrays(
+        time=buckets[starts],
+        open=candles.open[starts],
+        high=np.maximum.reduceat(candles.high[first:], offset_starts),
+        low=np.minimum.reduceat(candles.low[first:], offset_starts),
+        close=candles.close[ends],
+        volume=np.add.reduceat(candles.volume[first:], offset_starts),
+    )
+
+
+@dataclass
+class ResampleReport:
+    """Bar-for-bar comparison of resampled candles against native upstream candles."""
+
+    symbol: str
+    timeframe: str
+    base_timeframe: str
+    compared: int
+    missing: List[int] = field(default_factory=list)
+    mismatched: List[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.compared > 0 and not self.missing and not self.mismatched
+
+
+def verify_resampling(
+    info,
+    symbol: str,
+    timeframe: str,
+    base_timeframe: str,
+    lookback: int = 100,
+    end: Optional[datetime] = None,
+    rtol: float = 1e-9,
+    volume_rtol: float = 1e-6,
+) -> ResampleReport:
+    """Fetch ``timeframe`` natively and via ``base_timeframe`` and compare every bar.
+
+    Intended as a smoke check before enabling resampling for a deployment; it issues two
+    upstream calls per invocation. ``lookback`` is capped so the base window fits in one
+    upstream page.
+    """
+    from .data import MAX_CANDLES_PER_REQUEST, CandleRequest
+
+    interval = get_timeframe(timeframe)
+    if not interval.derivable_from(get_timeframe(base_timeframe)):
+        raise ValueError(f"{timeframe} bars cannot be derived from {base_timeframe} bars")
+    ratio = interval.minutes // get_timeframe(base_timeframe).minutes
+    lookback = max(1, min(lookback, MAX_CANDLES_PER_REQUEST // ratio - 1))
+    native_request = CandleRequest(symbol=symbol, timeframe=timeframe, end=end, lookback=lookback)
+    end_ts = int(native_request.end_time().timestamp() * 1000)
+    start_ts = int(native_request.start_time().timestamp() * 1000)
+    period_ms = interval.period_ms
+    native = CandleArrays.from_records(info.candles_snapshot(symbol, timeframe, start_ts, end_ts))
+    base_start = interval.floor(start_ts)
+    base = CandleArrays.from_records(info.candles_snapshot(symbol, base_timeframe, base_start, end_ts))
+    derived = resample_arrays(base, period_ms, interval.offset_ms)
+
+    report = ResampleReport(symbol=symbol, timeframe=timeframe, base_timeframe=base_timeframe, compared=0)
+    positions = {int(ts): index for index, ts in enumerate(derived.time)}
+    for index, ts in enumerate(native.time):
+        if int(ts) + period_ms > end_ts:
+            # The forming bar moves between the two calls; only closed bars are compared.
+            continue
+        other = positions.get(int(ts))
+        if other is None:
+            report.missing.append(int(ts))
+            continue
+        report.compared += 1
+        prices_match = all(
+            np.isclose(native[name][index], derived[name][other], rtol=rtol, atol=0.0)
+            for name in ("open", "high", "low", "close")
+        )
+        volume_match = np.isclose(native.volume[index], derived.volume[other], rtol=volume_rtol, atol=1e-12)
+        if not (prices_match and volume_match):
+            report.mismatched.append(int(ts))
+    return report
@@ -0,0 +1,139 @@
+"""Fixed-capacity NumPy ring buffer for rolling OHLCV windows."""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .candles import PRICE_COLUMNS, CandleArrays
+
+_COLUMN_INDEX = {name: index for index, name in enumerate(PRICE_COLUMNS)}
+
+
+class OHLCVRingBuffer:
+    """Keep the last ``capacity`` bars of one stream in preallocated arrays.
+
+    Appending a bar and updating the still-forming last bar are O(1) and never allocate.
+    :meth:`window` returns zero-copy views while the requested bars are contiguous in
+    memory and only copies when the window wraps around the end of the storage. The
+    buffer also answers ``buffer["close"]`` and ``len(buffer)`` like ``CandleArrays``,
+    so ``compute_indicators`` and the price-action helpers accept it directly.
+    """
+
+    __slots__ = ("_capacity", "_time", "_values", "_head", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._time = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros((len(PRICE_COLUMNS), capacity), dtype=np.float64)
+        self._head = 0  # slot the next bar is written to
+        self._size = 0
+
+    @classmethod
+    def from_arrays(cls, candles: CandleArrays, capacity: Optional[int] = None) -> "OHLCVRingBuffer":
+        buffer = cls(capacity or max(len(candles), 1))
+        buffer.extend(candles)
+        return buffer
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        return self._time.nbytes + self._values.nbytes
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        if column == "time":
+            return self._column_view(self._time, self._size)
+        return self._column_view(self._values[_COLUMN_INDEX[column]], self._size)
+
+    @property
+    def last_time(self) -> Optional[int]:
+        if not self._size:
+            return None
+        return int(self._time[(self._head - 1) % self._capacity])
+
+    def last_bar(self) -> Optional[Tuple[int, float, float, float, float, float]]:
+        """Return ``(time, open, high, low, close, volume)`` of the newest bar in O(1)."""
+        if not self._size:
+            return None
+        slot = (self._head - 1) % self._capacity
+        return (int(self._time[slot]), *self._values[:, slot].tolist())
+
+    def append(self, time: int, open: float, high: float, low: float, close: float, volume: float) -> None:
+        """Add a new bar, overwriting the oldest one once the buffer is full."""
+        slot = self._head
+        self._time[slot] = time
+        values = self._values
+        values[0, slot] = open
+        values[1, slot] = high
+        values[2, slot] = low
+        values[3, slot] = close
+        values[4, slot] = volume
+        self._head = (slot + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+
+    def update_last(self, open: float, high: float, low: float, close: float, volume: float) -> None:
+        """Overwrite the most recent bar in place (the still-forming candle)."""
+        if not self._size:
+            raise IndexError("update_last on an empty buffer")
+        slot = (self._head - 1) % self._capacity
+        values = self._values
+        values[0, slot] = open
+        values[1, slot] = high
+        values[2, slot] = low
+        values[3, slot] = close
+        values[4, slot] = volume
+
+    def upsert(self, time: int, open: float, high: float, low: float, close: float, volume: float) -> bool:
+        """Update the last bar if ``time`` matches it, append if newer; returns False if older."""
+        last = self.last_time
+        if last == time:
+            self.update_last(open, high, low, close, volume)
+            return True
+        if last is None or time > last:
+            self.append(time, open, high, low, close, volume)
+            return True
+        return False
+
+    def extend(self, candles: CandleArrays) -> None:
+        """Append many bars at once (keeps only the newest ``capacity``)."""
+        candles = candles.tail(self._capacity)
+        count = len(candles)
+        if not count:
+            return
+        first = self._head
+        split = min(count, self._capacity - first)
+        rest = count - split
+        self._time[first : first + split] = candles.time[:split]
+        self._time[:rest] = candles.time[split:]
+        for index, name in enumerate(PRICE_COLUMNS):
+            source = candles[name]
+            self._values[index, first : first + split] = source[:split]
+            self._values[index, :rest] = source[split:]
+        self._head = (first + count) % self._capacity
+        self._size = min(self._capacity, self._size + count)
+
+    def window(self, count: Optional[int] = None) -> CandleArrays:
+        """Return the last ``count`` bars (all bars by default) as ``CandleArrays``."""
+        count = self._size if count is None else min(count, self._size)
+        return CandleArrays(
+            self._column_view(self._time, count),
+            *(self._column_view(self._values[index], count) for index in range(len(PRICE_COLUMNS))),
+        )
+
+    def _column_view(self, storage: np.ndarray, count: int) -> np.ndarray:
+        end = self._head or (self._capacity if self._size else 0)
+        start = end - count
+        if start >= 0:
+            return storage[start:end]
+        # The window wraps past slot 0: stitch the two halves together.
+        return np.concatenate((storage[start:], storage[:end]))
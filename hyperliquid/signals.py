@@ -2,26 +2,76 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import json
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
-import pandas as pd
 
 try:
-    import talib  # type: ignore[import]
-except ImportError as exc:  # pragma: no cover
-    raise ImportError("TA-Lib is required. Install it with 'pip install TA-Lib'.") from exc
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
+from .batch import IndicatorTable, compute_indicators_batch
+from .candles import CandleArrays, column
 from .data import CandleRequest, HyperliquidDataClient
+from .indicators import INDICATORS
+from .patterns import MIN_BARS, describe_pattern, detect_patterns
+from .ringbuffer import OHLCVRingBuffer
+from .streaming import fast_where
+from .timeframes import higher_timeframe as _higher_timeframe
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .async_data import AsyncHyperliquidDataClient
+
+# DataFrames are accepted at the edges; the generators themselves pass CandleArrays.
+Candles = Union["pd.DataFrame", CandleArrays, OHLCVRingBuffer]
 
 Direction = Literal["Long", "Short"]
 
 
-@dataclass
+@dataclass(frozen=True)
+class SignalParams:
+    """Tunable thresholds of the confidence score and the trade levels.
+
+    RSI scores full points inside its ``[low, high]`` band for the signal direction and
+    half points within ``rsi_tolerance`` outside it. Levels are ATR multiples around the
+    signal close; every target must lie beyond the far edge of the entry zone.
+    """
+
+    adx_weak: float = 15.0
+    adx_moderate: float = 20.0
+    adx_strong: float = 25.0
+    rsi_long_low: float = 45.0
+    rsi_long_high: float = 70.0
+    rsi_short_low: float = 30.0
+    rsi_short_high: float = 55.0
+    rsi_tolerance: float = 5.0
+    entry_buffer_atr: float = 0.15
+    target_atr: Tuple[float, ...] = (1.0, 2.0, 3.0)
+    stop_atr: float = 2.5
+
+    def __post_init__(self) -> None:
+        if not self.target_atr or min(self.target_atr) <= self.entry_buffer_atr:
+            raise ValueError("target_atr multiples must exceed entry_buffer_atr")
+
+
+DEFAULT_PARAMS = SignalParams()
+
+
+@dataclass(frozen=True, slots=True)
 class SignalPayload:
-    """Structured representation of a trading signal."""
+    """Structured representation of a trading signal.
+
+    Payloads are immutable, so the formatted text and the encoded JSON are built on
+    first use and then reused; a cached payload serializes once no matter how often it
+    is served.
+    """
 
     symbol: str
     timeframe: str
@@ -34,9 +84,16 @@ class SignalPayload:
     confidence: float = 0.0
     price_action: Optional[Dict[str, Any]] = None
     price_history: Optional[List[float]] = None
+    _formatted: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     def format(self) -> str:
         """Return a human-readable representation of the signal."""
+        if self._formatted is None:
+            object.__setattr__(self, "_formatted", self._render())
+        return self._formatted
+
+    def _render(self) -> str:
         arrow = "🟢" if self.direction == "Long" else "🔴"
         lightning = "⚡"
         calendar = "📅"
@@ -98,12 +155,32 @@ class SignalPayload:
             "priceHistory": self.price_history,
         }
 
+    def to_json(self) -> bytes:
+        """Return :meth:`to_dict` encoded as UTF-8 JSON, encoded once per payload."""
+        if self._json is None:
+            object.__setattr__(self, "_json", dumps(self.to_dict()))
+        return self._json
+
+
+def dumps(value: Any) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 class SignalGenerator:
     """Generate trading signals for Hyperliquid perpetuals using TA-Lib indicators."""
 
-    def __init__(self, client: HyperliquidDataClient) -> None:
+    def __init__(self, client: HyperliquidDataClient, params: SignalParams = DEFAULT_PARAMS) -> None:
         self._client = client
+        self._params = params
 
     def generate(
         self,
@@ -114,79 +191,221 @@ class SignalGenerator:
     ) -> SignalPayload:
         """Generate a trading signal for the given symbol and timeframe."""
         request = CandleRequest(symbol=symbol, timeframe=timeframe, end=as_of, lookback=lookback)
-        candles = self._client.fetch_candles(request)
-        indicators = compute_indicators(candles)
-        direction = classify_direction(indicators)
-        confidence = calculate_confidence(indicators, direction)
-        levels = build_trade_levels(candles, indicators, direction)
-        generated_at = (as_of or datetime.now(tz=UTC)).replace(second=0, microsecond=0)
+        candles = self._client.fetch_arrays(request)
         higher_timeframe = _maybe_fetch_higher_timeframe(self._client, symbol, timeframe, as_of)
-        price_action = analyze_price_action(candles, timeframe, higher_timeframe)
-        price_history = candles["close"].astype(float).tail(100).tolist()
-        return SignalPayload(
-            symbol=symbol,
-            timeframe=timeframe,
-            direction=direction,
-            entry=levels["entry"],
-            targets=levels["targets"],
-            stop_loss=levels["stop_loss"],
-            indicators=indicators,
-            generated_at=generated_at,
-            confidence=confidence,
-            price_action=price_action,
-            price_history=price_history,
+        indicators = self._client.live_indicators(request, candles)
+        return build_signal(symbol, timeframe, candles, higher_timeframe, as_of, indicators, self._params)
+
+    def generate_many(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        lookback: int = 250,
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, SignalPayload]:
+        """Generate signals for many symbols on one timeframe, with batched indicators."""
+        candles = {
+            symbol: self._client.fetch_arrays(
+                CandleRequest(symbol=symbol, timeframe=timeframe, end=as_of, lookback=lookback)
+            )
+            for symbol in symbols
+        }
+        higher = {symbol: _maybe_fetch_higher_timeframe(self._client, symbol, timeframe, as_of) for symbol in symbols}
+        return build_signals(timeframe, candles, higher, as_of, self._params)
+
+
+class AsyncSignalGenerator:
+    """Coroutine variant of :class:`SignalGenerator` backed by ``AsyncHyperliquidDataClient``.
+
+    The signal and higher-timeframe candles are fetched concurrently; the indicator
+    work itself is identical to the synchronous generator.
+    """
+
+    def __init__(self, client: "AsyncHyperliquidDataClient", params: SignalParams = DEFAULT_PARAMS) -> None:
+        self._client = client
+        self._params = params
+
+    @property
+    def client(self) -> "AsyncHyperliquidDataClient":
+        return self._client
+
+    async def generate(
+        self,
+        symbol: str,
+        timeframe: str,
+        lookback: int = 250,
+        as_of: Optional[datetime] = None,
+    ) -> SignalPayload:
+        """Generate a trading signal for the given symbol and timeframe."""
+        request = CandleRequest(symbol=symbol, timeframe=timeframe, end=as_of, lookback=lookback)
+        candles, higher_timeframe = await asyncio.gather(
+            self._client.fetch_arrays(request),
+            self._maybe_fetch_higher_timeframe(symbol, timeframe, as_of),
         )
+        indicators = self._client.live_indicators(request, candles)
+        return build_signal(symbol, timeframe, candles, higher_timeframe, as_of, indicators, self._params)
 
+    async def generate_many(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        lookback: int = 250,
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, SignalPayload]:
+        """Generate signals for many symbols on one timeframe, with batched indicators.
+
+        Every fetch is gathered concurrently; the indicators of all symbols are then
+        computed in one :func:`~hyperliquid.batch.compute_indicators_batch` call.
+        """
+        symbols = list(symbols)
+        fetched = await asyncio.gather(
+            *(
+                self._client.fetch_arrays(
+                    CandleRequest(symbol=symbol, timeframe=timeframe, end=as_of, lookback=lookback)
+                )
+                for symbol in symbols
+            ),
+            *(self._maybe_fetch_higher_timeframe(symbol, timeframe, as_of) for symbol in symbols),
+        )
+        candles = dict(zip(symbols, fetched[: len(symbols)]))
+        higher = dict(zip(symbols, fetched[len(symbols) :]))
+        return build_signals(timeframe, candles, higher, as_of, self._params)
 
-def compute_indicators(candles: pd.DataFrame) -> Dict[str, float]:
-    """Compute TA-Lib indicators used in the signal logic."""
-    closes = candles["close"].astype(float).values
-    highs = candles["high"].astype(float).values
-    lows = candles["low"].astype(float).values
+    async def _maybe_fetch_higher_timeframe(
+        self,
+        symbol: str,
+        timeframe: str,
+        as_of: Optional[datetime],
+    ) -> Optional[Candles]:
+        higher_tf = _higher_timeframe(timeframe)
+        if higher_tf is None:
+            return None
+        try:
+            return await self._client.fetch_arrays(
+                CandleRequest(symbol=symbol, timeframe=higher_tf, end=as_of, lookback=120)
+            )
+        except Exception:
+            return None
+
+
+def build_signal(
+    symbol: str,
+    timeframe: str,
+    candles: Candles,
+    higher_timeframe: Optional[Candles] = None,
+    as_of: Optional[datetime] = None,
+    indicators: Optional[Dict[str, float]] = None,
+    params: SignalParams = DEFAULT_PARAMS,
+) -> SignalPayload:
+    """Run the indicator, level and price-action logic over already fetched candles.
+
+    ``indicators`` may carry values already maintained incrementally for ``candles``
+    (see :mod:`hyperliquid.streaming`); any reported indicator they lack is evaluated
+    from the registry, and without them every indicator is.
+    """
+    if indicators is None:
+        indicators = compute_indicators(candles)
+    else:
+        missing = [name for name in INDICATORS.reported if name not in indicators]
+        if missing:
+            indicators = {**indicators, **INDICATORS.latest(candles, missing)}
+    direction = classify_direction(indicators)
+    confidence = calculate_confidence(indicators, direction, params)
+    levels = build_trade_levels(candles, indicators, direction, params)
+    generated_at = (as_of or datetime.now(tz=UTC)).replace(second=0, microsecond=0)
+    price_action = analyze_price_action(candles, timeframe, higher_timeframe)
+    price_history = column(candles, "close")[-100:].tolist()
+    return SignalPayload(
+        symbol=symbol,
+        timeframe=timeframe,
+        direction=direction,
+        entry=levels["entry"],
+        targets=levels["targets"],
+        stop_loss=levels["stop_loss"],
+        indicators=indicators,
+        generated_at=generated_at,
+        confidence=confidence,
+        price_action=price_action,
+        price_history=price_history,
+    )
 
-    ema20 = talib.EMA(closes, timeperiod=20)
-    ema50 = talib.EMA(closes, timeperiod=50)
-    adx = talib.ADX(highs, lows, closes, timeperiod=14)
-    plus_di = talib.PLUS_DI(highs, lows, closes, timeperiod=14)
-    minus_di = talib.MINUS_DI(highs, lows, closes, timeperiod=14)
-    macd, macd_signal, macd_hist = talib.MACD(closes, fastperiod=12, slowperiod=26, signalperiod=9)
-    rsi = talib.RSI(closes, timeperiod=14)
-    atr = talib.ATR(highs, lows, closes, timeperiod=14)
 
+def build_signals(
+    timeframe: str,
+    candles: Mapping[str, Candles],
+    higher_timeframes: Optional[Mapping[str, Optional[Candles]]] = None,
+    as_of: Optional[datetime] = None,
+    params: SignalParams = DEFAULT_PARAMS,
+) -> Dict[str, SignalPayload]:
+    """:func:`build_signal` for many symbols with the indicators computed in one batch.
+
+    Symbols whose history is too short for every indicator fall back to
+    :func:`compute_indicators`, which raises the same error as a single request.
+    """
+    table = compute_indicators_batch(candles)
+    complete = table.complete()
+    higher_timeframes = higher_timeframes or {}
     return {
-        "ema20": _latest_valid(ema20),
-        "ema50": _latest_valid(ema50),
-        "adx": _latest_valid(adx),
-        "plus_di": _latest_valid(plus_di),
-        "minus_di": _latest_valid(minus_di),
-        "macd": _latest_valid(macd),
-        "macd_signal": _latest_valid(macd_signal),
-        "macd_hist": _latest_valid(macd_hist),
-        "rsi": _latest_valid(rsi),
-        "atr": _latest_valid(atr),
-        "close": candles["close"].astype(float).iloc[-1],
+        symbol: build_signal(
+            symbol,
+            timeframe,
+            frame,
+            higher_timeframes.get(symbol),
+            as_of,
+            table.row(symbol) if complete[index] else None,
+            params,
+        )
+        for index, (symbol, frame) in enumerate(candles.items())
     }
 
 
+def compute_indicators(candles: Candles) -> Dict[str, float]:
+    """Latest value of every indicator reported by :data:`~hyperliquid.indicators.INDICATORS`."""
+    return INDICATORS.latest(candles)
+
+
 def classify_direction(indicators: Dict[str, float]) -> Direction:
     """Determine whether market bias is long or short."""
+    return "Long" if _is_long(indicators) else "Short"
+
+
+def classify_directions(indicators: IndicatorTable) -> np.ndarray:
+    """Vectorized :func:`classify_direction` over an :class:`IndicatorTable`."""
+    return np.where(_is_long(indicators), "Long", "Short")
+
+
+def calculate_confidence(
+    indicators: Dict[str, float], direction: Direction, params: SignalParams = DEFAULT_PARAMS
+) -> float:
+    """Calculate signal confidence score (0-100) based on indicator alignment."""
+    return min(100.0, max(0.0, float(_confidence_score(indicators, direction == "Long", params))))
+
+
+def calculate_confidences(
+    indicators: IndicatorTable, directions: np.ndarray, params: SignalParams = DEFAULT_PARAMS
+) -> np.ndarray:
+    """Vectorized :func:`calculate_confidence`; ``directions`` as from :func:`classify_directions`."""
+    score = _confidence_score(indicators, np.asarray(directions) == "Long", params)
+    return np.clip(score, 0.0, 100.0).astype(float)
+
+
+# The rules below are written with element-wise operators only, so the same code scores
+# one symbol (floats) or a whole IndicatorTable (arrays).
+
+
+def _is_long(indicators: Mapping[str, Any]) -> Any:
     ema20 = indicators["ema20"]
     ema50 = indicators["ema50"]
     macd_hist = indicators["macd_hist"]
     rsi = indicators["rsi"]
 
-    if ema20 > ema50 and macd_hist >= 0 and rsi >= 45:
-        return "Long"
-    if ema20 < ema50 and macd_hist <= 0 and rsi <= 55:
-        return "Short"
+    long = (ema20 > ema50) & (macd_hist >= 0) & (rsi >= 45)
+    short = (ema20 < ema50) & (macd_hist <= 0) & (rsi <= 55)
     # fallback to trend direction
-    return "Long" if ema20 >= ema50 else "Short"
+    return long | (np.logical_not(short) & (ema20 >= ema50))
 
 
-def calculate_confidence(indicators: Dict[str, float], direction: Direction) -> float:
-    """Calculate signal confidence score (0-100) based on indicator alignment."""
-    score = 0.0
-    
+def _confidence_score(indicators: Mapping[str, Any], long: Any, params: SignalParams = DEFAULT_PARAMS) -> Any:
     ema20 = indicators["ema20"]
     ema50 = indicators["ema50"]
     adx = indicators["adx"]
@@ -195,76 +414,56 @@ def calculate_confidence(indicators: Dict[str, float], direction: Direction) ->
     macd_hist = indicators["macd_hist"]
     rsi = indicators["rsi"]
     close = indicators["close"]
-    
-    if direction == "Long":
-        # Trend alignment (30 points)
-        if ema20 > ema50:
-            score += 15
-            if close > ema20:
-                score += 15
-        
-        # Momentum (25 points)
-        if macd_hist > 0:
-            score += 15
-        if plus_di > minus_di:
-            score += 10
-        
-        # RSI (20 points)
-        if 45 <= rsi <= 70:
-            score += 20
-        elif 40 <= rsi < 45 or 70 < rsi <= 75:
-            score += 10
-        
-        # Trend strength (25 points)
-        if adx >= 25:
-            score += 25
-        elif adx >= 20:
-            score += 15
-        elif adx >= 15:
-            score += 10
-    
-    else:  # Short
-        # Trend alignment (30 points)
-        if ema20 < ema50:
-            score += 15
-            if close < ema20:
-                score += 15
-        
-        # Momentum (25 points)
-        if macd_hist < 0:
-            score += 15
-        if minus_di > plus_di:
-            score += 10
-        
-        # RSI (20 points)
-        if 30 <= rsi <= 55:
-            score += 20
-        elif 25 <= rsi < 30 or 55 < rsi <= 60:
-            score += 10
-        
-        # Trend strength (25 points)
-        if adx >= 25:
-            score += 25
-        elif adx >= 20:
-            score += 15
-        elif adx >= 15:
-            score += 10
-    
-    return min(100.0, max(0.0, score))
+
+    # Trend alignment (30 points)
+    trend = fast_where(
+        long,
+        15 * (ema20 > ema50) + 15 * ((ema20 > ema50) & (close > ema20)),
+        15 * (ema20 < ema50) + 15 * ((ema20 < ema50) & (close < ema20)),
+    )
+
+    # Momentum (25 points)
+    momentum = fast_where(
+        long,
+        15 * (macd_hist > 0) + 10 * (plus_di > minus_di),
+        15 * (macd_hist < 0) + 10 * (minus_di > plus_di),
+    )
+
+    # RSI (20 points)
+    rsi_score = fast_where(
+        long,
+        _band_score(rsi, params.rsi_long_low, params.rsi_long_high, params.rsi_tolerance),
+        _band_score(rsi, params.rsi_short_low, params.rsi_short_high, params.rsi_tolerance),
+    )
+
+    # Trend strength (25 points)
+    strong, moderate, weak = params.adx_strong, params.adx_moderate, params.adx_weak
+    strength = (
+        25 * (adx >= strong) + 15 * ((moderate <= adx) & (adx < strong)) + 10 * ((weak <= adx) & (adx < moderate))
+    )
+
+    return trend + momentum + rsi_score + strength
+
+
+def _band_score(rsi: Any, low: float, high: float, tolerance: float) -> Any:
+    inside = (low <= rsi) & (rsi <= high)
+    near = ((low - tolerance <= rsi) & (rsi < low)) | ((high < rsi) & (rsi <= high + tolerance))
+    return 20 * inside + 10 * near
 
 
 def build_trade_levels(
-    candles: pd.DataFrame,
+    candles: Candles,
     indicators: Dict[str, float],
     direction: Direction,
+    params: SignalParams = DEFAULT_PARAMS,
 ) -> Dict[str, object]:
     """Construct entry, targets and stop levels using ATR multiples."""
     close_price = indicators["close"]
     atr = indicators["atr"]
 
-    buffer = atr * 0.15
-    target_multipliers = np.array([1.0, 2.0, 3.0])
-    stop_multiplier = 2.5
+    buffer = atr * params.entry_buffer_atr
+    target_multipliers = np.array(params.target_atr)
+    stop_multiplier = params.stop_atr
 
     if direction == "Long":
         entry = (close_price - buffer, close_price + buffer)
@@ -282,18 +481,10 @@ def build_trade_levels(
     }
 
 
-def _latest_valid(series: Iterable[float]) -> float:
-    arr = np.asarray(series, dtype=float)
-    arr = arr[~np.isnan(arr)]
-    if not len(arr):
-        raise ValueError("Indicator series contains only NaN values")
-    return float(arr[-1])
-
-
 def analyze_price_action(
-    candles: pd.DataFrame,
+    candles: Candles,
     timeframe: str,
-    higher_timeframe: Optional[pd.DataFrame] = None,
+    higher_timeframe: Optional[Candles] = None,
 ) -> Dict[str, Any]:
     """Summarize short-term price action context for the latest bars."""
     pattern = _detect_pattern(candles)
@@ -340,166 +531,58 @@ def _maybe_fetch_higher_timeframe(
     symbol: str,
     timeframe: str,
     as_of: Optional[datetime],
-) -> Optional[pd.DataFrame]:
-    higher_map = {
-        "15m": "1h",
-        "1h": "4h",
-        "4h": "1d",
-    }
-    higher_tf = higher_map.get(timeframe)
+) -> Optional[Candles]:
+    higher_tf = _higher_timeframe(timeframe)
     if higher_tf is None:
         return None
     try:
-        return client.fetch_candles(CandleRequest(symbol=symbol, timeframe=higher_tf, end=as_of, lookback=120))
+        return client.fetch_arrays(CandleRequest(symbol=symbol, timeframe=higher_tf, end=as_of, lookback=120))
     except Exception:
         return None
 
 
-def _detect_pattern(candles: pd.DataFrame) -> Optional[Dict[str, Any]]:
-    if len(candles) < 3:
+def _detect_pattern(candles: Candles) -> Optional[Dict[str, Any]]:
+    if len(candles) < MIN_BARS:
         return None
-
-    last = candles.iloc[-1]
-    prev = candles.iloc[-2]
-
-    if _is_three_white_soldiers(candles):
-        return {"name": "Three White Soldiers", "bias": "Long", "confidence": "high", "candleCount": 3}
-    if _is_three_black_crows(candles):
-        return {"name": "Three Black Crows", "bias": "Short", "confidence": "high", "candleCount": 3}
-    if _is_bullish_engulfing(prev, last):
-        return {"name": "Bullish Engulfing", "bias": "Long", "confidence": "medium", "candleCount": 2}
-    if _is_bearish_engulfing(prev, last):
-        return {"name": "Bearish Engulfing", "bias": "Short", "confidence": "medium", "candleCount": 2}
-    if _is_bullish_pin_bar(last):
-        return {"name": "Hammer (Pin Bar)", "bias": "Long", "confidence": "medium", "candleCount": 1}
-    if _is_bearish_pin_bar(last):
-        return {"name": "Shooting Star (Pin Bar)", "bias": "Short", "confidence": "medium", "candleCount": 1}
-    if _is_inside_bar(prev, last):
-        return {"name": "Inside Bar", "bias": "Breakout", "confidence": "neutral", "candleCount": 2}
-    if _is_doji(last):
-        return {"name": "Doji", "bias": "Neutral", "confidence": "low", "candleCount": 1}
-    return None
-
-
-def _candle_color(candle: pd.Series) -> str:
-    return "green" if candle["close"] >= candle["open"] else "red"
-
-
-def _is_three_white_soldiers(candles: pd.DataFrame) -> bool:
-    last_three = candles.iloc[-3:]
-    colors = [_candle_color(row) for _, row in last_three.iterrows()]
-    if not all(color == "green" for color in colors):
-        return False
-    opens = last_three["open"].values
-    closes = last_three["close"].values
-    return np.all(np.diff(opens) > 0) and np.all(np.diff(closes) > 0)
-
-
-def _is_three_black_crows(candles: pd.DataFrame) -> bool:
-    last_three = candles.iloc[-3:]
-    colors = [_candle_color(row) for _, row in last_three.iterrows()]
-    if not all(color == "red" for color in colors):
-        return False
-    opens = last_three["open"].values
-    closes = last_three["close"].values
-    return np.all(np.diff(opens) < 0) and np.all(np.diff(closes) < 0)
-
-
-def _is_bullish_engulfing(prev: pd.Series, last: pd.Series) -> bool:
-    return (
-        _candle_color(prev) == "red"
-        and _candle_color(last) == "green"
-        and last["open"] <= prev["close"]
-        and last["close"] >= prev["open"]
-    )
-
-
-def _is_bearish_engulfing(prev: pd.Series, last: pd.Series) -> bool:
-    return (
-        _candle_color(prev) == "green"
-        and _candle_color(last) == "red"
-        and last["open"] >= prev["close"]
-        and last["close"] <= prev["open"]
-    )
-
-
-def _is_bullish_pin_bar(candle: pd.Series) -> bool:
-    body = abs(candle["close"] - candle["open"])
-    total = candle["high"] - candle["low"]
-    if total == 0:
-        return False
-    lower_wick = min(candle["open"], candle["close"]) - candle["low"]
-    upper_wick = candle["high"] - max(candle["open"], candle["close"])
-    return (
-        _candle_color(candle) == "green"
-        and lower_wick >= total * 0.5
-        and lower_wick >= body * 2
-        and upper_wick <= total * 0.3
-    )
-
-
-def _is_bearish_pin_bar(candle: pd.Series) -> bool:
-    body = abs(candle["close"] - candle["open"])
-    total = candle["high"] - candle["low"]
-    if total == 0:
-        return False
-    lower_wick = min(candle["open"], candle["close"]) - candle["low"]
-    upper_wick = candle["high"] - max(candle["open"], candle["close"])
-    return (
-        _candle_color(candle) == "red"
-        and upper_wick >= total * 0.5
-        and upper_wick >= body * 2
-        and lower_wick <= total * 0.3
-    )
-
-
-def _is_inside_bar(prev: pd.Series, last: pd.Series) -> bool:
-    return last["high"] <= prev["high"] and last["low"] >= prev["low"]
+    window = {name: column(candles, name)[-MIN_BARS:] for name in ("open", "high", "low", "close")}
+    return describe_pattern(detect_patterns(window)[-1])
 
 
-def _is_doji(candle: pd.Series) -> bool:
-    body = abs(candle["close"] - candle["open"])
-    total = candle["high"] - candle["low"]
-    if total == 0:
-        return False
-    return body <= total * 0.1
+def _nearest_levels(candles: Candles, lookback: int = 60) -> Tuple[Optional[float], Optional[float]]:
+    lows = column(candles, "low")[-lookback:]
+    highs = column(candles, "high")[-lookback:]
+    price = float(column(candles, "close")[-1])
 
+    supports = lows[lows < price]
+    support = float(supports.max()) if supports.size else None
 
-def _nearest_levels(candles: pd.DataFrame, lookback: int = 60) -> Tuple[Optional[float], Optional[float]]:
-    window = candles.tail(lookback)
-    price = float(window["close"].iloc[-1])
-
-    supports = window.loc[window["low"] < price, "low"]
-    support = float(supports.max()) if not supports.empty else None
-
-    resistances = window.loc[window["high"] > price, "high"]
-    resistance = float(resistances.min()) if not resistances.empty else None
+    resistances = highs[highs > price]
+    resistance = float(resistances.min()) if resistances.size else None
 
     return support, resistance
 
 
-def _volume_ratio(candles: pd.DataFrame, period: int = 20) -> float:
-    volumes = candles["volume"].astype(float)
-    last = float(volumes.iloc[-1])
+def _volume_ratio(candles: Candles, period: int = 20) -> float:
+    volumes = column(candles, "volume")
+    last = float(volumes[-1])
     if len(volumes) <= 1:
         return 1.0
-    baseline = float(volumes.tail(period + 1).iloc[:-1].mean()) if len(volumes) > period else float(volumes.iloc[:-1].mean())
+    baseline = float(volumes[-(period + 1):-1].mean()) if len(volumes) > period else float(volumes[:-1].mean())
     baseline = max(baseline, 1e-9)
     return last / baseline
 
 
-def _determine_trend(candles: Optional[pd.DataFrame], lookback: int = 40) -> Optional[str]:
-    if candles is None or candles.empty:
+def _determine_trend(candles: Optional[Candles], lookback: int = 40) -> Optional[str]:
+    if candles is None or len(candles) == 0:
         return None
-    closes = candles["close"].astype(float).tail(lookback)
+    closes = column(candles, "close")[-lookback:]
     if len(closes) < 5:
         return "range"
-    delta = closes.iloc[-1] - closes.iloc[0]
-    pct_change = delta / closes.iloc[0] if closes.iloc[0] != 0 else 0.0
+    delta = closes[-1] - closes[0]
+    pct_change = delta / closes[0] if closes[0] != 0 else 0.0
     threshold = 0.001
     if pct_change > threshold:
         return "uptrend"
     if pct_change < -threshold:
         return "downtrend"
     return "range"
-
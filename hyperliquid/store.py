@@ -0,0 +1,116 @@
+"""On-disk candle store used to avoid re-downloading closed bars."""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .candles import CandleArrays
+from .columnar import append_columns, read_columns, write_columns
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class CandleStore:
+    """Persist closed candles per (symbol, timeframe) so repeat fetches only ask for new bars.
+
+    Each stream lives in its own columnar file (see :mod:`hyperliquid.columnar`). Only
+    bars whose close time has passed are written; the still-forming bar is always taken
+    from the latest upstream response.
+    """
+
+    def __init__(self, root: os.PathLike | str) -> None:
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def lock(self, symbol: str, timeframe: str) -> threading.Lock:
+        """Return the lock serialising read-modify-write cycles for one stream."""
+        key = (symbol, timeframe)
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def path_for(self, symbol: str, timeframe: str) -> Path:
+        return self._root / _UNSAFE_CHARS.sub("_", symbol) / f"{timeframe}.hlc"
+
+    def load(self, symbol: str, timeframe: str) -> CandleArrays:
+        """Return memory-mapped views of the stored closed candles."""
+        candles = read_columns(self.path_for(symbol, timeframe))
+        return candles if candles is not None else CandleArrays.empty_arrays()
+
+    def append(self, symbol: str, timeframe: str, candles: CandleArrays, period_ms: int) -> int:
+        """Append bars newer than the stored tail."""
+        return append_columns(self.path_for(symbol, timeframe), candles, period_ms)
+
+    def replace(self, symbol: str, timeframe: str, candles: CandleArrays, period_ms: int) -> None:
+        write_columns(self.path_for(symbol, timeframe), candles, period_ms)
+
+    def clear(self, symbol: str, timeframe: str) -> None:
+        try:
+            self.path_for(symbol, timeframe).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def plan_fetch(
+    cached: CandleArrays,
+    start_ts: int,
+    end_ts: int,
+    period_ms: int,
+    offset_ms: int = 0,
+) -> Optional[Tuple[int, int]]:
+    """Return the ``(start, end)`` window still missing from ``cached``, or ``None``.
+
+    The cache is only trusted when it reaches back to the requested start; otherwise the
+    whole window is requested. Gaps that start before the window are also refetched in
+    full so a long-idle stream never relies on a partial upstream page.
+    """
+    if not len(cached):
+        return start_ts, end_ts
+    first_t = int(cached.time[0])
+    last_t = int(cached.time[-1])
+    aligned_start = start_ts + (offset_ms - start_ts) % period_ms
+    if first_t > aligned_start:
+        return start_ts, end_ts
+    resume = last_t + period_ms
+    if resume > end_ts:
+        return None
+    if resume < start_ts:
+        return start_ts, end_ts
+    return resume, end_ts
+
+
+def merge_candles(cached: CandleArrays, fetched: CandleArrays, period_ms: int) -> Optional[CandleArrays]:
+    """Merge freshly fetched bars into the cached series, preferring fetched values.
+
+    Returns ``None`` when the fetched window neither overlaps nor adjoins the cached
+    bars, so callers can decide whether to replace the cache or leave it untouched.
+    """
+    if not len(cached):
+        return fetched
+    if not len(fetched):
+        return cached
+    if int(fetched.time[0]) > int(cached.time[-1]) + period_ms or int(fetched.time[-1]) + period_ms < int(cached.time[0]):
+        return None
+    head = cached.slice(0, int(np.searchsorted(cached.time, fetched.time[0], side="left")))
+    tail = cached.slice(int(np.searchsorted(cached.time, fetched.time[-1], side="right")), len(cached))
+    return CandleArrays.concat([head, fetched, tail])
+
+
+def closed_candles(candles: CandleArrays, now_ms: int, period_ms: int) -> CandleArrays:
+    """Drop the still-forming bar(s) from the end of ``candles``."""
+    cutoff = int(np.searchsorted(candles.time + period_ms, now_ms, side="right"))
+    return candles.slice(0, cutoff)
@@ -0,0 +1,314 @@
+"""Incremental indicator engine with O(1) per-bar updates.
+
+The kernels below carry the same recursion state TA-Lib uses internally (EMA seeds,
+Wilder sums and averages) and replay TA-Lib's arithmetic in the same order, so feeding
+a series bar by bar reproduces ``talib.EMA``/``MACD``/``RSI``/``ATR``/``PLUS_DI``/
+``MINUS_DI``/``ADX`` at every index to floating-point tolerance (TA-Lib's default
+compatibility mode, no unstable period).
+
+Each kernel is a pure ``step(state, ...) -> (state, output)`` function. That makes
+"peeking" at a still-forming bar free (step without keeping the new state). Because
+the arithmetic is written with NumPy ufuncs, the same kernels also advance a whole
+vector of aligned streams at once.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .candles import column
+
+EMA_FAST = 20
+EMA_SLOW = 50
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+WILDER_PERIOD = 14
+
+# Bars needed before every indicator has a value (MACD signal: 25 + 8 lookback + 1).
+WARMUP_BARS = max(EMA_SLOW, MACD_SLOW + MACD_SIGNAL - 1)
+
+_NAN = float("nan")
+
+
+def is_zero(value: Any) -> Any:
+    """TA-Lib's ``TA_IS_ZERO``."""
+    return (-1e-8 < value) & (value < 1e-8)
+
+
+def fast_where(condition: Any, if_true: Any, if_false: Any) -> Any:
+    """``np.where`` that skips array allocation for the scalar (single stream) case."""
+    if isinstance(condition, (bool, np.bool_)):
+        return if_true if condition else if_false
+    return np.where(condition, if_true, if_false)
+
+
+def _max(a: Any, b: Any) -> Any:
+    if isinstance(a, float) and isinstance(b, float):
+        return a if a >= b else b
+    return np.maximum(a, b)
+
+
+def _min(a: Any, b: Any) -> Any:
+    if isinstance(a, float) and isinstance(b, float):
+        return a if a <= b else b
+    return np.minimum(a, b)
+
+
+def safe_ratio(numerator: Any, denominator: Any) -> Any:
+    """``numerator / denominator``, or 0 where TA-Lib treats the denominator as zero."""
+    zero = is_zero(denominator)
+    return fast_where(zero, 0.0, numerator / fast_where(zero, 1.0, denominator))
+
+
+def _nan_like(value: Any) -> Any:
+    return np.full_like(value, np.nan, dtype=np.float64) if np.ndim(value) else _NAN
+
+
+def _true_range(high: Any, low: Any, prev_close: Any) -> Any:
+    return _max(high, prev_close) - _min(low, prev_close)
+
+
+class EmaState(NamedTuple):
+    count: int = 0
+    value: Any = 0.0  # running sum while seeding, EMA afterwards
+
+
+def ema_step(state: EmaState, x: Any, period: int) -> Tuple[EmaState, Any]:
+    """``talib.EMA``: seeded with the SMA of the first ``period`` values."""
+    count = state.count + 1
+    if count < period:
+        return EmaState(count, state.value + x), _nan_like(x)
+    if count == period:
+        value = (state.value + x) / period
+    else:
+        value = (x - state.value) * (2.0 / (period + 1)) + state.value
+    return EmaState(count, value), value
+
+
+class MacdState(NamedTuple):
+    count: int = 0
+    fast: EmaState = EmaState()
+    slow: EmaState = EmaState()
+    signal: EmaState = EmaState()
+
+
+def macd_step(
+    state: MacdState,
+    close: Any,
+    fast: int = MACD_FAST,
+    slow: int = MACD_SLOW,
+    signal: int = MACD_SIGNAL,
+) -> Tuple[MacdState, Tuple[Any, Any, Any]]:
+    """``talib.MACD``: the fast EMA is seeded on the bars ending where the slow one is."""
+    count = state.count + 1
+    slow_state, slow_value = ema_step(state.slow, close, slow)
+    fast_state = state.fast
+    if count > slow - fast:
+        fast_state, fast_value = ema_step(fast_state, close, fast)
+    nan = _nan_like(close)
+    if count < slow:
+        return MacdState(count, fast_state, slow_state, state.signal), (nan, nan, nan)
+    line = fast_value - slow_value
+    signal_state, signal_value = ema_step(state.signal, line, signal)
+    new_state = MacdState(count, fast_state, slow_state, signal_state)
+    if signal_state.count < signal:
+        return new_state, (nan, nan, nan)
+    return new_state, (line, signal_value, line - signal_value)
+
+
+class RsiState(NamedTuple):
+    count: int = 0
+    prev_close: Any = 0.0
+    gain: Any = 0.0
+    loss: Any = 0.0
+
+
+def rsi_step(state: RsiState, close: Any, period: int = WILDER_PERIOD) -> Tuple[RsiState, Any]:
+    """``talib.RSI`` with Wilder smoothing of average gains and losses."""
+    count = state.count + 1
+    if count == 1:
+        return RsiState(count, close, state.gain, state.loss), _nan_like(close)
+    diff = close - state.prev_close
+    up = _max(diff, 0.0)
+    down = _max(-diff, 0.0)
+    if count <= period:
+        return RsiState(count, close, state.gain + up, state.loss + down), _nan_like(close)
+    if count == period + 1:
+        gain = (state.gain + up) / period
+        loss = (state.loss + down) / period
+    else:
+        gain = (state.gain * (period - 1) + up) / period
+        loss = (state.loss * (period - 1) + down) / period
+    return RsiState(count, close, gain, loss), 100.0 * safe_ratio(gain, gain + loss)
+
+
+class AtrState(NamedTuple):
+    count: int = 0
+    prev_close: Any = 0.0
+    value: Any = 0.0
+
+
+def atr_step(state: AtrState, high: Any, low: Any, close: Any, period: int = WILDER_PERIOD) -> Tuple[AtrState, Any]:
+    """``talib.ATR``: SMA of the first ``period`` true ranges, then Wilder smoothing."""
+    count = state.count + 1
+    if count == 1:
+        return AtrState(count, close, state.value), _nan_like(close)
+    true_range = _true_range(high, low, state.prev_close)
+    if count <= period:
+        return AtrState(count, close, state.value + true_range), _nan_like(close)
+    if count == period + 1:
+        value = (state.value + true_range) / period
+    else:
+        value = (state.value * (period - 1) + true_range) / period
+    return AtrState(count, close, value), value
+
+
+class DmiState(NamedTuple):
+    count: int = 0
+    prev_high: Any = 0.0
+    prev_low: Any = 0.0
+    prev_close: Any = 0.0
+    plus_dm: Any = 0.0
+    minus_dm: Any = 0.0
+    true_range: Any = 0.0
+    adx: Any = 0.0  # running sum of DX while seeding, ADX afterwards
+
+
+def dmi_step(
+    state: DmiState, high: Any, low: Any, close: Any, period: int = WILDER_PERIOD
+) -> Tuple[DmiState, Tuple[Any, Any, Any]]:
+    """``talib.PLUS_DI``, ``talib.MINUS_DI`` and ``talib.ADX`` in one pass.
+
+    Returns ``(plus_di, minus_di, adx)``; the DIs start one bar after ``period`` bars
+    and ADX ``period - 1`` bars later.
+    """
+    count = state.count + 1
+    nan = _nan_like(close)
+    if count == 1:
+        return DmiState(count, high, low, close), (nan, nan, nan)
+    diff_plus = high - state.prev_high
+    diff_minus = state.prev_low - low
+    plus = fast_where((diff_plus > 0) & (diff_plus > diff_minus), diff_plus, 0.0)
+    minus = fast_where((diff_minus > 0) & (diff_plus < diff_minus), diff_minus, 0.0)
+    true_range = _true_range(high, low, state.prev_close)
+    if count <= period:
+        seeded = DmiState(
+            count,
+            high,
+            low,
+            close,
+            state.plus_dm + plus,
+            state.minus_dm + minus,
+            state.true_range + true_range,
+        )
+        return seeded, (nan, nan, nan)
+
+    plus_dm = state.plus_dm - state.plus_dm / period + plus
+    minus_dm = state.minus_dm - state.minus_dm / period + minus
+    smoothed_tr = state.true_range - state.true_range / period + true_range
+    plus_di = 100.0 * safe_ratio(plus_dm, smoothed_tr)
+    minus_di = 100.0 * safe_ratio(minus_dm, smoothed_tr)
+    di_sum = minus_di + plus_di
+    valid = np.logical_not(is_zero(smoothed_tr) | is_zero(di_sum))
+    dx = 100.0 * safe_ratio(abs(minus_di - plus_di), di_sum)
+    adx_count = count - period  # DX values seen so far
+    if adx_count < period:
+        adx = state.adx + fast_where(valid, dx, 0.0)
+        adx_out = nan
+    elif adx_count == period:
+        adx = (state.adx + fast_where(valid, dx, 0.0)) / period
+        adx_out = adx
+    else:
+        adx = fast_where(valid, (state.adx * (period - 1) + dx) / period, state.adx)
+        adx_out = adx
+    new_state = DmiState(count, high, low, close, plus_dm, minus_dm, smoothed_tr, adx)
+    return new_state, (plus_di, minus_di, adx_out)
+
+
+class IndicatorState(NamedTuple):
+    """Recursion state behind every value :func:`compute_indicators` reports."""
+
+    ema20: EmaState = EmaState()
+    ema50: EmaState = EmaState()
+    macd: MacdState = MacdState()
+    rsi: RsiState = RsiState()
+    atr: AtrState = AtrState()
+    dmi: DmiState = DmiState()
+
+    @property
+    def bars(self) -> int:
+        return self.rsi.count
+
+
+def indicator_step(state: IndicatorState, high: Any, low: Any, close: Any) -> Tuple[IndicatorState, Dict[str, Any]]:
+    """Advance every indicator by one bar and return the new values."""
+    ema20_state, ema20 = ema_step(state.ema20, close, EMA_FAST)
+    ema50_state, ema50 = ema_step(state.ema50, close, EMA_SLOW)
+    macd_state, (macd, macd_signal, macd_hist) = macd_step(state.macd, close)
+    rsi_state, rsi = rsi_step(state.rsi, close)
+    atr_state, atr = atr_step(state.atr, high, low, close)
+    dmi_state, (plus_di, minus_di, adx) = dmi_step(state.dmi, high, low, close)
+    values = {
+        "ema20": ema20,
+        "ema50": ema50,
+        "adx": adx,
+        "plus_di": plus_di,
+        "minus_di": minus_di,
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "macd_hist": macd_hist,
+        "rsi": rsi,
+        "atr": atr,
+        "close": close,
+    }
+    return IndicatorState(ema20_state, ema50_state, macd_state, rsi_state, atr_state, dmi_state), values
+
+
+class StreamingIndicators:
+    """Indicator state for one (symbol, timeframe) stream.
+
+    :meth:`push` commits a closed bar; :meth:`peek` evaluates a still-forming bar on
+    top of the committed state without changing it, so a tick that only updates the
+    forming candle costs one O(1) step.
+    """
+
+    __slots__ = ("_state", "_values")
+
+    def __init__(self) -> None:
+        self._state = IndicatorState()
+        self._values: Optional[Dict[str, float]] = None
+
+    @classmethod
+    def from_candles(cls, candles) -> "StreamingIndicators":
+        """Warm up from closed bars (a DataFrame, ``CandleArrays`` or ring buffer)."""
+        engine = cls()
+        for high, low, close in zip(
+            column(candles, "high").tolist(), column(candles, "low").tolist(), column(candles, "close").tolist()
+        ):
+            engine.push(high, low, close)
+        return engine
+
+    @property
+    def bars(self) -> int:
+        return self._state.bars
+
+    @property
+    def ready(self) -> bool:
+        """True once every indicator is past its TA-Lib lookback."""
+        return self._state.bars >= WARMUP_BARS
+
+    def push(self, high: float, low: float, close: float) -> Dict[str, float]:
+        self._state, values = indicator_step(self._state, float(high), float(low), float(close))
+        self._values = {name: float(value) for name, value in values.items()}
+        return self._values
+
+    def peek(self, high: float, low: float, close: float) -> Dict[str, float]:
+        _, values = indicator_step(self._state, float(high), float(low), float(close))
+        return {name: float(value) for name, value in values.items()}
+
+    def values(self) -> Optional[Dict[str, float]]:
+        """Values after the last committed bar, or ``None`` before the first one."""
+        return dict(self._values) if self._values is not None else None
@@ -0,0 +1,370 @@
+"""Parallel parameter sweeps and walk-forward evaluation of the signal rules.
+
+:func:`sweep` backtests many :class:`~hyperliquid.signals.SignalParams` over the same
+cached histories (e.g. loaded from a :class:`~hyperliquid.store.CandleStore`) on a
+process pool. The candles are packed once into a single shared-memory block that every
+worker maps, so nothing but parameter sets and small result dicts is pickled; each
+worker prepares the indicator series and range tables once and reuses them for every
+parameter set it evaluates.
+
+Results are written to ``cache_dir`` as they complete, keyed by a hash of the
+parameters, the backtest settings and the data, so an interrupted sweep resumes where
+it stopped. :func:`walk_forward` then picks the best in-sample parameters of each split
+and reports how they did on the following, unseen, window.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields, replace
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .backtest import DEFAULT_HORIZON, BacktestReport, PreparedHistory, Trades, summarize
+from .candles import PRICE_COLUMNS, CandleArrays
+from .signals import DEFAULT_PARAMS, SignalParams
+
+_COLUMNS = ("time", *PRICE_COLUMNS)
+
+
+def parameter_grid(**values: Sequence[Any]) -> List[SignalParams]:
+    """Every valid combination of the given :class:`SignalParams` field values.
+
+    Combinations :class:`SignalParams` rejects (targets inside the entry buffer) are skipped.
+    """
+    names = list(values)
+    combos = (_params(**dict(zip(names, combo))) for combo in itertools.product(*values.values()))
+    return [params for params in combos if params is not None]
+
+
+def random_parameters(count: int, seed: int = 0, **ranges: Any) -> List[SignalParams]:
+    """``count`` random :class:`SignalParams`.
+
+    A ``(low, high)`` tuple is sampled uniformly; a list is sampled as choices (use a
+    list for ``target_atr``, whose values are tuples themselves). Draws
+    :class:`SignalParams` rejects are redrawn.
+    """
+    rng = random.Random(seed)
+
+    def draw(spec: Any) -> Any:
+        if isinstance(spec, list):
+            return rng.choice(spec)
+        low, high = spec
+        return rng.uniform(low, high)
+
+    samples: List[SignalParams] = []
+    for _ in range(count * _MAX_DRAWS_PER_SAMPLE):
+        if len(samples) == count:
+            return samples
+        params = _params(**{name: draw(spec) for name, spec in ranges.items()})
+        if params is not None:
+            samples.append(params)
+    if len(samples) < count:
+        raise ValueError("ranges yield too few valid SignalParams")
+    return samples
+
+
+# Attempts per requested sample before random_parameters gives up on the ranges.
+_MAX_DRAWS_PER_SAMPLE = 100
+
+
+def _params(**values: Any) -> Optional[SignalParams]:
+    """``DEFAULT_PARAMS`` with ``values`` replaced, or ``None`` if that is not valid."""
+    try:
+        return replace(DEFAULT_PARAMS, **values)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class Split:
+    """One walk-forward split; bounds are epoch milliseconds, end-exclusive."""
+
+    train_start: int
+    train_end: int
+    test_end: int
+
+    @property
+    def test_start(self) -> int:
+        return self.train_end
+
+
+def walk_forward_splits(
+    start_ms: int, end_ms: int, folds: int = 4, train_windows: int = 2, anchored: bool = False
+) -> List[Split]:
+    """Split ``[start_ms, end_ms)`` into ``folds`` consecutive test windows.
+
+    Each test window is preceded by ``train_windows`` windows of training data, or by
+    all earlier data when ``anchored``.
+    """
+    if folds < 1 or train_windows < 1:
+        raise ValueError("folds and train_windows must be positive")
+    start_ms, end_ms = int(start_ms), int(end_ms)
+    window = (end_ms - start_ms) // (folds + train_windows)
+    splits = []
+    for fold in range(folds):
+        train_end = start_ms + (fold + train_windows) * window
+        train_start = start_ms if anchored else train_end - train_windows * window
+        splits.append(Split(train_start, train_end, end_ms if fold == folds - 1 else train_end + window))
+    return splits
+
+
+@dataclass
+class SweepResult:
+    """Backtest of one parameter set: the whole history plus each split in and out of sample."""
+
+    params: SignalParams
+    key: str
+    full: BacktestReport
+    folds: List[Tuple[BacktestReport, BacktestReport]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "params": asdict(self.params),
+            "key": self.key,
+            "full": self.full.as_dict(),
+            "folds": [[train.as_dict(), test.as_dict()] for train, test in self.folds],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "SweepResult":
+        return cls(
+            params=_params_from_dict(data["params"]),
+            key=data["key"],
+            full=_report_from_dict(data["full"]),
+            folds=[(_report_from_dict(train), _report_from_dict(test)) for train, test in data["folds"]],
+        )
+
+
+@dataclass
+class WalkForwardFold:
+    split: Split
+    params: SignalParams
+    in_sample: BacktestReport
+    out_of_sample: BacktestReport
+
+
+class SharedCandles:
+    """Candle histories packed into one shared-memory block for worker processes.
+
+    :attr:`layout` is the small picklable description workers use to map the block
+    (see :func:`attach_candles`). Use as a context manager, or call :meth:`close`, to
+    release the block.
+    """
+
+    def __init__(self, candles: Mapping[str, CandleArrays]) -> None:
+        symbols = list(candles)
+        lengths = [len(candles[symbol]) for symbol in symbols]
+        total = sum(lengths)
+        self._memory = shared_memory.SharedMemory(create=True, size=max(len(_COLUMNS) * total * 8, 1))
+        offsets = np.concatenate(([0], np.cumsum(lengths))).tolist()
+        self.layout = (self._memory.name, tuple(symbols), tuple(offsets))
+        for name, block in zip(_COLUMNS, _column_blocks(self._memory, total)):
+            for symbol, start, stop in zip(symbols, offsets, offsets[1:]):
+                block[start:stop] = candles[symbol][name]
+
+    def fingerprint(self) -> str:
+        """Digest of the packed data, part of every cache key."""
+        digest = hashlib.blake2b(repr(self.layout[1:]).encode(), digest_size=16)
+        digest.update(self._memory.buf)
+        return digest.hexdigest()
+
+    def close(self) -> None:
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self) -> "SharedCandles":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def attach_candles(layout: Tuple[str, Tuple[str, ...], Tuple[int, ...]]) -> Tuple[Any, Dict[str, CandleArrays]]:
+    """Map a :class:`SharedCandles` block; keep the returned handle alive while using the views."""
+    name, symbols, offsets = layout
+    memory = shared_memory.SharedMemory(name=name)
+    blocks = _column_blocks(memory, offsets[-1])
+    candles = {
+        symbol: CandleArrays(*(block[start:stop] for block in blocks))
+        for symbol, start, stop in zip(symbols, offsets, offsets[1:])
+    }
+    return memory, candles
+
+
+def _column_blocks(memory: shared_memory.SharedMemory, total: int) -> List[np.ndarray]:
+    return [
+        np.ndarray((total,), np.int64 if name == "time" else np.float64, memory.buf, offset=index * total * 8)
+        for index, name in enumerate(_COLUMNS)
+    ]
+
+
+def params_key(params: SignalParams, *context: Any) -> str:
+    """Stable hash of ``params`` and the settings it was evaluated with."""
+    payload = json.dumps([asdict(params), *context], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class _Evaluator:
+    """Prepared histories plus the bar ranges of every split, built once per process."""
+
+    def __init__(
+        self,
+        candles: Mapping[str, CandleArrays],
+        horizon: int,
+        min_confidence: float,
+        splits: Sequence[Split],
+    ) -> None:
+        self.min_confidence = min_confidence
+        self.histories = {symbol: PreparedHistory(frame, horizon) for symbol, frame in candles.items()}
+        self.bounds = {
+            symbol: [_split_bounds(frame.time, split, horizon) for split in splits] for symbol, frame in candles.items()
+        }
+
+    def __call__(self, params: SignalParams) -> Dict[str, Any]:
+        trades = {symbol: history.simulate(self.min_confidence, params) for symbol, history in self.histories.items()}
+        folds = []
+        for index in range(len(next(iter(self.bounds.values()), []))):
+            train, test = [], []
+            for symbol, symbol_trades in trades.items():
+                train_lo, train_hi, test_lo, test_hi = self.bounds[symbol][index]
+                bars = symbol_trades.bars
+                train.append(symbol_trades.select((bars >= train_lo) & (bars < train_hi)))
+                test.append(symbol_trades.select((bars >= test_lo) & (bars < test_hi)))
+            folds.append([_pooled(train).as_dict(), _pooled(test).as_dict()])
+        return {"params": asdict(params), "full": _pooled(trades.values()).as_dict(), "folds": folds}
+
+
+def _split_bounds(time: np.ndarray, split: Split, horizon: int) -> Tuple[int, int, int, int]:
+    """Bar bounds ``(train_lo, train_hi, test_lo, test_hi)`` of ``split`` in one history.
+
+    Training signals must resolve before the test window opens, so the last ``horizon``
+    bars before it are left out.
+    """
+    train_lo, test_lo, test_hi = np.searchsorted(time, [split.train_start, split.test_start, split.test_end]).tolist()
+    return train_lo, test_lo - horizon, test_lo, test_hi
+
+
+def _pooled(parts: Any) -> BacktestReport:
+    return summarize(Trades.concat(parts), symbol="*")
+
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(layout: Tuple[str, Tuple[str, ...], Tuple[int, ...]], *settings: Any) -> None:
+    memory, candles = attach_candles(layout)
+    _WORKER["memory"] = memory
+    _WORKER["evaluate"] = _Evaluator(candles, *settings)
+
+
+def _evaluate(params: SignalParams) -> Dict[str, Any]:
+    return _WORKER["evaluate"](params)
+
+
+def sweep(
+    candles: Mapping[str, CandleArrays],
+    param_sets: Sequence[SignalParams],
+    horizon: int = DEFAULT_HORIZON,
+    min_confidence: float = 0.0,
+    splits: Sequence[Split] = (),
+    cache_dir: Optional[os.PathLike | str] = None,
+    workers: Optional[int] = None,
+) -> List[SweepResult]:
+    """Backtest every parameter set over ``candles``, in ``param_sets`` order.
+
+    Reports pool all symbols' trades. ``workers=1`` evaluates in this process; by
+    default one worker per CPU is used.
+    """
+    cache = Path(cache_dir) if cache_dir is not None else None
+    if cache is not None:
+        cache.mkdir(parents=True, exist_ok=True)
+    settings = (horizon, min_confidence, tuple(splits))
+    results: Dict[str, SweepResult] = {}
+    with SharedCandles(candles) as shared:
+        fingerprint = shared.fingerprint()
+        context = (horizon, min_confidence, [asdict(split) for split in splits], fingerprint)
+        keys = [params_key(params, *context) for params in param_sets]
+        pending: Dict[str, SignalParams] = {}
+        for key, params in zip(keys, param_sets):
+            cached = _load(cache, key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending.setdefault(key, params)
+
+        def finish(key: str, data: Dict[str, Any]) -> None:
+            results[key] = SweepResult.from_dict({**data, "key": key})
+            _store(cache, results[key])
+
+        if pending and (workers == 1 or len(pending) == 1):
+            _init_worker(shared.layout, *settings)
+            try:
+                for key, params in pending.items():
+                    finish(key, _evaluate(params))
+            finally:
+                _WORKER.pop("evaluate", None)
+                _WORKER.pop("memory").close()
+        elif pending:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(shared.layout, *settings)) as pool:
+                futures = {pool.submit(_evaluate, params): key for key, params in pending.items()}
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
+    return [results[key] for key in keys]
+
+
+def walk_forward(
+    results: Sequence[SweepResult], splits: Sequence[Split], objective: str = "expectancy"
+) -> List[WalkForwardFold]:
+    """Per split, the parameters with the best in-sample ``objective`` and their out-of-sample report.
+
+    ``results`` must come from a :func:`sweep` over the same ``splits``. ``objective``
+    is any numeric :class:`~hyperliquid.backtest.BacktestReport` field;
+    ``max_drawdown`` is minimised, everything else maximised.
+    """
+    if not results:
+        return []
+    sign = -1.0 if objective == "max_drawdown" else 1.0
+    folds = []
+    for index, split in enumerate(splits):
+        best = max(results, key=lambda result: sign * getattr(result.folds[index][0], objective))
+        in_sample, out_of_sample = best.folds[index]
+        folds.append(WalkForwardFold(split, best.params, in_sample, out_of_sample))
+    return folds
+
+
+def _load(cache: Optional[Path], key: str) -> Optional[SweepResult]:
+    if cache is None:
+        return None
+    try:
+        return SweepResult.from_dict(json.loads((cache / f"{key}.json").read_text()))
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+
+
+def _store(cache: Optional[Path], result: SweepResult) -> None:
+    if cache is None:
+        return
+    path = cache / f"{result.key}.json"
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(result.to_dict()))
+    os.replace(temporary, path)
+
+
+def _params_from_dict(data: Mapping[str, Any]) -> SignalParams:
+    values = {field.name: data[field.name] for field in fields(SignalParams) if field.name in data}
+    if "target_atr" in values:
+        values["target_atr"] = tuple(values["target_atr"])
+    return SignalParams(**values)
+
+
+def _report_from_dict(data: Mapping[str, Any]) -> BacktestReport:
+    return BacktestReport(**{**data, "target_hit_rates": tuple(data["target_hit_rates"])})
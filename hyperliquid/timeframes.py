@@ -0,0 +1,111 @@
+"""Candle interval model shared by the data clients, resampling and signal logic."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_MINUTE_MS = 60_000
+_DAY_MS = 86_400_000
+# The epoch fell on a Thursday; weekly bars open on Monday 00:00 UTC.
+_WEEK_OFFSET_MS = 4 * _DAY_MS
+
+# Minimum period ratio between a timeframe and the one used for its trend context.
+HIGHER_TIMEFRAME_RATIO = 4
+
+
+@dataclass(frozen=True)
+class Timeframe:
+    """One Hyperliquid candle interval.
+
+    Bars open at every ``offset_ms + k * period_ms`` milliseconds since the epoch, which
+    is what makes one timeframe derivable from another: every bar of the coarser one
+    must start on a bar boundary of the finer one.
+    """
+
+    name: str
+    minutes: int
+    offset_ms: int = 0
+
+    @property
+    def period_ms(self) -> int:
+        return self.minutes * _MINUTE_MS
+
+    def floor(self, ts: int) -> int:
+        """Open time of the bar containing ``ts``."""
+        return ts - (ts - self.offset_ms) % self.period_ms
+
+    def close_time(self, ts: int) -> int:
+        """Time the bar containing ``ts`` closes (the next bar's open time)."""
+        return self.floor(ts) + self.period_ms
+
+    def ceil(self, ts: int) -> int:
+        """Open time of the first bar opening at or after ``ts``."""
+        floor = self.floor(ts)
+        return floor if floor == ts else floor + self.period_ms
+
+    def derivable_from(self, finer: "Timeframe") -> bool:
+        """True when bars of this timeframe are exact aggregates of ``finer`` bars."""
+        return self.period_ms % finer.period_ms == 0 and (self.offset_ms - finer.offset_ms) % finer.period_ms == 0
+
+
+# Every interval ``candleSnapshot`` accepts below one month, finest first.
+TIMEFRAMES: Dict[str, Timeframe] = {
+    tf.name: tf
+    for tf in (
+        Timeframe("1m", 1),
+        Timeframe("3m", 3),
+        Timeframe("5m", 5),
+        Timeframe("15m", 15),
+        Timeframe("30m", 30),
+        Timeframe("1h", 60),
+        Timeframe("2h", 120),
+        Timeframe("4h", 240),
+        Timeframe("8h", 480),
+        Timeframe("12h", 720),
+        Timeframe("1d", 1440),
+        Timeframe("3d", 4320),
+        Timeframe("1w", 10080, offset_ms=_WEEK_OFFSET_MS),
+    )
+}
+
+
+def get_timeframe(name: str) -> Timeframe:
+    try:
+        return TIMEFRAMES[name]
+    except KeyError:
+        supported = ", ".join(TIMEFRAMES)
+        raise ValueError(f"Unsupported timeframe '{name}'. Supported: {supported}") from None
+
+
+def higher_timeframe(name: str, ratio: int = HIGHER_TIMEFRAME_RATIO) -> Optional[str]:
+    """Return the trend-context timeframe for ``name``.
+
+    That is the finest timeframe at least ``ratio`` times coarser that can be derived
+    from ``name`` (15m -> 1h -> 4h -> 1d -> 1w), or ``None`` at the top of the ladder.
+    """
+    base = get_timeframe(name)
+    for candidate in TIMEFRAMES.values():
+        if candidate.period_ms >= ratio * base.period_ms and candidate.derivable_from(base):
+            return candidate.name
+    return None
+
+
+def derivation_bases(name: str, bases: Iterable[str]) -> List[Timeframe]:
+    """Return the timeframes in ``bases`` that ``name`` can be derived from, finest first."""
+    target = get_timeframe(name)
+    candidates = [get_timeframe(base) for base in bases]
+    return sorted((base for base in candidates if target.derivable_from(base)), key=lambda tf: tf.period_ms)
+
+
+def normalize_bases(bases: Optional[str | Iterable[str]]) -> Tuple[str, ...]:
+    """Validate resample base timeframes given as one name, a comma list or an iterable."""
+    if bases is None:
+        return ()
+    if isinstance(bases, str):
+        bases = [part.strip() for part in bases.split(",") if part.strip()]
+    names = tuple(dict.fromkeys(bases))
+    for name in names:
+        if name not in TIMEFRAMES:
+            raise ValueError(f"Unsupported resample base timeframe '{name}'")
+    return tuple(sorted(names, key=lambda name: TIMEFRAMES[name].period_ms))
@@ -3,31 +3,173 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
-from functools import lru_cache
-from typing import Dict, List, Optional
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
 
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from hyperliquid import SignalGenerator, build_default_client
+from hyperliquid import AsyncSignalGenerator, build_async_client
+from hyperliquid.cache import SignalCache
+from hyperliquid.cassette import Cassette, ReplayTransport
+from hyperliquid.hedge import HedgePolicy
 from hyperliquid.data import TIMEFRAME_TO_MINUTES
+from hyperliquid.info import Info
+from hyperliquid.live import LiveCandleFeed, start_live_async
+from hyperliquid.ratelimit import AsyncRateLimiter
+from hyperliquid.signals import dumps
+from hyperliquid.timeframes import get_timeframe
+from hyperliquid.utils import constants
 
 DEFAULT_TIMEFRAMES: List[str] = ["1d", "4h", "1h", "15m"]
 DEFAULT_SYMBOLS: List[str] = ["BTC"]
 
-# Thread pool for parallel signal generation
-executor = ThreadPoolExecutor(max_workers=4)
-
-# Simple in-memory cache with TTL
-signal_cache: Dict[str, tuple[dict, datetime]] = {}
-CACHE_TTL_MINUTES = 5
+# Signals expire when their bar closes; this optionally also refreshes them within a bar
+CACHE_INTRABAR_REFRESH_SECONDS = float(os.environ.get("CACHE_INTRABAR_REFRESH_SECONDS", "0"))
+# Most signals kept in memory; the least recently used are evicted beyond this
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "2048"))
+# Seconds between background sweeps of expired signals
+CACHE_SWEEP_SECONDS = float(os.environ.get("CACHE_SWEEP_SECONDS", "30"))
+# Seconds after expiry a signal is still served (marked stale) while it is regenerated
+CACHE_STALE_GRACE_SECONDS = float(os.environ.get("CACHE_STALE_GRACE_SECONDS", "60"))
+# Seconds after expiry a signal is still served (marked stale) when regenerating it fails
+CACHE_STALE_IF_ERROR_SECONDS = float(os.environ.get("CACHE_STALE_IF_ERROR_SECONDS", "900"))
+
+# Bounded LRU + TTL cache of signals as encoded JSON, with one computation per key in flight
+signal_cache: SignalCache[bytes] = SignalCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    stale_while_revalidate=CACHE_STALE_GRACE_SECONDS,
+    stale_if_error=CACHE_STALE_IF_ERROR_SECONDS,
+)
 
-app = FastAPI(title="Chumba Finance Signal API", version="0.1.0")
+# Optional directory for the persistent candle store (disabled when unset)
+CANDLE_STORE_DIR: Optional[str] = os.environ.get("CANDLE_STORE_DIR")
+# Optional base timeframes that coarser timeframes are resampled from (e.g. "1m,15m")
+RESAMPLE_FROM: Optional[str] = os.environ.get("RESAMPLE_FROM") or None
+# Optional comma separated symbols streamed over WebSocket for all default timeframes
+LIVE_SYMBOLS: List[str] = [
+    symbol.strip().upper() for symbol in os.environ.get("LIVE_SYMBOLS", "").split(",") if symbol.strip()
+]
+
+# Optional cassette of recorded upstream responses served instead of the live API
+REPLAY_CASSETTE: Optional[str] = os.environ.get("REPLAY_CASSETTE") or None
+# Latency injected into every replayed upstream request, in milliseconds
+REPLAY_LATENCY_MS = float(os.environ.get("REPLAY_LATENCY_MS", "0"))
+# Hedge slow candle requests with a second request after the observed p95 latency
+HEDGE_REQUESTS = os.environ.get("HEDGE_REQUESTS", "").lower() in {"1", "true", "yes"}
+
+# Comma separated upstream URLs whose clients are kept for the life of the process (mainnet always is)
+POOLED_UPSTREAMS = {
+    url.strip().rstrip("/") for url in os.environ.get("POOLED_UPSTREAMS", "").split(",") if url.strip()
+} | {constants.MAINNET_API_URL.rstrip("/")}
+
+# Generators of POOLED_UPSTREAMS, built on first use and kept for the life of the process
+_generators: Dict[str, AsyncSignalGenerator] = {}
+# Client-side rate limiters by host of POOLED_UPSTREAMS, shared by the generators calling it
+_rate_limiters: Dict[str, AsyncRateLimiter] = {}
+
+
+def get_generator(api_url: Optional[str] = None) -> AsyncSignalGenerator:
+    """Return the generator of a pooled upstream (mainnet by default), building it on first use.
+
+    A pooled upstream keeps one generator, so its connection pool, rate limiter, hedge
+    latency estimate and counters persist across requests. Only ``POOLED_UPSTREAMS`` are
+    pooled, which bounds the clients kept whatever ``api_url`` callers send.
+    """
+    key = _upstream_key(api_url)
+    if key not in POOLED_UPSTREAMS:
+        raise ValueError(f"Upstream {key} is not pooled; set POOLED_UPSTREAMS to keep a client for it")
+    generator = _generators.get(key)
+    if generator is None:
+        generator = _generators[key] = _build_generator(api_url)
+    return generator
+
+
+def _upstream_key(api_url: Optional[str]) -> str:
+    return (api_url or constants.MAINNET_API_URL).rstrip("/")
+
+
+def _is_pooled(api_url: Optional[str]) -> bool:
+    return _upstream_key(api_url) in POOLED_UPSTREAMS
+
+
+@asynccontextmanager
+async def _generator_for(api_url: Optional[str]) -> AsyncIterator[AsyncSignalGenerator]:
+    """The pooled generator for ``api_url``, or a short-lived one closed after the request."""
+    if _is_pooled(api_url):
+        yield get_generator(api_url)
+        return
+    generator = _build_generator(api_url)
+    try:
+        yield generator
+    finally:
+        await generator.client.aclose()
+
+
+def _rate_limiter(api_url: Optional[str]) -> AsyncRateLimiter:
+    """The limiter for a pooled ``api_url``'s host, so its budget holds whichever URL reaches it."""
+    host = urlsplit(_upstream_key(api_url)).netloc
+    limiter = _rate_limiters.get(host)
+    if limiter is None:
+        limiter = _rate_limiters[host] = AsyncRateLimiter()
+    return limiter
+
+
+def _build_generator(api_url: Optional[str], live: Optional[LiveCandleFeed] = None) -> AsyncSignalGenerator:
+    """Build a generator for ``api_url``; short-lived ones get a rate limiter of their own."""
+    transport = None
+    if REPLAY_CASSETTE:
+        transport = ReplayTransport(Cassette.load(REPLAY_CASSETTE), latency=REPLAY_LATENCY_MS / 1000)
+    client = build_async_client(
+        base_url=api_url,
+        store_dir=CANDLE_STORE_DIR,
+        resample_from=RESAMPLE_FROM,
+        live=live,
+        transport=transport,
+        hedge=HedgePolicy() if HEDGE_REQUESTS else None,
+        rate_limiter=_rate_limiter(api_url) if _is_pooled(api_url) else None,
+    )
+    return AsyncSignalGenerator(client)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the cache sweeper and the ``LIVE_SYMBOLS`` streams; release everything on shutdown.
+
+    The live feed is attached to the default generator once, here, so every request
+    without ``api_url`` reads the same subscribed and seeded buffers. Shutdown also
+    closes the connection pool of every generator built.
+    """
+    signal_cache.start_sweeper(CACHE_SWEEP_SECONDS)
+    info: Optional[Info] = None
+    live: Optional[LiveCandleFeed] = None
+    try:
+        if LIVE_SYMBOLS and not REPLAY_CASSETTE:
+            # Info fetches exchange metadata synchronously when it is built
+            info = await asyncio.to_thread(Info, constants.MAINNET_API_URL, skip_ws=False)
+            live = LiveCandleFeed(info)
+            generator = _generators[_upstream_key(None)] = _build_generator(None, live=live)
+            streams = [(symbol, timeframe) for symbol in LIVE_SYMBOLS for timeframe in DEFAULT_TIMEFRAMES]
+            await start_live_async(generator.client, live, streams)
+        yield
+    finally:
+        await signal_cache.stop_sweeper()
+        await asyncio.gather(*(generator.client.aclose() for generator in _generators.values()))
+        _generators.clear()
+        _rate_limiters.clear()
+        if live is not None:
+            live.close()
+        if info is not None:
+            info.disconnect_websocket()
+
+
+app = FastAPI(title="Chumba Finance Signal API", version="0.1.0", lifespan=lifespan)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
@@ -40,12 +182,6 @@ app.add_middleware(
 )
 
 
-@lru_cache(maxsize=1)
-def get_generator(api_url: Optional[str] = None) -> SignalGenerator:
-    client = build_default_client(base_url=api_url)
-    return SignalGenerator(client)
-
-
 @app.get("/health")
 def healthcheck() -> dict:
     return {"status": "ok"}
@@ -71,83 +207,83 @@ def _validate_timeframes(timeframes: List[str]) -> None:
         raise HTTPException(status_code=400, detail=f"Unsupported timeframes: {', '.join(invalid)}")
 
 
-def _generate_single_signal(
-    generator: SignalGenerator,
+async def _generate_single_signal(
+    generator: AsyncSignalGenerator,
     symbol: str,
     timeframe: str,
-) -> Dict[str, object]:
-    """Generate a single signal (used for parallel execution)."""
-    return generator.generate(symbol.upper(), timeframe).to_dict()
+) -> bytes:
+    """Generate a single signal as encoded JSON (used for parallel execution)."""
+    return (await generator.generate(symbol.upper(), timeframe)).to_json()
 
 
-def _get_cache_key(symbol: str, timeframe: str) -> str:
-    """Generate cache key for a signal."""
-    return f"{symbol.upper()}:{timeframe}"
-
+def _signal_ttl(timeframe: str) -> Callable[[], float]:
+    """TTL for a signal requested now: until its bar closes, or the intrabar refresh if sooner.
 
-def _get_cached_signal(symbol: str, timeframe: str) -> Optional[Dict[str, object]]:
-    """Get signal from cache if not expired."""
-    cache_key = _get_cache_key(symbol, timeframe)
-    if cache_key in signal_cache:
-        signal, cached_at = signal_cache[cache_key]
-        if datetime.now() - cached_at < timedelta(minutes=CACHE_TTL_MINUTES):
-            return signal
-        else:
-            # Remove expired entry
-            del signal_cache[cache_key]
-    return None
+    The deadline is fixed at request time, so a signal computed across a bar close is
+    not kept for the whole of the next bar.
+    """
+    now_ms = int(time.time() * 1000)
+    expires_ms = get_timeframe(timeframe).close_time(now_ms)
+    if CACHE_INTRABAR_REFRESH_SECONDS > 0:
+        expires_ms = min(expires_ms, now_ms + int(CACHE_INTRABAR_REFRESH_SECONDS * 1000))
+    return lambda: expires_ms / 1000 - time.time()
 
 
-def _cache_signal(symbol: str, timeframe: str, signal: Dict[str, object]) -> None:
-    """Store signal in cache."""
-    cache_key = _get_cache_key(symbol, timeframe)
-    signal_cache[cache_key] = (signal, datetime.now())
+def _get_cache_key(symbol: str, timeframe: str) -> str:
+    """Generate cache key for a signal."""
+    return f"{symbol.upper()}:{timeframe}"
 
 
 async def _generate_for_symbol_parallel(
-    generator: SignalGenerator,
+    generator: AsyncSignalGenerator,
     symbol: str,
     timeframes: List[str],
-) -> List[Dict[str, object]]:
-    """Generate signals for all timeframes in parallel with caching."""
-    results = []
-    tasks_to_run = []
-    
-    # Check cache first
-    for timeframe in timeframes:
-        cached = _get_cached_signal(symbol, timeframe)
-        if cached:
-            results.append((timeframe, cached))
-        else:
-            tasks_to_run.append(timeframe)
-    
-    # Generate missing signals in parallel
-    if tasks_to_run:
-        loop = asyncio.get_event_loop()
-        futures = [
-            loop.run_in_executor(
-                executor,
-                _generate_single_signal,
-                generator,
-                symbol,
-                tf
+    background: bool = True,
+) -> List[bytes]:
+    """Generate signals for all timeframes in parallel with caching.
+
+    Cached signals are returned as is; misses are generated concurrently on the event
+    loop, and a request arriving while the same signal is being generated awaits that
+    computation instead of starting another. A signal that expired within the stale
+    grace window, or whose regeneration failed, is served marked stale. Without
+    ``background`` (a short-lived generator) stale signals are only served on failure,
+    so no refresh outlives the request.
+    """
+    try:
+        lookups = await asyncio.gather(
+            *(
+                signal_cache.get_or_revalidate(
+                    _get_cache_key(symbol, timeframe),
+                    lambda timeframe=timeframe: _generate_single_signal(generator, symbol, timeframe),
+                    _signal_ttl(timeframe),
+                    background,
+                )
+                for timeframe in timeframes
             )
-            for tf in tasks_to_run
-        ]
-        
-        try:
-            generated = await asyncio.gather(*futures)
-            for tf, signal in zip(tasks_to_run, generated):
-                _cache_signal(symbol, tf, signal)
-                results.append((tf, signal))
-        except Exception as exc:
-            raise HTTPException(status_code=500, detail=str(exc)) from exc
-    
-    # Sort by original timeframe order
-    timeframe_order = {tf: i for i, tf in enumerate(timeframes)}
-    results.sort(key=lambda x: timeframe_order[x[0]])
-    
-    return [signal for _, signal in results]
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return [_mark_stale(lookup.value, lookup.age) if lookup.stale else lookup.value for lookup in lookups]
+
+
+def _mark_stale(signal: bytes, age: float) -> bytes:
+    """Add ``"stale": true`` and the signal's age in seconds to an encoded signal object."""
+    return signal[:-1] + b',"stale":true,"ageSeconds":' + dumps(round(age, 1)) + b"}"
+
+
+def _json_array(items: List[bytes]) -> bytes:
+    """Join already encoded JSON values into a JSON array without re-encoding them."""
+    return b"[" + b",".join(items) + b"]"
+
+
+def _json_object(members: Dict[str, bytes]) -> bytes:
+    """Build a JSON object from already encoded member values."""
+    return b"{" + b",".join(dumps(name) + b":" + value for name, value in members.items()) + b"}"
+
+
+def _json_response(members: Dict[str, bytes]) -> Response:
+    """Serve cached signal JSON as is; a cache hit only copies bytes."""
+    return Response(content=_json_object(members), media_type="application/json")
 
 
 @app.get("/signals")
@@ -155,31 +291,27 @@ async def get_signals_multi(
     symbols: List[str] = Query(DEFAULT_SYMBOLS, description="Symbols to evaluate"),
     timeframes: List[str] = Query(DEFAULT_TIMEFRAMES, description="Timeframes to evaluate"),
     api_url: Optional[str] = None,
-) -> dict:
+) -> Response:
     if not symbols:
         raise HTTPException(status_code=400, detail="At least one symbol must be provided")
 
     _validate_timeframes(timeframes)
 
-    generator = get_generator(api_url=api_url)
-    
-    # Generate all symbols in parallel
-    symbol_tasks = [
-        _generate_for_symbol_parallel(generator, symbol, timeframes)
-        for symbol in symbols
-    ]
-    
-    all_results = await asyncio.gather(*symbol_tasks)
+    async with _generator_for(api_url) as generator:
+        # Generate all symbols in parallel
+        symbol_tasks = [
+            _generate_for_symbol_parallel(generator, symbol, timeframes, _is_pooled(api_url))
+            for symbol in symbols
+        ]
+
+        all_results = await asyncio.gather(*symbol_tasks)
     
     payload = {
-        symbol.upper(): results
+        symbol.upper(): _json_array(results)
         for symbol, results in zip(symbols, all_results)
     }
     
-    return {
-        "symbols": payload,
-        "timeframes": timeframes,
-    }
+    return _json_response({"symbols": _json_object(payload), "timeframes": dumps(timeframes)})
 
 
 @app.get("/signals/{symbol}")
@@ -187,29 +319,36 @@ async def get_signals(
     symbol: str,
     timeframes: List[str] = Query(DEFAULT_TIMEFRAMES, description="Timeframes to evaluate"),
     api_url: Optional[str] = None,
-) -> dict:
+) -> Response:
     _validate_timeframes(timeframes)
-    generator = get_generator(api_url=api_url)
-    results = await _generate_for_symbol_parallel(generator, symbol, timeframes)
-    return {
-        "symbol": symbol.upper(),
-        "timeframes": timeframes,
-        "signals": results,
-    }
+    async with _generator_for(api_url) as generator:
+        results = await _generate_for_symbol_parallel(generator, symbol, timeframes, _is_pooled(api_url))
+    return _json_response(
+        {"symbol": dumps(symbol.upper()), "timeframes": dumps(timeframes), "signals": _json_array(results)}
+    )
 
 
 @app.get("/cache/stats")
-def cache_stats() -> dict:
-    """Get cache statistics."""
-    now = datetime.now()
-    valid_entries = sum(
-        1 for _, (_, cached_at) in signal_cache.items()
-        if now - cached_at < timedelta(minutes=CACHE_TTL_MINUTES)
-    )
+def cache_stats(api_url: Optional[str] = None) -> dict:
+    """Get cache statistics, with the fetch counters of the pooled client serving ``api_url``.
+
+    Client counters are ``None`` until that client has been built; stats never build one.
+    """
+    generator = _generators.get(_upstream_key(api_url))
+    client = generator.client if generator is not None else None
+    hedge_stats = client.hedge_stats() if client is not None else None
+    stats = signal_cache.stats()
     return {
-        "total_entries": len(signal_cache),
-        "valid_entries": valid_entries,
-        "ttl_minutes": CACHE_TTL_MINUTES,
+        "total_entries": stats.entries,
+        "valid_entries": signal_cache.live_entries(),
+        "expiry": "bar_close",
+        "intrabar_refresh_seconds": CACHE_INTRABAR_REFRESH_SECONDS or None,
+        "stale_grace_seconds": CACHE_STALE_GRACE_SECONDS,
+        "stale_if_error_seconds": CACHE_STALE_IF_ERROR_SECONDS,
+        "signal_cache": stats.as_dict(),
+        "fetch_coalescing": client.flight_stats().as_dict() if client is not None else None,
+        "rate_limit": client.rate_limiter.snapshot().as_dict() if client and client.rate_limiter else None,
+        "hedging": hedge_stats.as_dict() if hedge_stats is not None else None,
     }
 
 